@@ -0,0 +1,26 @@
+"""
+Add a (started_at DESC, id DESC) index to api_sync.
+
+Backs the cursor pagination of GET /api/teams/operations/, which orders by
+-started_at with -id as tie-breaker.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Composite index for operations cursor pagination."""
+    
+    dependencies = [
+        ('api_integrations', '0001_initial'),
+    ]
+    
+    operations = [
+        migrations.AddIndex(
+            model_name='apisync',
+            index=models.Index(
+                fields=['-started_at', '-id'],
+                name='api_sync_started_id_idx'
+            ),
+        ),
+    ]
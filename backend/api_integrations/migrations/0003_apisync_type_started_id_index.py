@@ -0,0 +1,32 @@
+"""
+Lead the operations history index of api_sync with resource_type.
+
+GET /api/teams/operations/ filters on resource_type = 'teams' and pages by
+(started_at DESC, id DESC); with resource_type first, the filter, the
+started_at range and the cursor order are served by one index range scan.
+Replaces api_sync_started_id_idx.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Replace the operations cursor index with a per-resource-type one."""
+    
+    dependencies = [
+        ('api_integrations', '0002_apisync_started_id_index'),
+    ]
+    
+    operations = [
+        migrations.RemoveIndex(
+            model_name='apisync',
+            name='api_sync_started_id_idx',
+        ),
+        migrations.AddIndex(
+            model_name='apisync',
+            index=models.Index(
+                fields=['resource_type', '-started_at', '-id'],
+                name='api_sync_type_started_id_idx'
+            ),
+        ),
+    ]
@@ -102,6 +102,12 @@ class APISync(models.Model):
             models.Index(fields=['provider', 'resource_type']),
             models.Index(fields=['status']),
             models.Index(fields=['-started_at']),
+            # Operations history of one resource type, in cursor order
+            # (ties broken by id)
+            models.Index(
+                fields=['resource_type', '-started_at', '-id'],
+                name='api_sync_type_started_id_idx'
+            ),
         ]
         verbose_name = 'API Sync'
         verbose_name_plural = 'API Syncs'
@@ -22,16 +22,19 @@ Date: October 2025
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.db.models import QuerySet, Q
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
 from django.conf import settings
+from django.utils import timezone
 
-from apps.core.models import Team, Country
+from apps.core.cache import invalidate_stats_cache
+from apps.core.models import League, Standing, Team, Country
 from api_integrations.providers.football_data_org.client import FootballDataClient
 from api_integrations.providers.api_football.client import APIFootballClient
 from api_integrations.transformers.team_transformer import TeamTransformer
@@ -39,6 +42,24 @@ from api_integrations.transformers.validators import TeamValidator
 
 logger = logging.getLogger(__name__)
 
+# Concurrent provider requests in fetch_teams_for_competitions(); stays
+# within Football-Data.org's free tier of 10 requests per minute
+FETCH_MAX_WORKERS = 5
+
+# Rows per INSERT/UPDATE statement in bulk_upsert_teams()
+UPSERT_BATCH_SIZE = 500
+
+# Columns of a stored team that an upsert never overwrites
+UPSERT_PRESERVED_FIELDS = ('id', 'created_at')
+
+# Unique team columns (see database/sql/migrations/006); rows that would
+# reuse another team's value are rejected before the bulk statements
+UPSERT_UNIQUE_FIELDS = ('name', 'code', 'external_id')
+
+# Bookkeeping columns that do not count as a change; updated_at is
+# stamped by the upsert itself when another column changed
+UPSERT_UNCOMPARED_FIELDS = UPSERT_PRESERVED_FIELDS + ('updated_at',)
+
 
 class TeamsService:
     """
@@ -230,38 +251,168 @@ class TeamsService:
     def bulk_upsert_teams(
         self,
         teams_data: List[Dict[str, Any]],
-        match_field: str = 'external_id'
+        match_field: str = 'external_id',
+        fields: Optional[List[str]] = None,
+        force: bool = True,
     ) -> Tuple[List[Team], List[Team], List[str]]:
-        """Bulk create or update teams based on match_field."""
+        """
+        Bulk create or update teams based on match_field.
+        
+        Existing teams are looked up in one query and written back with
+        bulk_update(); new teams are inserted with bulk_create(). Neither
+        calls save() or sends model signals, so the stats cache is
+        invalidated here.
+        
+        A row whose name or code is already used by another team (stored
+        or earlier in the batch) is reported in the errors and skipped. If
+        the bulk statements still violate a constraint, the teams are
+        saved one by one so only the offending rows fail.
+        
+        Args:
+            teams_data: Transformed team dictionaries
+            match_field: Column identifying an existing team
+            fields: Columns to update on existing teams (all provided ones when None)
+            force: Write matched teams even when none of their values changed
+        
+        Returns:
+            Tuple of (created teams, updated teams, error messages)
+        """
         created_teams = []
-        updated_teams = []
+        updated_teams = {}
         errors = []
+        update_fields = set()
+        
+        match_values = [data[match_field] for data in teams_data if data.get(match_field)]
+        existing_teams = {
+            getattr(team, match_field): team
+            for team in Team.objects.filter(**{f'{match_field}__in': match_values})
+        }
+        unique_fields = tuple(field for field in UPSERT_UNIQUE_FIELDS if field != match_field)
+        claimed = self._claimed_unique_values(teams_data, unique_fields)
+        
         for idx, data in enumerate(teams_data):
             try:
                 match_value = data.get(match_field)
                 if not match_value:
                     raise ValueError(f"Missing {match_field} field")
-                existing_team = Team.objects.filter(**{match_field: match_value}).first()
+                existing_team = existing_teams.get(match_value)
                 if existing_team:
-                    for field, value in data.items():
+                    # Never overwrite the identity or creation time of a stored team
+                    changes = {
+                        field: value for field, value in data.items()
+                        if field not in UPSERT_UNCOMPARED_FIELDS + (match_field,)
+                        and (fields is None or field in fields)
+                        and (force or self._value_changed(existing_team, field, value))
+                    }
+                    if not changes:
+                        continue
+                    self._claim_unique_values(claimed, str(existing_team.pk), {
+                        field: changes.get(field, getattr(existing_team, field))
+                        for field in unique_fields
+                    })
+                    for field, value in changes.items():
                         setattr(existing_team, field, value)
-                    existing_team.save()
-                    updated_teams.append(existing_team)
-                    logger.debug(f"Updated team: {existing_team.name}")
+                    existing_team.updated_at = timezone.now()
+                    # A team created earlier in this batch is simply inserted with these values
+                    if not existing_team._state.adding:
+                        update_fields.update(changes, ['updated_at'])
+                        updated_teams[existing_team.pk] = existing_team
                 else:
-                    team = self.create(data)
+                    is_valid, validation_errors = self.validator.validate(data)
+                    if not is_valid:
+                        raise ValidationError("; ".join(validation_errors))
+                    team = Team(**data)
+                    self._claim_unique_values(claimed, str(team.pk), {
+                        field: data.get(field) for field in unique_fields
+                    })
+                    # Later rows with the same match value update this one
+                    existing_teams[match_value] = team
                     created_teams.append(team)
-                    logger.debug(f"Created team: {team.name}")
             except Exception as e:
                 error_msg = f"Team #{idx + 1} ({data.get('name', 'Unknown')}): {str(e)}"
                 errors.append(error_msg)
                 logger.error(error_msg)
+        
+        updated_teams = list(updated_teams.values())
+        try:
+            with transaction.atomic():
+                if created_teams:
+                    Team.objects.bulk_create(created_teams, batch_size=UPSERT_BATCH_SIZE)
+                if updated_teams:
+                    Team.objects.bulk_update(
+                        updated_teams, sorted(update_fields), batch_size=UPSERT_BATCH_SIZE
+                    )
+        except IntegrityError as e:
+            logger.warning(f"Bulk upsert failed, saving teams one by one: {e}")
+            created_teams = self._save_each(created_teams, errors, force_insert=True)
+            updated_teams = self._save_each(
+                updated_teams, errors, update_fields=sorted(update_fields)
+            )
+        if created_teams or updated_teams:
+            invalidate_stats_cache()
+        
         logger.info(
             f"Bulk upsert: {len(created_teams)} created, "
             f"{len(updated_teams)} updated, {len(errors)} failed"
         )
         return created_teams, updated_teams, errors
     
+    @staticmethod
+    def _claimed_unique_values(
+        teams_data: List[Dict[str, Any]],
+        unique_fields: Tuple[str, ...]
+    ) -> Dict[Tuple[str, Any], str]:
+        """Map (field, value) to the pk of the stored team holding it, for the batch's values"""
+        lookups = Q()
+        for field in unique_fields:
+            values = {data[field] for data in teams_data if data.get(field) is not None}
+            if values:
+                lookups |= Q(**{f'{field}__in': values})
+        if not lookups:
+            return {}
+        
+        claimed = {}
+        for row in Team.objects.filter(lookups).values('pk', *unique_fields):
+            for field in unique_fields:
+                if row[field] is not None:
+                    claimed[(field, row[field])] = str(row['pk'])
+        return claimed
+    
+    @staticmethod
+    def _claim_unique_values(
+        claimed: Dict[Tuple[str, Any], str],
+        owner: str,
+        values: Dict[str, Any]
+    ) -> None:
+        """Reserve a team's unique values; ValueError if another team holds one"""
+        for field, value in values.items():
+            if value is not None and claimed.get((field, value), owner) != owner:
+                raise ValueError(f"{field} '{value}' is already used by another team")
+        for field, value in values.items():
+            if value is not None:
+                claimed[(field, value)] = owner
+    
+    @staticmethod
+    def _save_each(teams: List[Team], errors: List[str], **save_kwargs) -> List[Team]:
+        """Save teams one per savepoint; failures are added to errors"""
+        saved = []
+        for team in teams:
+            try:
+                with transaction.atomic():
+                    team.save(**save_kwargs)
+            except IntegrityError as e:
+                error_msg = f"Team ({team.name}): {str(e)}"
+                errors.append(error_msg)
+                logger.error(error_msg)
+            else:
+                saved.append(team)
+        return saved
+    
+    @staticmethod
+    def _value_changed(team: Team, field: str, value: Any) -> bool:
+        """Compare a transformed value with the stored one (e.g. str vs UUID country_id)"""
+        return getattr(team, field) != Team._meta.get_field(field).to_python(value)
+    
     def get_or_create(
         self,
         defaults: Optional[Dict[str, Any]] = None,
@@ -370,6 +521,57 @@ class TeamsService:
         # Otherwise, we're still in the previous season
         return now.year if now.month >= 8 else now.year - 1
     
+    def _fetch_api_teams(
+        self,
+        provider: str,
+        competition_id: Optional[str],
+        season: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Request one competition's teams from the provider.
+        
+        HTTP only, no database access, so it is safe to run in worker threads.
+        
+        Args:
+            provider: Provider name ('football-data' or 'api-football')
+            competition_id: Competition code (e.g., 'PL' for Premier League)
+            season: Season year for API-Football (current season if None)
+        
+        Returns:
+            Raw team dictionaries as returned by the provider client
+        """
+        if provider == 'football-data':
+            if not competition_id:
+                raise ValueError("competition_id required for football-data provider")
+            logger.info(f"Fetching teams from Football-Data.org: {competition_id}")
+            
+            # Football-Data.org client doesn't accept extra parameters
+            # Fetch all teams and limit after
+            return self.primary_provider.get_teams_by_competition(
+                competition_id=competition_id
+            )
+        
+        elif provider == 'api-football':
+            if not competition_id:
+                raise ValueError("competition_id required for api-football provider")
+            if not self.fallback_provider:
+                raise ValueError("API-Football provider not configured")
+            
+            # Use provided season or get current season
+            if season is None:
+                season = self._get_current_season()
+                logger.info(f"Using current season: {season}")
+            
+            logger.info(f"Fetching teams from API-Football: league={competition_id}, season={season}")
+            
+            # API-Football client - pass competition_id as league_id with season
+            return self.fallback_provider.get_teams_by_league(
+                league_id=int(competition_id),
+                season=season
+            )
+        
+        raise ValueError(f"Invalid provider: {provider}")
+    
     @transaction.atomic
     def fetch_teams_from_provider(
         self,
@@ -378,6 +580,10 @@ class TeamsService:
         country_code: Optional[str] = None,
         limit: Optional[int] = None,
         season: Optional[int] = None,
+        api_teams: Optional[List[Dict[str, Any]]] = None,
+        fields: Optional[List[str]] = None,
+        force: bool = True,
+        deactivate_missing: bool = False,
     ) -> Dict[str, Any]:
         """
         Fetch teams from external API provider.
@@ -388,6 +594,12 @@ class TeamsService:
             country_code: Country code for filtering (optional)
             limit: Maximum number of teams to process (applied after fetch)
             season: Season year for API-Football (e.g., 2024). If not provided, uses current season.
+            api_teams: Provider response fetched beforehand (skips the API call)
+            fields: Columns to update on existing teams (all when None)
+            force: Write matched teams even when none of their values changed
+            deactivate_missing: Deactivate the competition's known teams (its
+                latest stored standings) absent from the response (skipped
+                when the response was limited or not fully transformed)
         
         Returns:
             Dictionary with statistics about the fetch operation
@@ -406,42 +618,13 @@ class TeamsService:
             'created': 0,
             'updated': 0,
             'failed': 0,
+            'deactivated': 0,
             'errors': []
         }
         try:
-            # Fetch teams from provider
-            if provider == 'football-data':
-                if not competition_id:
-                    raise ValueError("competition_id required for football-data provider")
-                logger.info(f"Fetching teams from Football-Data.org: {competition_id}")
-                
-                # Football-Data.org client doesn't accept extra parameters
-                # Fetch all teams and limit after
-                api_teams = self.primary_provider.get_teams_by_competition(
-                    competition_id=competition_id
-                )
-                
-            elif provider == 'api-football':
-                if not competition_id:
-                    raise ValueError("competition_id required for api-football provider")
-                if not self.fallback_provider:
-                    raise ValueError("API-Football provider not configured")
-                
-                # Use provided season or get current season
-                if season is None:
-                    season = self._get_current_season()
-                    logger.info(f"Using current season: {season}")
-                
-                logger.info(f"Fetching teams from API-Football: league={competition_id}, season={season}")
-                
-                # API-Football client - pass competition_id as league_id with season
-                api_teams = self.fallback_provider.get_teams_by_league(
-                    league_id=int(competition_id),
-                    season=season
-                )
-                
-            else:
-                raise ValueError(f"Invalid provider: {provider}")
+            # Fetch teams from provider unless already fetched by the caller
+            if api_teams is None:
+                api_teams = self._fetch_api_teams(provider, competition_id, season)
             
             # Apply limit if specified (after fetch, since clients don't support limit)
             if limit and limit > 0:
@@ -490,7 +673,9 @@ class TeamsService:
             # Save teams to database (upsert)
             created, updated, save_errors = self.bulk_upsert_teams(
                 validated_teams,
-                match_field='external_id'
+                match_field='external_id',
+                fields=fields,
+                force=force
             )
             
             stats['created'] = len(created)
@@ -499,6 +684,12 @@ class TeamsService:
             stats['failed'] = len(save_errors)
             stats['errors'].extend(save_errors)
             
+            # Only a complete response says which teams are really missing
+            if deactivate_missing and not limit and stats['transformed'] == stats['fetched']:
+                stats['deactivated'] = self._deactivate_missing_teams(
+                    provider, competition_id, transformed_teams
+                )
+            
             logger.info(
                 f"Fetch complete: {stats['fetched']} fetched, "
                 f"{stats['saved']} saved ({stats['created']} new, {stats['updated']} updated), "
@@ -516,21 +707,125 @@ class TeamsService:
             stats['errors'].append(error_msg)
             raise
     
+    def fetch_teams_for_competitions(
+        self,
+        provider: str,
+        competition_ids: List[str],
+        season: Optional[int] = None,
+        max_workers: int = FETCH_MAX_WORKERS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch teams for several competitions.
+        
+        The provider requests run concurrently on a small thread pool, so
+        wall-clock time is about one request instead of one per competition.
+        Transforming and saving stays in the calling thread, one competition
+        (and transaction) at a time, in the given order. A failed request is
+        raised when its competition is reached, after the ones before it
+        have been saved, as with sequential fetching.
+        
+        Args:
+            provider: Provider name ('football-data' or 'api-football')
+            competition_ids: Competition codes (e.g., ['PL', 'SA'])
+            season: Season year for API-Football (current season if None)
+            max_workers: Maximum concurrent provider requests
+        
+        Returns:
+            List of fetch_teams_from_provider() statistics, one per competition
+        """
+        if not competition_ids:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(competition_ids))) as executor:
+            futures = [
+                executor.submit(self._fetch_api_teams, provider, competition_id, season)
+                for competition_id in competition_ids
+            ]
+            
+            # Save each competition as soon as its response (and all earlier ones) arrived
+            results = []
+            for competition_id, future in zip(competition_ids, futures):
+                logger.info(f"Saving teams for competition: {competition_id}")
+                results.append(self.fetch_teams_from_provider(
+                    provider=provider,
+                    competition_id=competition_id,
+                    season=season,
+                    api_teams=future.result(),
+                ))
+        
+        return results
+    
     def sync_teams(
         self,
         provider: str = 'football-data',
         competition_id: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        force: bool = False,
+        deactivate_missing: bool = False,
         **kwargs
     ) -> Dict[str, Any]:
         """
         Sync teams data from external provider.
         
-        Currently uses fetch_teams_from_provider internally.
-        Future implementation will add intelligent sync logic.
+        Runs fetch_teams_from_provider; unless force is set, only teams
+        whose values changed are written.
+        
+        Args:
+            provider: Provider name ('football-data' or 'api-football')
+            competition_id: Competition code (e.g., 'PL' for Premier League)
+            fields: Columns to update on existing teams (all when None)
+            force: Write every matched team, even when unchanged
+            deactivate_missing: Deactivate the competition's known teams
+                absent from the response
         """
         logger.info("sync_teams called (currently uses fetch_teams_from_provider)")
         return self.fetch_teams_from_provider(
             provider=provider,
             competition_id=competition_id,
+            fields=fields,
+            force=force,
+            deactivate_missing=deactivate_missing,
             **kwargs
         )
+    
+    def _deactivate_missing_teams(
+        self,
+        provider: str,
+        competition_id: Optional[str],
+        teams_data: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Deactivate the competition's active teams missing from its response.
+        
+        Teams do not record their competitions; the known members are the
+        teams of the competition league's latest stored standings (league
+        external_id '{provider}-{competition_id}', as set by the
+        transformers). When those are unknown nothing is deactivated.
+        """
+        league = League.objects.filter(external_id=f"{provider}-{competition_id}").first()
+        season = (
+            Standing.objects.filter(league=league)
+            .order_by('-season')
+            .values_list('season', flat=True)
+            .first()
+        ) if league else None
+        if season is None:
+            logger.warning(
+                f"No stored standings for {provider} competition {competition_id}; "
+                f"no teams deactivated"
+            )
+            return 0
+        
+        deactivated = (
+            Team.objects.filter(
+                is_active=True,
+                external_id__startswith=f"{provider}-",
+                id__in=Standing.objects.filter(league=league, season=season).values('team_id'),
+            )
+            .exclude(external_id__in=[data['external_id'] for data in teams_data])
+            .update(is_active=False, updated_at=timezone.now())
+        )
+        if deactivated:
+            invalidate_stats_cache()
+        logger.info(f"Deactivated {deactivated} teams missing from the provider response")
+        return deactivated
@@ -0,0 +1,291 @@
+"""
+Unit tests for TeamsService team upserts.
+
+Tests cover:
+- Batched create/update in bulk_upsert_teams
+- Duplicate match values within one batch
+- The fields filter and the force=False change detection
+- Rows conflicting with another team's name or code
+- Scope of deactivate_missing in fetch_teams_from_provider
+"""
+
+import uuid
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.db import IntegrityError, connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.core.models import Country, League, Sport, Standing, Team
+from api_integrations.services.teams_service import TeamsService
+
+
+@override_settings(
+    FOOTBALL_DATA_CONFIG={'API_KEY': 'test_api_key_123'},
+    API_FOOTBALL_CONFIG={},
+)
+class TestTeamsServiceUpsert(TestCase):
+    """Test cases for TeamsService.bulk_upsert_teams and deactivation."""
+    
+    @classmethod
+    def setUpClass(cls):
+        # Core models are unmanaged, so the test database has no tables for
+        # them; created before the class-wide transaction is opened
+        existing_tables = connection.introspection.table_names()
+        with connection.schema_editor() as schema_editor:
+            if connection.vendor == 'postgresql':
+                schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+            for model in (Country, Sport, League, Team, Standing):
+                if model._meta.db_table not in existing_tables:
+                    schema_editor.create_model(model)
+        super().setUpClass()
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.service = TeamsService()
+        self.england = Country.objects.create(name='England', code='GB', flag='🏴')
+        self.spain = Country.objects.create(name='Spain', code='ES', flag='🇪🇸')
+        self.long_ago = timezone.now() - timedelta(days=30)
+    
+    def _team_data(self, external_id, name, code, country=None, **extra):
+        """Team dictionary shaped like TeamTransformer output"""
+        now = timezone.now()
+        data = {
+            'id': str(uuid.uuid4()),
+            'external_id': external_id,
+            'name': name,
+            'code': code,
+            'country_id': str((country or self.england).id),
+            'logo': None,
+            'website': None,
+            'founded': None,
+            'market_value': None,
+            'is_active': True,
+            'created_at': now,
+            'updated_at': now,
+        }
+        data.update(extra)
+        return data
+    
+    def _stored_team(self, external_id, name, code, country=None, **extra):
+        """Create a team as an earlier sync would have stored it"""
+        data = self._team_data(external_id, name, code, country, **extra)
+        data.update(created_at=self.long_ago, updated_at=self.long_ago)
+        return Team.objects.create(**data)
+    
+    def test_creates_and_updates_in_one_batch(self):
+        """Test new teams are inserted and matched teams updated."""
+        stored = self._stored_team('football-data-57', 'Arsenal', 'ARS')
+        
+        created, updated, errors = self.service.bulk_upsert_teams([
+            self._team_data('football-data-57', 'Arsenal FC', 'ARS'),
+            self._team_data('football-data-61', 'Chelsea FC', 'CHE'),
+        ])
+        
+        self.assertEqual(errors, [])
+        self.assertEqual([team.external_id for team in created], ['football-data-61'])
+        self.assertEqual([team.external_id for team in updated], ['football-data-57'])
+        stored.refresh_from_db()
+        self.assertEqual(stored.name, 'Arsenal FC')
+        self.assertEqual(Team.objects.count(), 2)
+    
+    def test_update_keeps_identity_and_creation_time(self):
+        """Test an update never copies the transformer's id or created_at."""
+        stored = self._stored_team('football-data-57', 'Arsenal', 'ARS')
+        
+        self.service.bulk_upsert_teams([
+            self._team_data('football-data-57', 'Arsenal FC', 'ARS'),
+        ])
+        
+        team = Team.objects.get(external_id='football-data-57')
+        self.assertEqual(team.id, stored.id)
+        self.assertEqual(team.created_at, self.long_ago)
+        self.assertGreater(team.updated_at, self.long_ago)
+    
+    def test_duplicate_match_values_in_batch(self):
+        """Test a repeated external_id creates one team with the last values."""
+        created, updated, errors = self.service.bulk_upsert_teams([
+            self._team_data('football-data-57', 'Arsenal', 'ARS'),
+            self._team_data('football-data-57', 'Arsenal FC', 'ARS'),
+        ])
+        
+        self.assertEqual(errors, [])
+        self.assertEqual(len(created), 1)
+        self.assertEqual(updated, [])
+        self.assertEqual(
+            list(Team.objects.values_list('name', flat=True)),
+            ['Arsenal FC']
+        )
+    
+    def test_fields_limits_updated_columns(self):
+        """Test only the requested columns of matched teams are written."""
+        self._stored_team('football-data-57', 'Arsenal', 'ARS', founded=1886)
+        
+        created, updated, errors = self.service.bulk_upsert_teams(
+            [self._team_data(
+                'football-data-57', 'Arsenal FC', 'ARS',
+                founded=1887, website='https://www.arsenal.com'
+            )],
+            fields=['website'],
+        )
+        
+        self.assertEqual(len(updated), 1)
+        team = Team.objects.get(external_id='football-data-57')
+        self.assertEqual(team.website, 'https://www.arsenal.com')
+        self.assertEqual(team.name, 'Arsenal')
+        self.assertEqual(team.founded, 1886)
+    
+    def test_unchanged_teams_skipped_without_force(self):
+        """Test force=False writes nothing when only bookkeeping columns differ."""
+        self._stored_team('football-data-57', 'Arsenal', 'ARS')
+        
+        created, updated, errors = self.service.bulk_upsert_teams(
+            [self._team_data('football-data-57', 'Arsenal', 'ARS')],
+            force=False,
+        )
+        
+        self.assertEqual((created, updated, errors), ([], [], []))
+        team = Team.objects.get(external_id='football-data-57')
+        self.assertEqual(team.updated_at, self.long_ago)
+    
+    def test_changed_teams_written_without_force(self):
+        """Test force=False still writes and stamps a team whose values changed."""
+        self._stored_team('football-data-57', 'Arsenal', 'ARS')
+        self._stored_team('football-data-61', 'Chelsea', 'CHE')
+        
+        created, updated, errors = self.service.bulk_upsert_teams(
+            [
+                self._team_data('football-data-57', 'Arsenal', 'ARS'),
+                self._team_data('football-data-61', 'Chelsea FC', 'CHE'),
+            ],
+            force=False,
+        )
+        
+        self.assertEqual([team.external_id for team in updated], ['football-data-61'])
+        arsenal = Team.objects.get(external_id='football-data-57')
+        chelsea = Team.objects.get(external_id='football-data-61')
+        self.assertEqual(arsenal.updated_at, self.long_ago)
+        self.assertEqual(chelsea.name, 'Chelsea FC')
+        self.assertGreater(chelsea.updated_at, self.long_ago)
+    
+    def test_conflicting_row_reported_and_skipped(self):
+        """Test a row reusing another team's name or code fails alone."""
+        self._stored_team('football-data-57', 'Arsenal', 'ARS')
+        self._stored_team('football-data-61', 'Chelsea', 'CHE')
+        
+        created, updated, errors = self.service.bulk_upsert_teams([
+            self._team_data('football-data-73', 'Arsenal', 'TOT'),
+            self._team_data('football-data-61', 'Chelsea FC', 'ARS'),
+            self._team_data('football-data-62', 'Everton', 'EVE'),
+            self._team_data('football-data-63', 'Fulham', 'EVE'),
+        ])
+        
+        self.assertEqual(len(errors), 3)
+        self.assertIn("name 'Arsenal' is already used", errors[0])
+        self.assertIn("code 'ARS' is already used", errors[1])
+        self.assertIn("code 'EVE' is already used", errors[2])
+        self.assertEqual([team.name for team in created], ['Everton'])
+        self.assertEqual(updated, [])
+        self.assertEqual(Team.objects.get(external_id='football-data-61').name, 'Chelsea')
+    
+    def test_constraint_violation_falls_back_to_row_saves(self):
+        """Test an IntegrityError from the bulk insert only fails the offending row."""
+        self._stored_team('football-data-57', 'Arsenal', 'ARS')
+        
+        # Let the conflict reach the database constraint
+        with patch.object(TeamsService, '_claim_unique_values'):
+            created, updated, errors = self.service.bulk_upsert_teams([
+                self._team_data('football-data-61', 'Chelsea', 'CHE'),
+                self._team_data('football-data-73', 'Arsenal', 'TOT'),
+            ])
+        
+        self.assertEqual([team.name for team in created], ['Chelsea'])
+        self.assertEqual(len(errors), 1)
+        self.assertIn('Arsenal', errors[0])
+        self.assertEqual(
+            sorted(Team.objects.values_list('external_id', flat=True)),
+            ['football-data-57', 'football-data-61']
+        )
+    
+    def _premier_league(self, season_teams):
+        """Store the competition football-data-2021 with standings per season"""
+        sport = Sport.objects.create(id='football', name='Football', slug='football')
+        league = League.objects.create(
+            name='Premier League',
+            sport=sport,
+            country=self.england,
+            external_id='football-data-2021',
+        )
+        for season, teams in season_teams.items():
+            for position, team in enumerate(teams, start=1):
+                Standing.objects.create(league=league, team=team, season=season, position=position)
+        return league
+    
+    def test_deactivate_missing_is_scoped(self):
+        """Test only the competition's known teams are deactivated."""
+        arsenal = self._stored_team('football-data-57', 'Arsenal', 'ARS')
+        bournemouth = self._stored_team('football-data-1044', 'Bournemouth', 'BOU')
+        burnley = self._stored_team('football-data-328', 'Burnley', 'BUR')
+        self._stored_team('football-data-341', 'Leeds United', 'LEE')
+        self._stored_team('football-data-86', 'Real Madrid', 'RMA', country=self.spain)
+        self._premier_league({
+            '2023': [arsenal, burnley],
+            '2024': [arsenal, bournemouth],
+        })
+        
+        stats = self.service.fetch_teams_from_provider(
+            provider='football-data',
+            competition_id='2021',
+            api_teams=[{
+                'id': 57,
+                'name': 'Arsenal',
+                'tla': 'ARS',
+                'area': {'name': 'England'},
+            }],
+            deactivate_missing=True,
+        )
+        
+        # Leeds (same country, other competition) and last season's Burnley stay active
+        self.assertEqual(stats['deactivated'], 1)
+        self.assertEqual(
+            list(Team.objects.filter(is_active=False).values_list('external_id', flat=True)),
+            ['football-data-1044']
+        )
+    
+    def test_deactivate_missing_skipped_for_unknown_competition(self):
+        """Test nothing is deactivated for a competition without stored standings."""
+        self._stored_team('football-data-57', 'Arsenal', 'ARS')
+        self._stored_team('football-data-61', 'Chelsea', 'CHE')
+        
+        stats = self.service.fetch_teams_from_provider(
+            provider='football-data',
+            competition_id='PL',
+            api_teams=[
+                {'id': 57, 'name': 'Arsenal', 'tla': 'ARS', 'area': {'name': 'England'}},
+            ],
+            deactivate_missing=True,
+        )
+        
+        self.assertEqual(stats['deactivated'], 0)
+        self.assertFalse(Team.objects.filter(is_active=False).exists())
+    
+    def test_deactivate_missing_skipped_for_limited_response(self):
+        """Test a limited response never deactivates the teams cut off by the limit."""
+        arsenal = self._stored_team('football-data-57', 'Arsenal', 'ARS')
+        chelsea = self._stored_team('football-data-61', 'Chelsea', 'CHE')
+        self._premier_league({'2024': [arsenal, chelsea]})
+        
+        stats = self.service.fetch_teams_from_provider(
+            provider='football-data',
+            competition_id='2021',
+            limit=1,
+            api_teams=[
+                {'id': 57, 'name': 'Arsenal', 'tla': 'ARS', 'area': {'name': 'England'}},
+                {'id': 61, 'name': 'Chelsea', 'tla': 'CHE', 'area': {'name': 'England'}},
+            ],
+            deactivate_missing=True,
+        )
+        
+        self.assertEqual(stats['deactivated'], 0)
+        self.assertFalse(Team.objects.filter(is_active=False).exists())
@@ -60,7 +60,8 @@ class TeamTransformer(BaseTransformer):
     def __init__(self):
         """Initialize transformer with country cache."""
         super().__init__()
-        self._country_cache: Dict[str, Optional[Country]] = {}
+        # Lower-cased country name -> Country, loaded on first use
+        self._country_cache: Optional[Dict[str, Country]] = None
         self.logger.info("TeamTransformer initialized")
     
     def transform(
@@ -241,7 +242,8 @@ class TeamTransformer(BaseTransformer):
         Match team's country to database Country record.
         
         Uses country name from 'area' (Football-Data) or 'country' (API-Football).
-        Caches results for performance.
+        Matched case-insensitively against all countries, which are loaded
+        in one query on first use instead of one query per team.
         
         Args:
             data: API response data
@@ -264,33 +266,36 @@ class TeamTransformer(BaseTransformer):
             self.logger.debug(f"No country data for team: {data.get('name')}")
             return None
         
-        # Check cache first
-        if country_name in self._country_cache:
-            country = self._country_cache[country_name]
-            return str(country.id) if country else None
-        
-        # Query database
         try:
-            country = Country.objects.filter(
-                name__iexact=country_name
-            ).first()
-            
-            # Cache result (even if None)
-            self._country_cache[country_name] = country
-            
-            if country:
-                self.logger.debug(f"Matched country: {country_name} -> {country.id}")
-                return str(country.id)
-            else:
-                self.logger.warning(
-                    f"Country not found in database: {country_name} "
-                    f"(team: {data.get('name')})"
-                )
-                return None
-                
+            country = self._get_country_cache().get(country_name.lower())
         except Exception as e:
             self.logger.error(f"Error matching country {country_name}: {str(e)}")
             return None
+        
+        if country:
+            self.logger.debug(f"Matched country: {country_name} -> {country.id}")
+            return str(country.id)
+        
+        self.logger.warning(
+            f"Country not found in database: {country_name} "
+            f"(team: {data.get('name')})"
+        )
+        return None
+    
+    def _get_country_cache(self) -> Dict[str, Country]:
+        """
+        Return countries keyed by lower-cased name, loading them on first use.
+        
+        The countries table holds a few hundred rows, so one query for all
+        of them is cheaper than a lookup per distinct team country.
+        """
+        if self._country_cache is None:
+            self._country_cache = {
+                country.name.lower(): country
+                for country in Country.objects.only('id', 'name')
+            }
+            self.logger.debug(f"Loaded {len(self._country_cache)} countries into cache")
+        return self._country_cache
     
     def _extract_logo(self, data: Dict[str, Any], provider: str) -> Optional[str]:
         """
@@ -358,5 +363,5 @@ class TeamTransformer(BaseTransformer):
         Useful when country data might have changed or when
         processing a new batch of teams.
         """
-        self._country_cache.clear()
+        self._country_cache = None
         self.logger.debug("Cleared country cache")
@@ -0,0 +1,34 @@
+from django.apps import AppConfig
+from django.core.signals import request_started
+
+
+def _compile_url_patterns(patterns):
+    """Compile every pattern's regex now instead of on its first request"""
+    from django.urls import URLResolver
+    
+    for pattern in patterns:
+        pattern.pattern.regex  # compiled and cached by the descriptor
+        if isinstance(pattern, URLResolver):
+            _compile_url_patterns(pattern.url_patterns)
+
+
+def _warm_url_resolver(sender, **kwargs):
+    """Compile all URL regexes once, on the worker's first request"""
+    from django.urls import get_resolver
+    
+    request_started.disconnect(_warm_url_resolver, dispatch_uid='core.warm_url_resolver')
+    _compile_url_patterns(get_resolver().url_patterns)
+
+
+class CoreConfig(AppConfig):
+    """Django app configuration for the Core app."""
+    name = 'apps.core'
+    verbose_name = 'Core'
+    
+    def ready(self):
+        from apps.core import signals  # noqa: F401  (connects receivers)
+        
+        # The URLconf is imported lazily: loading it here would import every
+        # view during app loading. The first request pays the regex
+        # compilation for all patterns instead of each pattern's first hit.
+        request_started.connect(_warm_url_resolver, dispatch_uid='core.warm_url_resolver')
@@ -0,0 +1,65 @@
+"""
+Response Caching for Core App
+
+Short-lived cache for aggregate endpoints (country statistics, top teams by
+market value) and country details. Entries are keyed by a generation token that changes on
+every Country/League/Team write (see signals.py), so a write invalidates
+all of them at once on any cache backend, without pattern deletes.
+
+Author: Oover Development Team
+Date: November 2025
+"""
+
+import uuid
+
+from django.core.cache import cache
+
+
+# Upper bound on staleness for writes that bypass model signals
+# (queryset.update(), raw SQL, changes made directly in Supabase)
+STATS_CACHE_TIMEOUT = 300
+
+_STATS_PREFIX = 'core_stats'
+_GENERATION_KEY = f'{_STATS_PREFIX}:generation'
+
+
+def stats_cache_key(name, params):
+    """
+    Build the cache key of one aggregate response
+    
+    Args:
+        name: Endpoint name (e.g. 'countries.stats')
+        params: Normalized parameters the response depends on
+    
+    Returns:
+        str: Cache key for the current generation
+    """
+    generation = cache.get_or_set(_GENERATION_KEY, uuid.uuid4().hex, None)
+    query = '&'.join(f'{key}={params[key]}' for key in sorted(params))
+    return f'{_STATS_PREFIX}:{generation}:{name}:{query}'
+
+
+def cached_stats(name, params, build):
+    """
+    Return the cached response data of an aggregate or detail endpoint
+    
+    Args:
+        name: Endpoint name (e.g. 'countries.stats', 'countries.retrieve')
+        params: Normalized parameters the response depends on (dict);
+            only these go into the key, so unrelated query strings share it
+        build: Callable computing the response data on a miss
+    
+    Returns:
+        Response data (from the cache or freshly built)
+    """
+    key = stats_cache_key(name, params)
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, STATS_CACHE_TIMEOUT)
+    return data
+
+
+def invalidate_stats_cache():
+    """Start a new generation, orphaning every cached aggregate response"""
+    cache.set(_GENERATION_KEY, uuid.uuid4().hex, None)
@@ -0,0 +1,62 @@
+"""
+Database Router for Core App
+
+Sends reads of core models (countries, leagues, teams, ...) to the read
+replica while a read-only request is being served. ReadReplicaMiddleware
+marks GET/HEAD requests; everything else, including the reads a write
+endpoint does before or after saving, stays on the primary.
+
+Registered in settings only when DB_REPLICA_HOST is configured.
+
+Author: Oover Development Team
+Date: November 2025
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+REPLICA_DATABASE = 'replica'
+
+_REPLICATED_DATABASES = ('default', REPLICA_DATABASE)
+
+_read_from_replica = ContextVar('read_from_replica', default=False)
+
+
+@contextmanager
+def replica_reads():
+    """Route core model reads inside the block to the read replica"""
+    token = _read_from_replica.set(True)
+    try:
+        yield
+    finally:
+        _read_from_replica.reset(token)
+
+
+class CoreReadReplicaRouter:
+    """
+    Route core app reads to the replica inside replica_reads()
+    
+    Models of other apps (auth, sessions, api_integrations' sync log) are
+    not routed: they are written during the same requests and must not
+    lag behind.
+    """
+    
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label == 'core' and _read_from_replica.get():
+            return REPLICA_DATABASE
+        return None
+    
+    def db_for_write(self, model, **hints):
+        return None
+    
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data
+        if obj1._state.db in _REPLICATED_DATABASES and obj2._state.db in _REPLICATED_DATABASES:
+            return True
+        return None
+    
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == REPLICA_DATABASE:
+            return False
+        return None
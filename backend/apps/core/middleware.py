@@ -0,0 +1,88 @@
+"""
+Middleware for Core App
+
+Adds HTTP caching headers to the core API responses and routes the
+database reads of read-only requests to the replica.
+
+Author: Oover Development Team
+Date: November 2025
+"""
+
+from django.conf import settings
+from django.utils.cache import patch_cache_control, patch_vary_headers
+
+from apps.core.db_router import replica_reads
+
+
+# Successful reads: shared caches may serve them for a minute and keep
+# serving a stale copy for 30 more seconds while revalidating
+READ_CACHE_CONTROL = {'max_age': 60, 'stale_while_revalidate': 30}
+
+_SAFE_METHODS = ('GET', 'HEAD')
+
+
+def _is_credentialed(request):
+    """Whether the response may depend on who is asking"""
+    if 'HTTP_AUTHORIZATION' in request.META:
+        return True
+    if settings.SESSION_COOKIE_NAME in request.COOKIES:
+        return True
+    user = getattr(request, 'user', None)
+    return bool(user is not None and user.is_authenticated)
+
+
+class CacheHeadersMiddleware:
+    """
+    Set Cache-Control and Vary on responses of the core app's routes
+    
+    - Successful GET/HEAD: public (private when the request carries an
+      Authorization header or a session cookie, or is authenticated),
+      max-age=60, stale-while-revalidate=30.
+      Responses that already set Cache-Control, such as the conditional
+      list endpoints, keep their own policy.
+    - Any other method (create, update, fetch, sync): no-store.
+    
+    Every core response varies on Accept, Authorization and Cookie.
+    """
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        response = self.get_response(request)
+        
+        match = request.resolver_match
+        if match is None or match.app_name != 'core':
+            return response
+        
+        if request.method not in _SAFE_METHODS:
+            patch_cache_control(response, no_store=True)
+        elif response.status_code == 200 and not response.has_header('Cache-Control'):
+            if _is_credentialed(request):
+                patch_cache_control(response, private=True, **READ_CACHE_CONTROL)
+            else:
+                patch_cache_control(response, public=True, **READ_CACHE_CONTROL)
+        
+        patch_vary_headers(response, ('Accept', 'Authorization', 'Cookie'))
+        return response
+
+
+class ReadReplicaMiddleware:
+    """
+    Serve GET/HEAD requests from the read replica
+    
+    Core model reads of safe requests go through CoreReadReplicaRouter to
+    the replica; writes, and reads made while handling them, stay on the
+    primary. Without a configured replica the router is not installed and
+    this has no effect.
+    """
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        if request.method not in _SAFE_METHODS:
+            return self.get_response(request)
+        
+        with replica_reads():
+            return self.get_response(request)
@@ -13,8 +13,11 @@ Last Updated: 2025-11-01 (Added TeamStatistics and PlayerStatistics models)
 """
 
 import uuid
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
+from django.utils.functional import cached_property
 
 
 class Country(models.Model):
@@ -245,9 +248,11 @@ class League(models.Model):
         help_text="Sport type (typically Football)"
     )
     
+    # Deletes are left to the database foreign key (fk_leagues_country_id,
+    # ON DELETE RESTRICT; see migration 010)
     country = models.ForeignKey(
         Country,
-        on_delete=models.CASCADE,
+        on_delete=models.DO_NOTHING,
         db_column='country_id',
         related_name='leagues',
         null=True,
@@ -306,6 +311,23 @@ class League(models.Model):
         verbose_name = 'League'
         verbose_name_plural = 'Leagues'
         ordering = ['name']
+        # Trigram search indexes: see database/sql/migrations/008_add_search_trigram_indexes.sql
+        indexes = [
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='idx_leagues_name_trgm'),
+            GinIndex(OpClass(Upper('external_id'), name='gin_trgm_ops'), name='idx_leagues_ext_id_trgm'),
+        ]
+        # Unique constraints: see database/sql/migrations/004_add_league_unique_constraints.sql
+        constraints = [
+            models.UniqueConstraint(
+                fields=['name', 'country'],
+                name='uq_league_name_country'
+            ),
+            models.UniqueConstraint(
+                fields=['external_id'],
+                condition=models.Q(external_id__isnull=False),
+                name='uq_league_ext_id'
+            ),
+        ]
         
     def __str__(self):
         """String representation of the league"""
@@ -373,10 +395,11 @@ class Team(models.Model):
         help_text="Full team name (e.g., 'Manchester United', 'FC Barcelona', 'Fenerbahçe')"
     )
     
-    # Foreign Key (snake_case)
+    # Foreign Key (snake_case); deletes are left to the database
+    # foreign key (fk_teams_country_id, ON DELETE RESTRICT; see migration 010)
     country = models.ForeignKey(
         Country,
-        on_delete=models.CASCADE,
+        on_delete=models.DO_NOTHING,
         db_column='country_id',
         related_name='teams',
         null=True,
@@ -384,6 +407,24 @@ class Team(models.Model):
         help_text="Team's home country"
     )
     
+    # Denormalized country columns (kept in sync by database triggers,
+    # see database/sql/migrations/005_add_team_country_cache_columns.sql)
+    country_name_cached = models.CharField(
+        max_length=100,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Copy of countries.name for the team's country (read-only, maintained by trigger)"
+    )
+    
+    country_code_cached = models.CharField(
+        max_length=10,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Copy of countries.code for the team's country (read-only, maintained by trigger)"
+    )
+    
     # Branding & Info Fields
     logo = models.TextField(
         null=True,
@@ -473,6 +514,37 @@ class Team(models.Model):
             models.Index(fields=['code'], name='idx_teams_code'),
             models.Index(fields=['is_active'], name='idx_teams_is_active'),
             models.Index(fields=['external_id'], name='idx_teams_external_id'),
+            # Trigram search indexes: see database/sql/migrations/008_add_search_trigram_indexes.sql
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='idx_teams_name_trgm'),
+            GinIndex(OpClass(Upper('code'), name='gin_trgm_ops'), name='idx_teams_code_trgm'),
+            GinIndex(OpClass(Upper('external_id'), name='gin_trgm_ops'), name='idx_teams_ext_id_trgm'),
+            # Top teams by market value: see database/sql/migrations/009_add_team_market_value_indexes.sql
+            models.Index(
+                fields=['country', '-market_value'],
+                condition=models.Q(is_active=True, market_value__isnull=False),
+                name='idx_teams_country_market_value'
+            ),
+            models.Index(
+                fields=['-market_value'],
+                condition=models.Q(is_active=True, market_value__isnull=False),
+                name='idx_teams_market_value'
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['name'],
+                name='uq_team_name'
+            ),
+            models.UniqueConstraint(
+                fields=['code'],
+                condition=models.Q(code__isnull=False),
+                name='uq_team_code'
+            ),
+            models.UniqueConstraint(
+                fields=['external_id'],
+                condition=models.Q(external_id__isnull=False),
+                name='uq_team_ext_id'
+            ),
         ]
         
     def __str__(self):
@@ -485,20 +557,37 @@ class Team(models.Model):
         """Developer-friendly representation"""
         return f"<Team: {self.id} - {self.name}>"
     
-    @property
+    def save(self, *args, **kwargs):
+        # market_value may have changed; drop the cached display value
+        self.__dict__.pop('formatted_market_value', None)
+        super().save(*args, **kwargs)
+    
+    @cached_property
     def formatted_market_value(self):
         """
         Returns formatted market value for display
         
+        Cached per instance (invalidated on save()), so repeated access
+        from several serializer fields or passes formats the value once.
+        
         Examples:
             1000000 -> "€1.0M"
             1500000000 -> "€1.5B"
             None -> "N/A"
         """
-        if not self.market_value:
+        return self.format_market_value(self.market_value)
+    
+    @staticmethod
+    def format_market_value(value):
+        """
+        Format a raw market value (EUR) for display
+        
+        Shared by formatted_market_value and list endpoints that read
+        market_value from .values() rows instead of model instances.
+        """
+        if not value:
             return "N/A"
         
-        value = self.market_value
         if value >= 1_000_000_000:
             return f"€{value / 1_000_000_000:.1f}B"
         elif value >= 1_000_000:
@@ -1186,12 +1275,18 @@ class TeamStatistics(models.Model):
             models.Index(fields=['league', 'season'], name='idx_team_stats_league_season'),
             models.Index(fields=['team', 'season'], name='idx_team_stats_team_season'),
         ]
-        # Unique constraint: one statistics record per team per league per season
+        # Unique constraints: one statistics record per team per league per
+        # season, and unique external_id when present (see migration 007)
         constraints = [
             models.UniqueConstraint(
                 fields=['team', 'league', 'season'],
                 name='unique_team_league_season_stats'
-            )
+            ),
+            models.UniqueConstraint(
+                fields=['external_id'],
+                condition=models.Q(external_id__isnull=False),
+                name='uq_team_stats_ext_id'
+            ),
         ]
         
     def __str__(self):
@@ -1202,7 +1297,20 @@ class TeamStatistics(models.Model):
         """Developer-friendly representation"""
         return f"<TeamStatistics: {self.team.name} in {self.league.name} {self.season}>"
     
-    @property
+    # Values derived from the statistics JSONB, cached per instance so
+    # serializers reading several of them walk the dict once
+    STATISTICS_DERIVED_FIELDS = (
+        'goals_for', 'goals_against', 'goal_difference',
+        'clean_sheets', 'average_possession', 'pass_accuracy',
+    )
+    
+    def save(self, *args, **kwargs):
+        # statistics may have changed; drop the cached derived values
+        for name in self.STATISTICS_DERIVED_FIELDS:
+            self.__dict__.pop(name, None)
+        super().save(*args, **kwargs)
+    
+    @cached_property
     def goals_for(self):
         """
         Extract total goals scored from statistics
@@ -1214,7 +1322,7 @@ class TeamStatistics(models.Model):
             return None
         return self.statistics.get('goals', {}).get('for', {}).get('total')
     
-    @property
+    @cached_property
     def goals_against(self):
         """
         Extract total goals conceded from statistics
@@ -1226,7 +1334,7 @@ class TeamStatistics(models.Model):
             return None
         return self.statistics.get('goals', {}).get('against', {}).get('total')
     
-    @property
+    @cached_property
     def goal_difference(self):
         """
         Calculate goal difference
@@ -1237,12 +1345,14 @@ class TeamStatistics(models.Model):
         goals_for = self.goals_for
         goals_against = self.goals_against
         
-        if goals_for is None or goals_against is None:
-            return None
+        # Stored totals are whatever the provider sent; only JSON numbers count
+        for goals in (goals_for, goals_against):
+            if not isinstance(goals, (int, float)) or isinstance(goals, bool):
+                return None
         
         return goals_for - goals_against
     
-    @property
+    @cached_property
     def clean_sheets(self):
         """
         Extract clean sheets from statistics
@@ -1254,7 +1364,7 @@ class TeamStatistics(models.Model):
             return None
         return self.statistics.get('clean_sheets')
     
-    @property
+    @cached_property
     def average_possession(self):
         """
         Extract average possession from statistics
@@ -1266,7 +1376,7 @@ class TeamStatistics(models.Model):
             return None
         return self.statistics.get('possession', {}).get('average')
     
-    @property
+    @cached_property
     def pass_accuracy(self):
         """
         Extract pass accuracy from statistics
@@ -0,0 +1,52 @@
+"""
+Renderers for Core App
+
+JSON renderer backed by orjson, used as the default API renderer.
+
+Author: Oover Development Team
+Date: November 2025
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+# orjson encodes dicts, lists, str/int subclasses (ReturnDict, ErrorDetail)
+# and UUIDs natively. Datetimes are passed through to DRF's encoder so they
+# keep DRF's ISO 8601 format; so are Decimals, lazy translation strings and
+# anything else orjson does not know.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+_DRF_DEFAULT = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer using orjson
+    
+    Produces the same compact UTF-8 JSON as JSONRenderer with the default
+    settings (UNICODE_JSON, COMPACT_JSON), several times faster on large
+    nested list payloads. An indent requested through the Accept header
+    (e.g. by the browsable API) is rendered with 2 spaces.
+    """
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON bytes
+        
+        Args:
+            data: Serialized response data
+            accepted_media_type: Negotiated media type (may carry indent)
+            renderer_context: View/request context
+        
+        Returns:
+            bytes: Encoded JSON (empty for None)
+        """
+        if data is None:
+            return b''
+        
+        option = _ORJSON_OPTIONS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        
+        return orjson.dumps(data, default=_DRF_DEFAULT, option=option)
@@ -0,0 +1,54 @@
+"""
+Base Serializers
+
+Shared serializer base classes for the core app.
+"""
+
+import copy
+
+from rest_framework import serializers
+
+
+class CachedModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that builds its field mapping once per class
+    
+    ModelSerializer.get_fields() introspects the model (field info, kwargs,
+    validators) every time a serializer is instantiated. The result only
+    depends on the class and its Meta, so the first build is kept as a
+    set of unbound prototypes and each instance gets a deep copy, exactly
+    like DRF already does for declared fields.
+    
+    Only use this for serializers whose fields do not depend on the
+    instance, request or context. Subclasses may limit which fields are
+    built per instance by overriding get_requested_field_names(); fields
+    left out are never copied.
+    """
+    
+    _field_cache = {}
+    
+    def get_fields(self):
+        """Return a fresh copy of the cached field mapping for this class"""
+        cls = type(self)
+        prototypes = CachedModelSerializer._field_cache.get(cls)
+        if prototypes is None:
+            prototypes = super().get_fields()
+            CachedModelSerializer._field_cache[cls] = prototypes
+        
+        requested = self.get_requested_field_names()
+        if requested is not None:
+            prototypes = {
+                name: field for name, field in prototypes.items()
+                if name in requested
+            }
+        
+        return copy.deepcopy(prototypes)
+    
+    def get_requested_field_names(self):
+        """
+        Return the set of field names to build, or None for all fields
+        
+        Called once per serializer instance, after the class-level cache
+        lookup, so it may depend on the context.
+        """
+        return None
@@ -11,6 +11,43 @@ Updated: November 2025 - Added region and fifa_code fields
 
 from rest_framework import serializers
 from typing import Dict, Any
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from apps.core.models import Country
+
+
+# Unique constraints of the countries table -> field reported to the client
+_UNIQUE_CONSTRAINT_FIELDS = {
+    'countries_pkey': 'id',
+    'countries_name_key': 'name',
+    'countries_code_key': 'code',
+}
+
+
+def _translate_integrity_error(error, validated_data):
+    """
+    Convert a country unique-constraint violation into a ValidationError
+    
+    Uniqueness is enforced by the database, so duplicates surface as
+    IntegrityError on save instead of being looked up beforehand.
+    
+    Args:
+        error: IntegrityError raised by the database
+        validated_data: Country attributes that were being saved
+        
+    Raises:
+        ValidationError: If the error matches a known country constraint
+        IntegrityError: Re-raised for any other constraint violation
+    """
+    diag = getattr(error.__cause__, 'diag', None)
+    field = _UNIQUE_CONSTRAINT_FIELDS.get(getattr(diag, 'constraint_name', None))
+    
+    if field is not None:
+        raise serializers.ValidationError({
+            field: f"A country with {field} '{validated_data.get(field)}' already exists"
+        })
+    
+    raise error
 
 
 class CountrySerializer(serializers.Serializer):
@@ -108,9 +145,76 @@ class CountrySerializer(serializers.Serializer):
         return value.strip()
 
 
+# Country columns rendered by CountrySerializer / serialize_country_list()
+COUNTRY_LIST_COLUMNS = (
+    'id', 'name', 'code', 'flag', 'region', 'fifa_code',
+    'is_international', 'is_active', 'created_at', 'updated_at',
+)
+
+# Unbound field used only for its DRF datetime formatting
+_DATETIME_FIELD = serializers.DateTimeField()
+
+
+def serialize_country_list(rows, include_counts=False):
+    """
+    Build the CountrySerializer output from .values() rows
+    
+    List endpoints fetch COUNTRY_LIST_COLUMNS with queryset.values() and
+    pass the (paginated) rows here, skipping Country instantiation and DRF
+    field dispatch per row. Output matches CountrySerializer exactly.
+    
+    Args:
+        rows: Iterable of dicts with the COUNTRY_LIST_COLUMNS keys
+        include_counts: Also output the rows' leagues_count and teams_count
+        
+    Returns:
+        list: Serialized country dicts
+    """
+    format_datetime = _DATETIME_FIELD.to_representation
+    data = []
+    
+    for row in rows:
+        created_at = row['created_at']
+        updated_at = row['updated_at']
+        
+        item = {
+            'id': str(row['id']),
+            'name': row['name'],
+            'code': row['code'],
+            'flag': row['flag'],
+            'region': row['region'],
+            'fifa_code': row['fifa_code'],
+            'is_international': row['is_international'],
+            'is_active': row['is_active'],
+            'created_at': format_datetime(created_at) if created_at is not None else None,
+            'updated_at': format_datetime(updated_at) if updated_at is not None else None,
+        }
+        if include_counts:
+            item['leagues_count'] = row['leagues_count']
+            item['teams_count'] = row['teams_count']
+        data.append(item)
+    
+    return data
+
+
 class CountryCreateSerializer(CountrySerializer):
     """Serializer for creating new countries"""
-    pass
+    
+    def create(self, validated_data):
+        """
+        Create country with a single INSERT
+        
+        Unique id, name, code and fifa_code are enforced by the database
+        instead of a SELECT before the INSERT.
+        
+        Raises:
+            ValidationError: If a unique constraint is violated
+        """
+        try:
+            with transaction.atomic():
+                return Country.objects.create(**validated_data)
+        except IntegrityError as error:
+            _translate_integrity_error(error, validated_data)
 
 
 class CountryUpdateSerializer(serializers.Serializer):
@@ -151,6 +255,34 @@ class CountryUpdateSerializer(serializers.Serializer):
                 "At least one field must be provided for update"
             )
         return attrs
+    
+    def update(self, instance, validated_data):
+        """
+        Write only the provided fields (id identifies the row and is kept)
+        
+        Raises:
+            ValidationError: If a unique constraint is violated
+        """
+        update_fields = [field for field in validated_data if field != 'id']
+        for field in update_fields:
+            setattr(instance, field, validated_data[field])
+        instance.updated_at = timezone.now()
+        
+        try:
+            with transaction.atomic():
+                instance.save(update_fields=update_fields + ['updated_at'])
+        except IntegrityError as error:
+            _translate_integrity_error(error, validated_data)
+        return instance
+
+
+class CountryNestedSerializer(serializers.Serializer):
+    """Read-only country representation nested in league/team details"""
+    id = serializers.UUIDField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    code = serializers.CharField(read_only=True)
+    flag = serializers.CharField(read_only=True)
+    flag_url = serializers.CharField(read_only=True)
 
 
 class MinimalLeagueSerializer(serializers.Serializer):
@@ -172,11 +304,33 @@ class MinimalTeamSerializer(serializers.Serializer):
 class CountryWithRelationsSerializer(CountrySerializer):
     """Country serializer with relationships"""
     leagues = MinimalLeagueSerializer(many=True, read_only=True, required=False)
-    teams = MinimalTeamSerializer(many=True, read_only=True, required=False)
+    # Capped list prefetched by CountryViewSet (sliced prefetches need to_attr)
+    teams = MinimalTeamSerializer(
+        source='embedded_teams', many=True, read_only=True, required=False
+    )
     leagues_count = serializers.IntegerField(read_only=True, required=False)
     teams_count = serializers.IntegerField(read_only=True, required=False)
 
 
+class FastChoiceField(serializers.ChoiceField):
+    """
+    ChoiceField that checks membership against a frozenset of choices
+    
+    Valid string input (the common case for query filters) is returned after
+    a single set lookup; anything else falls back to ChoiceField handling,
+    which also produces the standard "invalid_choice" error.
+    """
+    
+    def __init__(self, choices, **kwargs):
+        super().__init__(choices, **kwargs)
+        self._choice_set = frozenset(self.choices)
+    
+    def to_internal_value(self, data):
+        if isinstance(data, str) and data in self._choice_set:
+            return data
+        return super().to_internal_value(data)
+
+
 class CountryFilterSerializer(serializers.Serializer):
     """Serializer for country query filters"""
     is_active = serializers.BooleanField(required=False)
@@ -184,12 +338,12 @@ class CountryFilterSerializer(serializers.Serializer):
     name_contains = serializers.CharField(max_length=100, required=False)
     ids = serializers.ListField(child=serializers.CharField(), required=False)
     codes = serializers.ListField(child=serializers.CharField(), required=False)
-    sort_by = serializers.ChoiceField(
+    sort_by = FastChoiceField(
         choices=['name', 'code', 'created_at', 'updated_at'],
         default='name',
         required=False
     )
-    sort_order = serializers.ChoiceField(
+    sort_order = FastChoiceField(
         choices=['asc', 'desc'],
         default='asc',
         required=False
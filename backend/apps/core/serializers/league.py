@@ -10,7 +10,44 @@ Updated: November 2025 - Added tier and confederation fields
 """
 
 from rest_framework import serializers
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from apps.core.models import League, Country, Sport
+from .country import CountryNestedSerializer
+
+
+def _translate_integrity_error(error, name, country, external_id):
+    """
+    Convert a league unique-constraint violation into a ValidationError
+    
+    Uniqueness is enforced by the database (uq_league_name_country and
+    uq_league_ext_id), so duplicates surface as IntegrityError on save.
+    
+    Args:
+        error: IntegrityError raised by the database
+        name: League name that was being saved
+        country: Country the league belongs to (may be None)
+        external_id: External identifier that was being saved
+        
+    Raises:
+        ValidationError: If the error matches a known league constraint
+        IntegrityError: Re-raised for any other constraint violation
+    """
+    diag = getattr(error.__cause__, 'diag', None)
+    constraint = getattr(diag, 'constraint_name', None)
+    
+    if constraint == 'uq_league_name_country':
+        country_name = country.name if country else 'this country'
+        raise serializers.ValidationError({
+            'name': f"A league named '{name}' already exists in {country_name}"
+        })
+    
+    if constraint == 'uq_league_ext_id':
+        raise serializers.ValidationError({
+            'external_id': f"A league with external_id '{external_id}' already exists"
+        })
+    
+    raise error
 
 
 class LeagueListSerializer(serializers.ModelSerializer):
@@ -30,7 +67,7 @@ class LeagueListSerializer(serializers.ModelSerializer):
     - Status flags (is_active)
     """
     
-    country_name = serializers.CharField(source='country.name', read_only=True)
+    country_name = serializers.CharField(source='country.name', read_only=True, allow_null=True)
     country_code = serializers.CharField(source='country.code', read_only=True, allow_null=True)
     sport_name = serializers.CharField(source='sport.name', read_only=True)
     
@@ -51,6 +88,45 @@ class LeagueListSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
+# League columns rendered by LeagueListSerializer / serialize_league_list()
+LEAGUE_LIST_COLUMNS = (
+    'id', 'name', 'country__name', 'country__code', 'sport__name',
+    'logo', 'external_id', 'tier', 'confederation', 'is_active',
+)
+
+
+def serialize_league_list(rows):
+    """
+    Build the LeagueListSerializer output from .values() rows
+    
+    List endpoints fetch LEAGUE_LIST_COLUMNS with queryset.values() (the
+    country and sport names arrive through the JOIN) and pass the
+    (paginated) rows here, skipping League/Country/Sport instantiation and
+    DRF field dispatch per row. Output matches LeagueListSerializer exactly.
+    
+    Args:
+        rows: Iterable of dicts with the LEAGUE_LIST_COLUMNS keys
+        
+    Returns:
+        list: Serialized league dicts
+    """
+    return [
+        {
+            'id': str(row['id']),
+            'name': row['name'],
+            'country_name': row['country__name'],
+            'country_code': row['country__code'],
+            'sport_name': row['sport__name'],
+            'logo': row['logo'],
+            'external_id': row['external_id'],
+            'tier': row['tier'],
+            'confederation': row['confederation'],
+            'is_active': row['is_active'],
+        }
+        for row in rows
+    ]
+
+
 class LeagueDetailSerializer(serializers.ModelSerializer):
     """
     Comprehensive serializer for league detail views
@@ -70,7 +146,7 @@ class LeagueDetailSerializer(serializers.ModelSerializer):
     """
     
     # Nested serializers for related objects
-    country_details = serializers.SerializerMethodField()
+    country_details = CountryNestedSerializer(source='country', read_only=True, allow_null=True)
     sport_details = serializers.SerializerMethodField()
     
     class Meta:
@@ -92,23 +168,6 @@ class LeagueDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
     
-    def get_country_details(self, obj):
-        """
-        Get nested country information
-        
-        Returns:
-            dict: Country details or None if no country assigned
-        """
-        if obj.country:
-            return {
-                'id': str(obj.country.id),
-                'name': obj.country.name,
-                'code': obj.country.code,
-                'flag': obj.country.flag,
-                'flag_url': obj.country.flag_url,
-            }
-        return None
-    
     def get_sport_details(self, obj):
         """
         Get nested sport information
@@ -124,6 +183,41 @@ class LeagueDetailSerializer(serializers.ModelSerializer):
         }
 
 
+class LeagueCreateListSerializer(serializers.ListSerializer):
+    """
+    List serializer for bulk league creation (many=True)
+    
+    Runs the per-item field validators as usual, then checks names per
+    country and external_ids for the whole batch with one query
+    (LeagueCreateSerializer.prevalidate_batch) so conflicts are reported
+    per item before anything is inserted. The database constraints remain
+    the final guard.
+    """
+    
+    def to_internal_value(self, data):
+        """
+        Validate all items, then check uniqueness for the whole batch
+        
+        Raises:
+            ValidationError: List of per-item errors if any item conflicts
+        """
+        validated = super().to_internal_value(data)
+        
+        conflicts = self.child.prevalidate_batch(validated)
+        if conflicts:
+            raise serializers.ValidationError([
+                {field: [message] for field, message in conflicts.get(index, {}).items()}
+                for index in range(len(validated))
+            ])
+        
+        return validated
+    
+    def create(self, validated_data):
+        """Create all leagues in one transaction (all or nothing)"""
+        with transaction.atomic():
+            return super().create(validated_data)
+
+
 class LeagueCreateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating new leagues
@@ -137,10 +231,14 @@ class LeagueCreateSerializer(serializers.ModelSerializer):
     - Validates external_id format
     - Validates tier is positive integer (if provided)
     - Validates confederation format (if provided)
+    - Name per country and external_id uniqueness (database constraints)
+    
+    Bulk creation (many=True) uses LeagueCreateListSerializer.
     """
     
     class Meta:
         model = League
+        list_serializer_class = LeagueCreateListSerializer
         fields = [
             'name',
             'sport',
@@ -159,7 +257,7 @@ class LeagueCreateSerializer(serializers.ModelSerializer):
         Rules:
         - Must not be empty
         - Must be at least 2 characters
-        - Should be unique per country (soft validation)
+        - Unique per country (enforced by database constraint)
         
         Args:
             value: League name to validate
@@ -223,42 +321,111 @@ class LeagueCreateSerializer(serializers.ModelSerializer):
         
         return value.strip()
     
-    def validate(self, attrs):
+    def create(self, validated_data):
         """
-        Validate entire league object
+        Create league, relying on database constraints for uniqueness
         
         Rules:
-        - Check for duplicate league names in same country
-        - Ensure external_id is unique if provided
+        - Duplicate league names in the same country are rejected
+        - Duplicate external_id values are rejected
+        
+        Both are enforced atomically by the database instead of a SELECT
+        before the INSERT.
         
         Args:
-            attrs: Dictionary of all league attributes
+            validated_data: Dictionary of validated league attributes
             
         Returns:
-            dict: Validated attributes
+            League: Newly created league
             
         Raises:
-            ValidationError: If validation fails
+            ValidationError: If a unique constraint is violated
         """
-        name = attrs.get('name')
-        country = attrs.get('country')
-        external_id = attrs.get('external_id')
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError as e:
+            _translate_integrity_error(
+                e,
+                name=validated_data.get('name'),
+                country=validated_data.get('country'),
+                external_id=validated_data.get('external_id'),
+            )
+    
+    @classmethod
+    def prevalidate_batch(cls, payloads):
+        """
+        Check a batch of league payloads for duplicates with a single query
+        
+        Used by bulk creation (LeagueCreateListSerializer): instead of
+        discovering duplicates one failed INSERT at a time, all potential
+        conflicts are loaded once and checked in memory.
         
-        # Check for duplicate name in same country
-        if country:
-            if League.objects.filter(name=name, country=country).exists():
-                raise serializers.ValidationError({
-                    'name': f"A league named '{name}' already exists in {country.name}"
-                })
+        Rules (same as the database constraints):
+        - Duplicate league name in the same country
+        - Duplicate external_id
         
-        # Check for duplicate external_id
-        if external_id:
-            if League.objects.filter(external_id=external_id).exists():
-                raise serializers.ValidationError({
-                    'external_id': f"A league with external_id '{external_id}' already exists"
-                })
+        Both are checked against existing leagues and between payloads of
+        the same batch (every occurrence after the first).
         
-        return attrs
+        Args:
+            payloads: List of league dicts ('name', 'country', 'external_id');
+                      country may be a Country or its primary key
+            
+        Returns:
+            dict: {payload index: {field: error message}} for conflicting payloads
+        """
+        keys = []
+        names = set()
+        country_ids = set()
+        external_ids = set()
+        for payload in payloads:
+            name = payload.get('name')
+            country = payload.get('country')
+            country_id = str(getattr(country, 'pk', country)) if country else None
+            external_id = payload.get('external_id')
+            keys.append((name, country_id, external_id))
+            if name and country_id:
+                names.add(name)
+                country_ids.add(country_id)
+            if external_id:
+                external_ids.add(external_id)
+        
+        existing_names = set()
+        existing_external_ids = set()
+        if names or external_ids:
+            rows = League.objects.filter(
+                Q(name__in=names, country_id__in=country_ids) | Q(external_id__in=external_ids)
+            ).values_list('name', 'country_id', 'external_id')
+            for name, country_id, external_id in rows:
+                existing_names.add((name, str(country_id)))
+                if external_id:
+                    existing_external_ids.add(external_id)
+        
+        seen_names = set()
+        seen_external_ids = set()
+        errors = {}
+        for index, (name, country_id, external_id) in enumerate(keys):
+            payload_errors = {}
+            
+            if name and country_id:
+                if (name, country_id) in existing_names:
+                    payload_errors['name'] = f"A league named '{name}' already exists in this country"
+                elif (name, country_id) in seen_names:
+                    payload_errors['name'] = f"Duplicate name '{name}' for this country in request"
+                seen_names.add((name, country_id))
+            
+            if external_id:
+                if external_id in existing_external_ids:
+                    payload_errors['external_id'] = f"A league with external_id '{external_id}' already exists"
+                elif external_id in seen_external_ids:
+                    payload_errors['external_id'] = f"Duplicate external_id '{external_id}' in request"
+                seen_external_ids.add(external_id)
+            
+            if payload_errors:
+                errors[index] = payload_errors
+        
+        return errors
 
 
 class LeagueUpdateSerializer(serializers.ModelSerializer):
@@ -320,33 +487,21 @@ class LeagueUpdateSerializer(serializers.ModelSerializer):
         
         return value.strip()
     
-    def validate(self, attrs):
+    def update(self, instance, validated_data):
         """
-        Validate league update
+        Update league, relying on database constraints for uniqueness
         
         Rules:
-        - Check for name conflicts (excluding current league)
-        - Check for external_id conflicts (excluding current league)
+        - Name conflicts within the same country are rejected
+        - external_id conflicts with other leagues are rejected
         """
-        name = attrs.get('name')
-        country = attrs.get('country')
-        external_id = attrs.get('external_id')
-        instance = self.instance
-        
-        # Check for duplicate name (excluding self)
-        if name and country:
-            qs = League.objects.filter(name=name, country=country).exclude(id=instance.id)
-            if qs.exists():
-                raise serializers.ValidationError({
-                    'name': f"A league named '{name}' already exists in {country.name}"
-                })
-        
-        # Check for duplicate external_id (excluding self)
-        if external_id:
-            qs = League.objects.filter(external_id=external_id).exclude(id=instance.id)
-            if qs.exists():
-                raise serializers.ValidationError({
-                    'external_id': f"A league with external_id '{external_id}' already exists"
-                })
-        
-        return attrs
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError as e:
+            _translate_integrity_error(
+                e,
+                name=validated_data.get('name', instance.name),
+                country=validated_data.get('country', instance.country),
+                external_id=validated_data.get('external_id', instance.external_id),
+            )
@@ -9,12 +9,240 @@ Date: October 2025
 Updated: November 2025 - Added stadium and color fields
 """
 
+from datetime import datetime
+import time
+
 from rest_framework import serializers
+from django.db import IntegrityError, transaction
+from django.db.models import Q, QuerySet
 from apps.core.models import Team, Country
-import re
+from .base import CachedModelSerializer
+from .country import CountryNestedSerializer
+
+
+# Team color format: #RRGGBB (checked after uppercasing, without regex)
+_HEX_DIGITS = frozenset('0123456789ABCDEF')
+
+# Accepted website URL schemes (tuple form checks both in one call)
+_URL_PREFIXES = ('http://', 'https://')
+
+# Constant validation error messages
+_NAME_ERROR_SHORT = "Team name must be at least 2 characters long"
+_CODE_ERROR_LENGTH = "Team code must be between 2-10 characters"
+_CODE_ERROR_CHARS = "Team code must be alphanumeric ASCII"
+_WEBSITE_ERROR_SCHEME = "Website URL must start with http:// or https://"
+
+# Numeric ranges (inclusive) and their error messages
+_MIN_FOUNDED_YEAR = 1800
+_STADIUM_CAPACITY_MIN = 1
+_STADIUM_CAPACITY_MAX = 150_000
+_STADIUM_CAPACITY_ERROR_MIN = "Stadium capacity must be a positive number"
+_STADIUM_CAPACITY_ERROR_MAX = "Stadium capacity cannot exceed 150,000"
+_MARKET_VALUE_MAX = 10_000_000_000  # 10 billion EUR
+_MARKET_VALUE_ERROR_NEG = "Market value cannot be negative"
+_MARKET_VALUE_ERROR_MAX = "Market value cannot exceed €10 billion"
+
+# Upper bound for foundation years, refreshed at most once per hour
+_MAX_FOUNDED_YEAR_TTL = 3600
+_MAX_FOUNDED_YEAR_CACHE = {'year': 0, 'expires': 0.0}
+
+
+def _max_founded_year():
+    """
+    Return the latest accepted foundation year (current year + 1)
+    
+    The value is cached and only recomputed once per hour, so validating
+    large batches does not call datetime.now() for every record.
+    """
+    now = time.monotonic()
+    if now >= _MAX_FOUNDED_YEAR_CACHE['expires']:
+        _MAX_FOUNDED_YEAR_CACHE['year'] = datetime.now().year + 1
+        _MAX_FOUNDED_YEAR_CACHE['expires'] = now + _MAX_FOUNDED_YEAR_TTL
+    return _MAX_FOUNDED_YEAR_CACHE['year']
+
+
+# Team columns that must be unique, with their conflict messages.
+# Enforced by the database (teams_pkey, uq_team_name, uq_team_code,
+# uq_team_ext_id); bulk creates also pre-check the whole batch in one query.
+_UNIQUE_FIELDS = ('id', 'name', 'code', 'external_id')
+_UNIQUE_MESSAGES = {
+    'id': "A team with id '{}' already exists",
+    'name': "A team named '{}' already exists",
+    'code': "Team code '{}' is already in use",
+    'external_id': "A team with external_id '{}' already exists",
+}
+_UNIQUE_CONSTRAINT_FIELDS = {
+    'teams_pkey': 'id',
+    'uq_team_name': 'name',
+    'uq_team_code': 'code',
+    'uq_team_ext_id': 'external_id',
+}
+
+
+def _translate_integrity_error(error, values):
+    """
+    Convert a team unique-constraint violation into a ValidationError
+    
+    Args:
+        error: IntegrityError raised by the database
+        values: Team values that were being saved (used in the message)
+        
+    Raises:
+        ValidationError: If the error matches a known team constraint
+        IntegrityError: Re-raised for any other constraint violation
+    """
+    diag = getattr(error.__cause__, 'diag', None)
+    field = _UNIQUE_CONSTRAINT_FIELDS.get(getattr(diag, 'constraint_name', None))
+    
+    if field is not None:
+        raise serializers.ValidationError({
+            field: _UNIQUE_MESSAGES[field].format(values.get(field))
+        })
+    
+    raise error
+
+
+def _check_batch_unique_conflicts(items):
+    """
+    Check id, name, code and external_id uniqueness for a batch with a single query
+    
+    Conflicts are reported both against existing teams and between items of
+    the same batch (every occurrence after the first).
+    
+    Args:
+        items: List of validated team attribute dicts
+        
+    Returns:
+        list: One {field: [error message]} dict per item (empty dicts if no conflict)
+    """
+    proposed = {
+        field: {item[field] for item in items if item.get(field)}
+        for field in _UNIQUE_FIELDS
+    }
+    
+    filters = Q()
+    for field, values in proposed.items():
+        if values:
+            filters |= Q(**{f'{field}__in': values})
+    
+    existing = {field: set() for field in _UNIQUE_FIELDS}
+    if filters:
+        for row in Team.objects.filter(filters).values_list(*_UNIQUE_FIELDS):
+            for field, value in zip(_UNIQUE_FIELDS, row):
+                if value in proposed[field]:
+                    existing[field].add(value)
+    
+    seen = {field: set() for field in _UNIQUE_FIELDS}
+    errors = []
+    for item in items:
+        item_errors = {}
+        for field in _UNIQUE_FIELDS:
+            value = item.get(field)
+            if not value:
+                continue
+            if value in existing[field]:
+                item_errors[field] = [_UNIQUE_MESSAGES[field].format(value)]
+            elif value in seen[field]:
+                item_errors[field] = [f"Duplicate {field} '{value}' in request"]
+            seen[field].add(value)
+        errors.append(item_errors)
+    
+    return errors
+
+
+class TeamCreateListSerializer(serializers.ListSerializer):
+    """
+    List serializer for bulk team creation (many=True)
+    
+    Runs the per-item field validators as usual, then checks ids, names,
+    codes and external_ids for the whole batch with one query so conflicts
+    are reported per item before anything is inserted. The database
+    constraints remain the final guard.
+    """
+    
+    def to_internal_value(self, data):
+        """
+        Validate all items, then check uniqueness for the whole batch
+        
+        Raises:
+            ValidationError: List of per-item errors if any item conflicts
+        """
+        validated = super().to_internal_value(data)
+        
+        errors = _check_batch_unique_conflicts(validated)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        
+        return validated
+    
+    def create(self, validated_data):
+        """Create all teams in one transaction (all or nothing)"""
+        with transaction.atomic():
+            return super().create(validated_data)
+
+
+# Team columns rendered by TeamListSerializer / serialize_team_list()
+TEAM_LIST_COLUMNS = (
+    'id', 'code', 'name',
+    'country_name_cached', 'country_code_cached',
+    'logo', 'stadium_name', 'stadium_capacity',
+    'primary_color', 'secondary_color',
+    'market_value', 'is_active',
+)
+
+
+def serialize_team_list(rows):
+    """
+    Build the TeamListSerializer output from .values() rows
+    
+    List endpoints fetch TEAM_LIST_COLUMNS with queryset.values() and pass
+    the (paginated) rows here, skipping Team instantiation and DRF field
+    dispatch per row. Output matches TeamListSerializer exactly.
+    
+    Args:
+        rows: Iterable of dicts with the TEAM_LIST_COLUMNS keys
+        
+    Returns:
+        list: Serialized team dicts
+    """
+    format_market_value = Team.format_market_value
+    return [
+        {
+            'id': str(row['id']),
+            'code': row['code'],
+            'name': row['name'],
+            'country_name': row['country_name_cached'],
+            'country_code': row['country_code_cached'],
+            'logo': row['logo'],
+            'stadium_name': row['stadium_name'],
+            'stadium_capacity': row['stadium_capacity'],
+            'primary_color': row['primary_color'],
+            'secondary_color': row['secondary_color'],
+            'market_value': row['market_value'],
+            'market_value_formatted': format_market_value(row['market_value']),
+            'is_active': row['is_active'],
+        }
+        for row in rows
+    ]
+
+
+class TeamBulkListSerializer(serializers.ListSerializer):
+    """
+    List serializer for TeamListSerializer(many=True)
+    
+    When given a queryset, renders it from .values() rows through
+    serialize_team_list() without materializing Team instances. Lists of
+    instances (e.g. an already evaluated page) use the regular per-item
+    path.
+    """
+    
+    def to_representation(self, data):
+        if isinstance(data, QuerySet):
+            return serialize_team_list(data.values(*TEAM_LIST_COLUMNS))
+        return super().to_representation(data)
 
 
-class TeamListSerializer(serializers.ModelSerializer):
+class TeamListSerializer(serializers.Serializer):
     """
     Lightweight serializer for team list views
     
@@ -30,33 +258,54 @@ class TeamListSerializer(serializers.ModelSerializer):
     - Team colors
     - Status flags (is_active)
     - Market value (formatted)
+    
+    Read-only, so declared as a plain Serializer: no ModelSerializer
+    field introspection or validator setup on the list path. TeamViewSet
+    list actions render through serialize_team_list() instead; this class
+    documents the shape (OpenAPI) and serves callers with model instances.
     """
     
-    country_name = serializers.CharField(source='country.name', read_only=True, allow_null=True)
-    country_code = serializers.CharField(source='country.code', read_only=True, allow_null=True)
+    id = serializers.CharField(read_only=True)
+    code = serializers.CharField(read_only=True, allow_null=True)
+    name = serializers.CharField(read_only=True)
+    # Denormalized on the teams table, so the list needs no JOIN to countries
+    country_name = serializers.CharField(source='country_name_cached', read_only=True, allow_null=True)
+    country_code = serializers.CharField(source='country_code_cached', read_only=True, allow_null=True)
+    logo = serializers.CharField(read_only=True, allow_null=True)
+    stadium_name = serializers.CharField(read_only=True, allow_null=True)
+    stadium_capacity = serializers.IntegerField(read_only=True, allow_null=True)
+    primary_color = serializers.CharField(read_only=True, allow_null=True)
+    secondary_color = serializers.CharField(read_only=True, allow_null=True)
+    market_value = serializers.IntegerField(read_only=True, allow_null=True)
+    # Team.formatted_market_value is a cached_property: formatted once per instance
     market_value_formatted = serializers.CharField(source='formatted_market_value', read_only=True)
+    is_active = serializers.BooleanField(read_only=True)
+    
+    # Exact model columns read by this serializer
+    LIST_ONLY_FIELDS = TEAM_LIST_COLUMNS
     
     class Meta:
-        model = Team
-        fields = [
-            'id',
-            'code',
-            'name',
-            'country_name',
-            'country_code',
-            'logo',
-            'stadium_name',
-            'stadium_capacity',
-            'primary_color',
-            'secondary_color',
-            'market_value',
-            'market_value_formatted',
-            'is_active',
-        ]
-        read_only_fields = ['id']
+        list_serializer_class = TeamBulkListSerializer
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Load only the team columns this serializer renders
+        
+        Country name/code come from the denormalized columns on teams, so
+        the JOIN to countries is dropped. Views must call this from
+        get_queryset() for list-style actions.
+        
+        Args:
+            queryset: Team queryset to optimize
+            
+        Returns:
+            QuerySet: Queryset with only() applied and no related joins
+        """
+        return queryset.select_related(None).only(*cls.LIST_ONLY_FIELDS)
 
 
-class TeamDetailSerializer(serializers.ModelSerializer):
+class TeamDetailSerializer(CachedModelSerializer):
     """
     Comprehensive serializer for team detail views
     
@@ -75,12 +324,15 @@ class TeamDetailSerializer(serializers.ModelSerializer):
     """
     
     # Nested serializers for related objects
-    country_details = serializers.SerializerMethodField()
+    country_details = CountryNestedSerializer(
+        source='country', read_only=True, allow_null=True
+    )
+    # Team.formatted_market_value is a cached_property: formatted once per instance
     market_value_formatted = serializers.CharField(source='formatted_market_value', read_only=True)
     
     class Meta:
         model = Team
-        fields = [
+        fields = (
             'id',
             'code',
             'name',
@@ -99,64 +351,71 @@ class TeamDetailSerializer(serializers.ModelSerializer):
             'is_active',
             'created_at',
             'updated_at',
-        ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        )
+        read_only_fields = ('id', 'created_at', 'updated_at')
+    
+    # Exact model columns (including joined country columns) read by this serializer
+    DETAIL_ONLY_FIELDS = (
+        'id', 'code', 'name', 'country', 'logo',
+        'stadium_name', 'stadium_capacity',
+        'primary_color', 'secondary_color',
+        'founded', 'website', 'market_value',
+        'external_id', 'is_active', 'created_at', 'updated_at',
+        'country__id', 'country__name', 'country__code',
+        'country__flag', 'country__flag_url',
+    )
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Join the country columns rendered in country_details
+        
+        Views must call this from get_queryset() for detail actions.
+        
+        Args:
+            queryset: Team queryset to optimize
+            
+        Returns:
+            QuerySet: Queryset with select_related/only applied
+        """
+        return queryset.select_related('country').only(*cls.DETAIL_ONLY_FIELDS)
     
-    def get_country_details(self, obj):
+    def get_requested_field_names(self):
         """
-        Get nested country information
+        Honor ?fields=a,b on the request (sparse fieldsets)
+        
+        Fields that are not requested are never built, so for example the
+        nested country_details serializer is only copied when asked for.
+        id is always included.
         
         Returns:
-            dict: Country details or None if no country assigned
+            set: Requested field names, or None to build all fields
         """
-        if obj.country:
-            return {
-                'id': str(obj.country.id),
-                'name': obj.country.name,
-                'code': obj.country.code,
-                'flag': obj.country.flag,
-                'flag_url': obj.country.flag_url,
-            }
-        return None
-
-
-class TeamCreateSerializer(serializers.ModelSerializer):
+        request = self.context.get('request')
+        if request is None:
+            return None
+        
+        fields = request.query_params.get('fields')
+        if not fields:
+            return None
+        
+        return {'id', *(name.strip() for name in fields.split(','))}
+
+
+class _TeamValidationMixin:
     """
-    Serializer for creating new teams
+    Field and object validators shared by TeamCreateSerializer and
+    TeamUpdateSerializer
     
-    Used for:
-    - POST /api/v1/teams/ (create new team)
+    The rules are identical for create and update. Uniqueness of id,
+    name, code and external_id is not probed here: the database enforces
+    it and create()/update() translate violations into ValidationErrors.
     
-    Validation:
-    - Ensures team name is unique
-    - Ensures code is unique (if provided)
-    - Validates country_id exists (if provided)
-    - Validates external_id format
-    - Validates website URL format (if provided)
-    - Validates market_value range (if provided)
-    - Validates stadium_capacity is positive (if provided)
-    - Validates primary_color and secondary_color are valid hex colors (if provided)
+    Text input is already trimmed by DRF's CharField (trim_whitespace), so
+    the validators below never strip() again; they only check and, where
+    needed, uppercase the value.
     """
     
-    class Meta:
-        model = Team
-        fields = [
-            'id',  # Can be provided or auto-generated
-            'code',
-            'name',
-            'country',
-            'logo',
-            'stadium_name',
-            'stadium_capacity',
-            'primary_color',
-            'secondary_color',
-            'founded',
-            'website',
-            'market_value',
-            'external_id',
-            'is_active',
-        ]
-    
     def validate_name(self, value):
         """
         Validate team name
@@ -164,7 +423,7 @@ class TeamCreateSerializer(serializers.ModelSerializer):
         Rules:
         - Must not be empty
         - Must be at least 2 characters
-        - Should be unique
+        - Must be unique (enforced by the database)
         
         Args:
             value: Team name to validate
@@ -175,18 +434,10 @@ class TeamCreateSerializer(serializers.ModelSerializer):
         Raises:
             ValidationError: If validation fails
         """
-        if not value or len(value.strip()) < 2:
-            raise serializers.ValidationError(
-                "Team name must be at least 2 characters long"
-            )
-        
-        # Check for duplicate name
-        if Team.objects.filter(name=value.strip()).exists():
-            raise serializers.ValidationError(
-                f"A team named '{value.strip()}' already exists"
-            )
+        if not value or len(value) < 2:
+            raise serializers.ValidationError(_NAME_ERROR_SHORT)
         
-        return value.strip()
+        return value
     
     def validate_code(self, value):
         """
@@ -195,7 +446,7 @@ class TeamCreateSerializer(serializers.ModelSerializer):
         Rules:
         - If provided, must be 2-10 characters
         - Should be uppercase letters/numbers only
-        - Must be unique
+        - Must be unique (enforced by the database)
         
         Args:
             value: Team code to validate
@@ -209,40 +460,17 @@ class TeamCreateSerializer(serializers.ModelSerializer):
         if not value:
             return value
         
-        code = value.strip().upper()
+        code = value.upper()
         
         if len(code) < 2 or len(code) > 10:
-            raise serializers.ValidationError(
-                "Team code must be between 2-10 characters"
-            )
+            raise serializers.ValidationError(_CODE_ERROR_LENGTH)
         
-        # Check for duplicate code
-        if Team.objects.filter(code=code).exists():
-            raise serializers.ValidationError(
-                f"Team code '{code}' is already in use"
-            )
+        # Letters/numbers only (str methods, no regex)
+        if not (code.isascii() and code.isalnum()):
+            raise serializers.ValidationError(_CODE_ERROR_CHARS)
         
         return code
     
-    def validate_stadium_name(self, value):
-        """
-        Validate stadium name
-        
-        Rules:
-        - Optional field
-        - Trim whitespace
-        
-        Args:
-            value: Stadium name to validate
-            
-        Returns:
-            str: Validated stadium name
-        """
-        if not value:
-            return value
-        
-        return value.strip()
-    
     def validate_stadium_capacity(self, value):
         """
         Validate stadium capacity
@@ -263,28 +491,22 @@ class TeamCreateSerializer(serializers.ModelSerializer):
         if value is None:
             return value
         
-        if value < 1:
-            raise serializers.ValidationError(
-                "Stadium capacity must be a positive number"
-            )
-        
-        if value > 150000:
+        if not _STADIUM_CAPACITY_MIN <= value <= _STADIUM_CAPACITY_MAX:
             raise serializers.ValidationError(
-                "Stadium capacity cannot exceed 150,000"
+                _STADIUM_CAPACITY_ERROR_MIN if value < _STADIUM_CAPACITY_MIN
+                else _STADIUM_CAPACITY_ERROR_MAX
             )
         
         return value
     
-    def validate_primary_color(self, value):
+    def _validate_hex_color(self, value, label, example):
         """
-        Validate primary color hex code
-        
-        Rules:
-        - Must be valid hex color format if provided
-        - Format: #RRGGBB (e.g., #FF0000 for red)
+        Validate a #RRGGBB hex color shared by primary/secondary colors
         
         Args:
             value: Hex color code to validate
+            label: Field label used in the error message
+            example: Example color shown in the error message
             
         Returns:
             str: Validated hex color (uppercase)
@@ -295,16 +517,35 @@ class TeamCreateSerializer(serializers.ModelSerializer):
         if not value:
             return value
         
-        color = value.strip().upper()
+        color = value.upper()
         
         # Check hex color format (#RRGGBB)
-        if not re.match(r'^#[0-9A-F]{6}$', color):
+        if len(color) != 7 or color[0] != '#' or not _HEX_DIGITS.issuperset(color[1:]):
             raise serializers.ValidationError(
-                "Primary color must be a valid hex color code (e.g., #FF0000)"
+                f"{label} color must be a valid hex color code (e.g., {example})"
             )
         
         return color
     
+    def validate_primary_color(self, value):
+        """
+        Validate primary color hex code
+        
+        Rules:
+        - Must be valid hex color format if provided
+        - Format: #RRGGBB (e.g., #FF0000 for red)
+        
+        Args:
+            value: Hex color code to validate
+            
+        Returns:
+            str: Validated hex color (uppercase)
+            
+        Raises:
+            ValidationError: If validation fails
+        """
+        return self._validate_hex_color(value, 'Primary', '#FF0000')
+    
     def validate_secondary_color(self, value):
         """
         Validate secondary color hex code
@@ -322,18 +563,7 @@ class TeamCreateSerializer(serializers.ModelSerializer):
         Raises:
             ValidationError: If validation fails
         """
-        if not value:
-            return value
-        
-        color = value.strip().upper()
-        
-        # Check hex color format (#RRGGBB)
-        if not re.match(r'^#[0-9A-F]{6}$', color):
-            raise serializers.ValidationError(
-                "Secondary color must be a valid hex color code (e.g., #0000FF)"
-            )
-        
-        return color
+        return self._validate_hex_color(value, 'Secondary', '#0000FF')
     
     def validate_founded(self, value):
         """
@@ -354,12 +584,11 @@ class TeamCreateSerializer(serializers.ModelSerializer):
         if value is None:
             return value
         
-        from datetime import datetime
-        current_year = datetime.now().year
+        max_year = _max_founded_year()
         
-        if value < 1800 or value > current_year + 1:
+        if not _MIN_FOUNDED_YEAR <= value <= max_year:
             raise serializers.ValidationError(
-                f"Foundation year must be between 1800 and {current_year + 1}"
+                f"Foundation year must be between {_MIN_FOUNDED_YEAR} and {max_year}"
             )
         
         return value
@@ -384,14 +613,9 @@ class TeamCreateSerializer(serializers.ModelSerializer):
         if value is None:
             return value
         
-        if value < 0:
-            raise serializers.ValidationError(
-                "Market value cannot be negative"
-            )
-        
-        if value > 10_000_000_000:  # 10 billion EUR
+        if not 0 <= value <= _MARKET_VALUE_MAX:
             raise serializers.ValidationError(
-                "Market value cannot exceed €10 billion"
+                _MARKET_VALUE_ERROR_NEG if value < 0 else _MARKET_VALUE_ERROR_MAX
             )
         
         return value
@@ -402,7 +626,7 @@ class TeamCreateSerializer(serializers.ModelSerializer):
         
         Rules:
         - If provided, must be valid URL format
-        - Must start with http:// or https://
+        - Must start with http:// or https:// (any case)
         
         Args:
             value: Website URL
@@ -416,44 +640,88 @@ class TeamCreateSerializer(serializers.ModelSerializer):
         if not value:
             return value
         
-        url = value.strip()
+        # Schemes are case-insensitive; only the 8-char prefix is lowered
+        if not value[:8].lower().startswith(_URL_PREFIXES):
+            raise serializers.ValidationError(_WEBSITE_ERROR_SCHEME)
         
-        if not (url.startswith('http://') or url.startswith('https://')):
-            raise serializers.ValidationError(
-                "Website URL must start with http:// or https://"
-            )
-        
-        return url
+        return value
     
-    def validate(self, attrs):
+    def create(self, validated_data):
         """
-        Validate entire team object
+        Create team, relying on database constraints for uniqueness
         
-        Rules:
-        - Check for duplicate external_id if provided
+        Duplicate ids, names, codes and external_ids are rejected
+        atomically by the database instead of a SELECT before the INSERT.
         
         Args:
-            attrs: Dictionary of all team attributes
+            validated_data: Dictionary of validated team attributes
             
         Returns:
-            dict: Validated attributes
+            Team: Newly created team
             
         Raises:
-            ValidationError: If validation fails
+            ValidationError: If a unique constraint is violated
         """
-        external_id = attrs.get('external_id')
-        
-        # Check for duplicate external_id
-        if external_id:
-            if Team.objects.filter(external_id=external_id).exists():
-                raise serializers.ValidationError({
-                    'external_id': f"A team with external_id '{external_id}' already exists"
-                })
-        
-        return attrs
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError as e:
+            _translate_integrity_error(e, validated_data)
+    
+    def update(self, instance, validated_data):
+        """Update team, relying on database constraints for uniqueness"""
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError as e:
+            _translate_integrity_error(e, validated_data)
+
+
+class TeamCreateSerializer(_TeamValidationMixin, CachedModelSerializer):
+    """
+    Serializer for creating new teams
+    
+    Used for:
+    - POST /api/v1/teams/ (create new team)
+    
+    Validation:
+    - Ensures team name is unique
+    - Ensures code is unique (if provided)
+    - Uniqueness of id/name/code/external_id is enforced by the database
+    - Validates country_id exists (if provided)
+    - Validates external_id format
+    - Validates website URL format (if provided)
+    - Validates market_value range (if provided)
+    - Validates stadium_capacity is positive (if provided)
+    - Validates primary_color and secondary_color are valid hex colors (if provided)
+    
+    Bulk creation (many=True) uses TeamCreateListSerializer.
+    """
+    
+    class Meta:
+        model = Team
+        list_serializer_class = TeamCreateListSerializer
+        fields = (
+            'id',  # Can be provided or auto-generated
+            'code',
+            'name',
+            'country',
+            'logo',
+            'stadium_name',
+            'stadium_capacity',
+            'primary_color',
+            'secondary_color',
+            'founded',
+            'website',
+            'market_value',
+            'external_id',
+            'is_active',
+        )
+        # id uniqueness is enforced by the database (teams_pkey) like name/code/external_id
+        extra_kwargs = {'id': {'validators': []}}
 
 
-class TeamUpdateSerializer(serializers.ModelSerializer):
+class TeamUpdateSerializer(_TeamValidationMixin, CachedModelSerializer):
     """
     Serializer for updating existing teams
     
@@ -476,7 +744,7 @@ class TeamUpdateSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Team
-        fields = [
+        fields = (
             'code',
             'name',
             'country',
@@ -490,159 +758,4 @@ class TeamUpdateSerializer(serializers.ModelSerializer):
             'market_value',
             'external_id',
             'is_active',
-        ]
-    
-    def validate_name(self, value):
-        """Validate team name on update"""
-        if not value or len(value.strip()) < 2:
-            raise serializers.ValidationError(
-                "Team name must be at least 2 characters long"
-            )
-        
-        # Check for duplicate name (excluding current team)
-        instance = self.instance
-        if Team.objects.filter(name=value.strip()).exclude(id=instance.id).exists():
-            raise serializers.ValidationError(
-                f"A team named '{value.strip()}' already exists"
-            )
-        
-        return value.strip()
-    
-    def validate_code(self, value):
-        """Validate team code on update"""
-        if not value:
-            return value
-        
-        code = value.strip().upper()
-        
-        if len(code) < 2 or len(code) > 10:
-            raise serializers.ValidationError(
-                "Team code must be between 2-10 characters"
-            )
-        
-        # Check for duplicate code (excluding current team)
-        instance = self.instance
-        if Team.objects.filter(code=code).exclude(id=instance.id).exists():
-            raise serializers.ValidationError(
-                f"Team code '{code}' is already in use"
-            )
-        
-        return code
-    
-    def validate_stadium_name(self, value):
-        """Validate stadium name on update"""
-        if not value:
-            return value
-        
-        return value.strip()
-    
-    def validate_stadium_capacity(self, value):
-        """Validate stadium capacity on update"""
-        if value is None:
-            return value
-        
-        if value < 1:
-            raise serializers.ValidationError(
-                "Stadium capacity must be a positive number"
-            )
-        
-        if value > 150000:
-            raise serializers.ValidationError(
-                "Stadium capacity cannot exceed 150,000"
-            )
-        
-        return value
-    
-    def validate_primary_color(self, value):
-        """Validate primary color on update"""
-        if not value:
-            return value
-        
-        color = value.strip().upper()
-        
-        if not re.match(r'^#[0-9A-F]{6}$', color):
-            raise serializers.ValidationError(
-                "Primary color must be a valid hex color code (e.g., #FF0000)"
-            )
-        
-        return color
-    
-    def validate_secondary_color(self, value):
-        """Validate secondary color on update"""
-        if not value:
-            return value
-        
-        color = value.strip().upper()
-        
-        if not re.match(r'^#[0-9A-F]{6}$', color):
-            raise serializers.ValidationError(
-                "Secondary color must be a valid hex color code (e.g., #0000FF)"
-            )
-        
-        return color
-    
-    def validate_founded(self, value):
-        """Validate foundation year on update"""
-        if value is None:
-            return value
-        
-        from datetime import datetime
-        current_year = datetime.now().year
-        
-        if value < 1800 or value > current_year + 1:
-            raise serializers.ValidationError(
-                f"Foundation year must be between 1800 and {current_year + 1}"
-            )
-        
-        return value
-    
-    def validate_market_value(self, value):
-        """Validate market value on update"""
-        if value is None:
-            return value
-        
-        if value < 0:
-            raise serializers.ValidationError(
-                "Market value cannot be negative"
-            )
-        
-        if value > 10_000_000_000:
-            raise serializers.ValidationError(
-                "Market value cannot exceed €10 billion"
-            )
-        
-        return value
-    
-    def validate_website(self, value):
-        """Validate website URL on update"""
-        if not value:
-            return value
-        
-        url = value.strip()
-        
-        if not (url.startswith('http://') or url.startswith('https://')):
-            raise serializers.ValidationError(
-                "Website URL must start with http:// or https://"
-            )
-        
-        return url
-    
-    def validate(self, attrs):
-        """
-        Validate team update
-        
-        Rules:
-        - Check for external_id conflicts (excluding current team)
-        """
-        external_id = attrs.get('external_id')
-        instance = self.instance
-        
-        # Check for duplicate external_id (excluding self)
-        if external_id:
-            qs = Team.objects.filter(external_id=external_id).exclude(id=instance.id)
-            if qs.exists():
-                raise serializers.ValidationError({
-                    'external_id': f"A team with external_id '{external_id}' already exists"
-                })
-        
-        return attrs
+        )
@@ -8,9 +8,161 @@ Author: Oover Development Team
 Date: November 2025
 """
 
+from collections.abc import Mapping
+
+from django.db import IntegrityError, transaction
+from django.db.models import QuerySet
+from django.db.models.fields.json import KeyTransform
 from rest_framework import serializers
 from apps.core.models import TeamStatistics, Team, League
-import re
+
+
+_MIN_SEASON_YEAR = 1900
+_MAX_SEASON_YEAR = 2100
+_SEASON_ERROR_FORMAT = (
+    "Season must be in format YYYY or YYYY-YYYY (e.g., '2025' or '2024-2025')"
+)
+
+# Unique constraints on team_statistics (see migration 007). Duplicates
+# are rejected by the database and translated in create()/update().
+_KEY_CONSTRAINT = 'unique_team_league_season_stats'
+_EXTERNAL_ID_CONSTRAINT = 'uq_team_stats_ext_id'
+_EXTERNAL_ID_MESSAGE = "Statistics with external_id '{}' already exist"
+
+
+def _violated_constraint(error):
+    """Return the constraint name reported for an IntegrityError, if any"""
+    diag = getattr(error.__cause__, 'diag', None)
+    return getattr(diag, 'constraint_name', None)
+
+
+# Upper bound on top-level statistics keys (real payloads have about 10)
+_MAX_STATISTICS_KEYS = 64
+
+# Top-level statistics keys that must hold non-negative integers
+_NON_NEGATIVE_INT_KEYS = ('clean_sheets', 'failed_to_score')
+
+
+def _statistics_path(*keys):
+    """Build a JSONB path lookup (statistics->k1->k2...) keeping the JSON value type"""
+    expression = 'statistics'
+    for key in keys:
+        expression = KeyTransform(key, expression)
+    return expression
+
+
+# Derived statistics extracted by the database with JSONB path lookups.
+# The names match the TeamStatistics cached properties: annotated
+# instances get those values pre-filled, and .values() rows no longer need
+# the whole statistics column. goal_difference stays in Python (it only
+# subtracts the two annotated totals).
+STATISTICS_ANNOTATIONS = {
+    'goals_for': _statistics_path('goals', 'for', 'total'),
+    'goals_against': _statistics_path('goals', 'against', 'total'),
+    'clean_sheets': _statistics_path('clean_sheets'),
+    'average_possession': _statistics_path('possession', 'average'),
+    'pass_accuracy': _statistics_path('passes', 'accuracy'),
+}
+
+
+def annotate_statistics(queryset):
+    """
+    Annotate a TeamStatistics queryset with STATISTICS_ANNOTATIONS
+    
+    Annotations already present on the queryset are left untouched, so
+    calling this twice is harmless.
+    
+    Args:
+        queryset: TeamStatistics queryset
+        
+    Returns:
+        QuerySet: Queryset with the derived statistics annotated
+    """
+    missing = {
+        name: expression
+        for name, expression in STATISTICS_ANNOTATIONS.items()
+        if name not in queryset.query.annotations
+    }
+    return queryset.annotate(**missing) if missing else queryset
+
+
+def _goal_difference(goals_for, goals_against):
+    """goals_for - goals_against, or None unless both are JSON numbers"""
+    for goals in (goals_for, goals_against):
+        if not isinstance(goals, (int, float)) or isinstance(goals, bool):
+            return None
+    return goals_for - goals_against
+
+
+# Columns read by the team statistics list endpoints (.values() fast path).
+# The JSONB statistics column itself is not fetched; see STATISTICS_ANNOTATIONS.
+TEAM_STATISTICS_LIST_COLUMNS = (
+    'id', 'team_id', 'team__name', 'team__code', 'league_id', 'league__name',
+    'season', 'goals_for', 'goals_against', 'clean_sheets',
+    'created_at', 'updated_at',
+)
+
+# Unbound field used only for its DRF datetime formatting
+_DATETIME_FIELD = serializers.DateTimeField()
+
+
+def serialize_team_statistics_list(rows):
+    """
+    Build the TeamStatisticsListSerializer output from .values() rows
+    
+    Goal and clean sheet figures come from the STATISTICS_ANNOTATIONS
+    columns, so the JSONB statistics dict is never loaded into Python.
+    Output matches TeamStatisticsListSerializer.
+    
+    Args:
+        rows: Iterable of dicts with the TEAM_STATISTICS_LIST_COLUMNS keys
+              (queryset passed through annotate_statistics())
+        
+    Returns:
+        list: Serialized team statistics dicts
+    """
+    format_datetime = _DATETIME_FIELD.to_representation
+    data = []
+    
+    for row in rows:
+        goals_for = row['goals_for']
+        goals_against = row['goals_against']
+        updated_at = row['updated_at']
+        
+        data.append({
+            'id': str(row['id']),
+            'team': row['team_id'],
+            'team_name': row['team__name'],
+            'team_code': row['team__code'],
+            'league': row['league_id'],
+            'league_name': row['league__name'],
+            'season': row['season'],
+            'goals_for_total': goals_for,
+            'goals_against_total': goals_against,
+            'goal_diff': _goal_difference(goals_for, goals_against),
+            'clean_sheets_count': row['clean_sheets'],
+            'created_at': format_datetime(row['created_at']),
+            'updated_at': format_datetime(updated_at) if updated_at is not None else None,
+        })
+    
+    return data
+
+
+class TeamStatisticsBulkListSerializer(serializers.ListSerializer):
+    """
+    List serializer for TeamStatisticsListSerializer(many=True)
+    
+    When given a queryset, renders it from .values() rows through
+    serialize_team_statistics_list(). Lists of instances use the regular
+    per-item path.
+    """
+    
+    def to_representation(self, data):
+        if isinstance(data, QuerySet):
+            return serialize_team_statistics_list(
+                annotate_statistics(data).values(*TEAM_STATISTICS_LIST_COLUMNS)
+            )
+        return super().to_representation(data)
 
 
 class TeamStatisticsListSerializer(serializers.ModelSerializer):
@@ -57,6 +209,25 @@ class TeamStatisticsListSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
+        list_serializer_class = TeamStatisticsBulkListSerializer
+
+
+class _TeamMiniSerializer(serializers.ModelSerializer):
+    """Read-only team summary nested in team statistics details"""
+    
+    class Meta:
+        model = Team
+        fields = ('id', 'name', 'code', 'logo')
+        read_only_fields = fields
+
+
+class _LeagueMiniSerializer(serializers.ModelSerializer):
+    """Read-only league summary nested in team statistics details"""
+    
+    class Meta:
+        model = League
+        fields = ('id', 'name', 'logo', 'tier')
+        read_only_fields = fields
 
 
 class TeamStatisticsDetailSerializer(serializers.ModelSerializer):
@@ -75,9 +246,10 @@ class TeamStatisticsDetailSerializer(serializers.ModelSerializer):
     - Full timestamps
     """
     
-    # Nested serializers for related objects
-    team_details = serializers.SerializerMethodField()
-    league_details = serializers.SerializerMethodField()
+    # Nested serializers for related objects (rendered from the
+    # select_related('team', 'league') rows of the viewset queryset)
+    team_details = _TeamMiniSerializer(source='team', read_only=True)
+    league_details = _LeagueMiniSerializer(source='league', read_only=True)
     
     # Computed properties from JSONB statistics field
     goals_for_total = serializers.IntegerField(source='goals_for', read_only=True)
@@ -108,67 +280,17 @@ class TeamStatisticsDetailSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
-    
-    def get_team_details(self, obj):
-        """
-        Get nested team information
-        
-        Returns:
-            dict: Team details or None
-        """
-        if obj.team:
-            return {
-                'id': str(obj.team.id),
-                'name': obj.team.name,
-                'code': obj.team.code,
-                'logo': obj.team.logo,
-            }
-        return None
-    
-    def get_league_details(self, obj):
-        """
-        Get nested league information
-        
-        Returns:
-            dict: League details or None
-        """
-        if obj.league:
-            return {
-                'id': str(obj.league.id),
-                'name': obj.league.name,
-                'logo': obj.league.logo,
-                'tier': obj.league.tier,
-            }
-        return None
 
 
-class TeamStatisticsCreateSerializer(serializers.ModelSerializer):
+class _SeasonStatsValidationMixin:
     """
-    Serializer for creating new team statistics records
-    
-    Used for:
-    - POST /api/v1/team-statistics/ (create new statistics)
+    Field validators shared by TeamStatisticsCreateSerializer and
+    TeamStatisticsUpdateSerializer
     
-    Validation:
-    - Ensures team exists
-    - Ensures league exists
-    - Validates season format (YYYY or YYYY-YYYY)
-    - Validates statistics JSONB structure
-    - Ensures no duplicate (team, league, season) combination
-    - Validates external_id format (if provided)
+    Season and statistics rules are identical for create and update, so
+    both serializers inherit the same method objects from here.
     """
     
-    class Meta:
-        model = TeamStatistics
-        fields = [
-            'id',  # Can be provided or auto-generated
-            'team',
-            'league',
-            'season',
-            'statistics',
-            'external_id',
-        ]
-    
     def validate_season(self, value):
         """
         Validate season format
@@ -190,29 +312,41 @@ class TeamStatisticsCreateSerializer(serializers.ModelSerializer):
         if not value:
             raise serializers.ValidationError("Season is required")
         
+        # Seasons are short fixed-width strings, so they are parsed with
+        # slicing and str.isdigit() instead of a regex. isascii() rules out
+        # non-ASCII digits that isdigit() would otherwise accept.
+        if not value.isascii():
+            raise serializers.ValidationError(_SEASON_ERROR_FORMAT)
+        
         # Check single year format (e.g., "2025")
-        if re.match(r'^\d{4}$', value):
+        if len(value) == 4 and value.isdigit():
             year = int(value)
-            if year < 1900 or year > 2100:
+            if not _MIN_SEASON_YEAR <= year <= _MAX_SEASON_YEAR:
                 raise serializers.ValidationError(
-                    "Season year must be between 1900 and 2100"
+                    f"Season year must be between {_MIN_SEASON_YEAR} and {_MAX_SEASON_YEAR}"
                 )
             return value
         
         # Check year range format (e.g., "2024-2025")
-        match = re.match(r'^(\d{4})-(\d{4})$', value)
-        if match:
-            year1 = int(match.group(1))
-            year2 = int(match.group(2))
+        if (
+            len(value) == 9 and value[4] == '-'
+            and value[:4].isdigit() and value[5:].isdigit()
+        ):
+            year1 = int(value[:4])
+            year2 = int(value[5:])
+            
+            # Common case: a valid consecutive range within bounds
+            if _MIN_SEASON_YEAR <= year1 < _MAX_SEASON_YEAR and year2 == year1 + 1:
+                return value
             
-            if year1 < 1900 or year1 > 2100:
+            if not _MIN_SEASON_YEAR <= year1 <= _MAX_SEASON_YEAR:
                 raise serializers.ValidationError(
-                    "First season year must be between 1900 and 2100"
+                    f"First season year must be between {_MIN_SEASON_YEAR} and {_MAX_SEASON_YEAR}"
                 )
             
-            if year2 < 1900 or year2 > 2100:
+            if not _MIN_SEASON_YEAR <= year2 <= _MAX_SEASON_YEAR:
                 raise serializers.ValidationError(
-                    "Second season year must be between 1900 and 2100"
+                    f"Second season year must be between {_MIN_SEASON_YEAR} and {_MAX_SEASON_YEAR}"
                 )
             
             if year2 != year1 + 1:
@@ -222,9 +356,7 @@ class TeamStatisticsCreateSerializer(serializers.ModelSerializer):
             
             return value
         
-        raise serializers.ValidationError(
-            "Season must be in format YYYY or YYYY-YYYY (e.g., '2025' or '2024-2025')"
-        )
+        raise serializers.ValidationError(_SEASON_ERROR_FORMAT)
     
     def validate_statistics(self, value):
         """
@@ -233,7 +365,7 @@ class TeamStatisticsCreateSerializer(serializers.ModelSerializer):
         Rules:
         - Can be None/empty
         - If provided, must be a valid dict
-        - If provided, should have expected structure (goals, shots, etc.)
+        - Unknown top-level keys are accepted (at most 64 keys)
         - Numeric values should be non-negative
         
         Args:
@@ -253,81 +385,92 @@ class TeamStatisticsCreateSerializer(serializers.ModelSerializer):
                 "Statistics must be a JSON object"
             )
         
-        # Optional: Validate structure if provided
-        # This is a basic validation - you can make it more strict if needed
-        valid_keys = {
-            'goals', 'shots', 'possession', 'passes', 'corners',
-            'fouls', 'cards', 'clean_sheets', 'failed_to_score', 'discipline'
-        }
-        
-        for key in value.keys():
-            if key not in valid_keys:
-                # Warning: Unknown key, but not blocking
-                pass
+        if len(value) > _MAX_STATISTICS_KEYS:
+            raise serializers.ValidationError(
+                f"Statistics cannot have more than {_MAX_STATISTICS_KEYS} top-level keys"
+            )
         
         # Validate numeric fields are non-negative
-        if 'clean_sheets' in value:
-            if not isinstance(value['clean_sheets'], int) or value['clean_sheets'] < 0:
-                raise serializers.ValidationError(
-                    "clean_sheets must be a non-negative integer"
-                )
-        
-        if 'failed_to_score' in value:
-            if not isinstance(value['failed_to_score'], int) or value['failed_to_score'] < 0:
-                raise serializers.ValidationError(
-                    "failed_to_score must be a non-negative integer"
-                )
+        for key in _NON_NEGATIVE_INT_KEYS:
+            if key in value:
+                count = value[key]
+                if not isinstance(count, int) or count < 0:
+                    raise serializers.ValidationError(
+                        f"{key} must be a non-negative integer"
+                    )
         
         return value
+
+
+class TeamStatisticsCreateSerializer(_SeasonStatsValidationMixin, serializers.ModelSerializer):
+    """
+    Serializer for creating new team statistics records
+    
+    Used for:
+    - POST /api/v1/team-statistics/ (create new statistics)
     
-    def validate(self, attrs):
+    Validation:
+    - Ensures team exists
+    - Ensures league exists
+    - Validates season format (YYYY or YYYY-YYYY)
+    - Validates statistics JSONB structure
+    - Ensures no duplicate (team, league, season) combination
+      (database constraint, translated in create())
+    - Ensures external_id is unique (if provided)
+    """
+    
+    class Meta:
+        model = TeamStatistics
+        fields = [
+            'id',  # Can be provided or auto-generated
+            'team',
+            'league',
+            'season',
+            'statistics',
+            'external_id',
+        ]
+        # create() only needs the names for its error message, so the
+        # related lookups never load the full team/league rows
+        extra_kwargs = {
+            'team': {'queryset': Team.objects.only('id', 'name')},
+            'league': {'queryset': League.objects.only('id', 'name')},
+        }
+    
+    def create(self, validated_data):
         """
-        Validate entire team statistics object
+        Create the record, translating unique-constraint violations
         
-        Rules:
-        - Check for duplicate (team, league, season) combination
-        - Check for duplicate external_id if provided
-        - Ensure team and league exist
+        Duplicates are rejected by the database (_KEY_CONSTRAINT,
+        _EXTERNAL_ID_CONSTRAINT) instead of being probed before the INSERT.
         
-        Args:
-            attrs: Dictionary of all attributes
-            
-        Returns:
-            dict: Validated attributes
-            
         Raises:
-            ValidationError: If validation fails
+            ValidationError: If the (team, league, season) or external_id
+                             is already used
         """
-        team = attrs.get('team')
-        league = attrs.get('league')
-        season = attrs.get('season')
-        external_id = attrs.get('external_id')
-        
-        # Check for duplicate (team, league, season)
-        qs = TeamStatistics.objects.filter(
-            team=team,
-            league=league,
-            season=season
-        )
-        
-        if qs.exists():
-            raise serializers.ValidationError({
-                'non_field_errors': [
-                    f"Statistics for {team.name} in {league.name} for season {season} already exist"
-                ]
-            })
-        
-        # Check for duplicate external_id
-        if external_id:
-            if TeamStatistics.objects.filter(external_id=external_id).exists():
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError as error:
+            constraint = _violated_constraint(error)
+            if constraint == _KEY_CONSTRAINT:
+                team = validated_data['team']
+                league = validated_data['league']
+                season = validated_data['season']
                 raise serializers.ValidationError({
-                    'external_id': f"Statistics with external_id '{external_id}' already exist"
+                    'non_field_errors': [
+                        f"Statistics for {team.name} in {league.name} for season {season} already exist"
+                    ]
                 })
-        
-        return attrs
+            if constraint == _EXTERNAL_ID_CONSTRAINT:
+                raise serializers.ValidationError({
+                    'external_id': [
+                        _EXTERNAL_ID_MESSAGE.format(validated_data.get('external_id'))
+                    ]
+                })
+            raise
 
 
-class TeamStatisticsUpdateSerializer(serializers.ModelSerializer):
+class TeamStatisticsUpdateSerializer(_SeasonStatsValidationMixin, serializers.ModelSerializer):
     """
     Serializer for updating existing team statistics
     
@@ -354,103 +497,39 @@ class TeamStatisticsUpdateSerializer(serializers.ModelSerializer):
             'external_id',
         ]
     
-    def validate_season(self, value):
-        """Validate season format on update"""
-        if not value:
-            raise serializers.ValidationError("Season is required")
-        
-        # Check single year format (e.g., "2025")
-        if re.match(r'^\d{4}$', value):
-            year = int(value)
-            if year < 1900 or year > 2100:
-                raise serializers.ValidationError(
-                    "Season year must be between 1900 and 2100"
-                )
-            return value
-        
-        # Check year range format (e.g., "2024-2025")
-        match = re.match(r'^(\d{4})-(\d{4})$', value)
-        if match:
-            year1 = int(match.group(1))
-            year2 = int(match.group(2))
-            
-            if year1 < 1900 or year1 > 2100:
-                raise serializers.ValidationError(
-                    "First season year must be between 1900 and 2100"
-                )
-            
-            if year2 < 1900 or year2 > 2100:
-                raise serializers.ValidationError(
-                    "Second season year must be between 1900 and 2100"
-                )
-            
-            if year2 != year1 + 1:
-                raise serializers.ValidationError(
-                    "For YYYY-YYYY format, second year must be first year + 1"
-                )
-            
-            return value
-        
-        raise serializers.ValidationError(
-            "Season must be in format YYYY or YYYY-YYYY (e.g., '2025' or '2024-2025')"
-        )
-    
-    def validate_statistics(self, value):
-        """Validate statistics JSONB structure on update"""
-        if value is None:
-            return value
-        
-        if not isinstance(value, dict):
-            raise serializers.ValidationError(
-                "Statistics must be a JSON object"
-            )
-        
-        # Validate numeric fields are non-negative
-        if 'clean_sheets' in value:
-            if not isinstance(value['clean_sheets'], int) or value['clean_sheets'] < 0:
-                raise serializers.ValidationError(
-                    "clean_sheets must be a non-negative integer"
-                )
-        
-        if 'failed_to_score' in value:
-            if not isinstance(value['failed_to_score'], int) or value['failed_to_score'] < 0:
-                raise serializers.ValidationError(
-                    "failed_to_score must be a non-negative integer"
-                )
-        
-        return value
-    
-    def validate(self, attrs):
+    def to_internal_value(self, data):
         """
-        Validate team statistics update
+        Drop an unchanged season from PATCH payloads before field validation
         
-        Rules:
-        - If season is changed, check for conflicts
-        - Check for external_id conflicts (excluding current record)
+        Clients often echo the current season back; it is neither
+        re-validated nor re-written.
         """
-        instance = self.instance
-        season = attrs.get('season', instance.season)
-        external_id = attrs.get('external_id')
-        
-        # Check for duplicate (team, league, season) if season changed
-        if season != instance.season:
-            qs = TeamStatistics.objects.filter(
-                team=instance.team,
-                league=instance.league,
-                season=season
-            ).exclude(id=instance.id)
-            
-            if qs.exists():
+        if (
+            self.partial and self.instance is not None
+            and isinstance(data, Mapping)
+            and data.get('season') == self.instance.season
+        ):
+            data = {key: value for key, value in data.items() if key != 'season'}
+        return super().to_internal_value(data)
+    
+    def update(self, instance, validated_data):
+        """Update the record, translating unique-constraint violations"""
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError as error:
+            constraint = _violated_constraint(error)
+            if constraint == _KEY_CONSTRAINT:
+                season = validated_data.get('season', instance.season)
                 raise serializers.ValidationError({
-                    'season': f"Statistics for this team in this league for season {season} already exist"
+                    'season': [
+                        f"Statistics for this team in this league for season {season} already exist"
+                    ]
                 })
-        
-        # Check for duplicate external_id (excluding self)
-        if external_id:
-            qs = TeamStatistics.objects.filter(external_id=external_id).exclude(id=instance.id)
-            if qs.exists():
+            if constraint == _EXTERNAL_ID_CONSTRAINT:
                 raise serializers.ValidationError({
-                    'external_id': f"Statistics with external_id '{external_id}' already exist"
+                    'external_id': [
+                        _EXTERNAL_ID_MESSAGE.format(validated_data.get('external_id'))
+                    ]
                 })
-        
-        return attrs
+            raise
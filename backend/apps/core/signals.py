@@ -0,0 +1,25 @@
+"""
+Signal Handlers for Core App
+
+Connected in CoreConfig.ready().
+
+Author: Oover Development Team
+Date: November 2025
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.cache import invalidate_stats_cache
+from apps.core.models import Country, League, Team
+
+
+@receiver(post_save, sender=Country)
+@receiver(post_save, sender=League)
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Country)
+@receiver(post_delete, sender=League)
+@receiver(post_delete, sender=Team)
+def invalidate_stats_on_write(sender, **kwargs):
+    """Drop cached aggregate responses when a row they count changes"""
+    invalidate_stats_cache()
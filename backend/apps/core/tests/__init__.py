@@ -1 +1,3 @@
-file content will be read from /home/claude/backend/apps/core/tests/__init__.py
\ No newline at end of file
+"""
+Tests for the Core App
+"""
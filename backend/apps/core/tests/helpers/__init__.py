@@ -1 +1,3 @@
-file content will be read from /home/claude/backend/apps/core/tests/helpers/__init__.py
\ No newline at end of file
+"""
+Shared helpers for the Core App tests
+"""
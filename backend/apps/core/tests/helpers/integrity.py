@@ -0,0 +1,19 @@
+"""
+IntegrityErrors shaped like the PostgreSQL driver's
+
+The serializers read the violated constraint from the psycopg error
+(error.__cause__.diag.constraint_name), which SQLite does not provide.
+"""
+
+from types import SimpleNamespace
+
+from django.db import IntegrityError
+
+
+def integrity_error(constraint_name):
+    """IntegrityError reporting a violation of `constraint_name`"""
+    cause = Exception(f'duplicate key value violates unique constraint "{constraint_name}"')
+    cause.diag = SimpleNamespace(constraint_name=constraint_name)
+    error = IntegrityError(*cause.args)
+    error.__cause__ = cause
+    return error
@@ -0,0 +1,31 @@
+"""
+Test database tables for the unmanaged core models
+
+The core tables are created by the Supabase SQL migrations, not by Django,
+so the test database starts without them.
+"""
+
+from django.db import connection
+
+
+class UnmanagedTablesMixin:
+    """
+    TestCase mixin creating the tables of `unmanaged_models` for the class
+    
+    The tables are created before the class-wide transaction is opened
+    (SQLite cannot run DDL inside it) and live as long as the test database.
+    """
+    
+    unmanaged_models = ()
+    
+    @classmethod
+    def setUpClass(cls):
+        existing_tables = connection.introspection.table_names()
+        with connection.schema_editor() as schema_editor:
+            if connection.vendor == 'postgresql':
+                # Trigram indexes of the search endpoints (migration 008)
+                schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+            for model in cls.unmanaged_models:
+                if model._meta.db_table not in existing_tables:
+                    schema_editor.create_model(model)
+        super().setUpClass()
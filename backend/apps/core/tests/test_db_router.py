@@ -0,0 +1,110 @@
+"""
+Unit tests for the read replica routing.
+
+Tests cover:
+- CoreReadReplicaRouter sending core reads to the replica only inside replica_reads()
+- ReadReplicaMiddleware marking GET/HEAD requests only
+- The routing flag being reset after the response, including on errors
+- No routing when the router is not installed (no replica configured)
+"""
+
+from django.db import router
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from apps.core.db_router import REPLICA_DATABASE, CoreReadReplicaRouter, replica_reads
+from apps.core.middleware import ReadReplicaMiddleware
+from apps.core.models import Country, Team
+from api_integrations.models import APISync
+
+
+@override_settings(DATABASE_ROUTERS=['apps.core.db_router.CoreReadReplicaRouter'])
+class TestReadReplicaRouting(SimpleTestCase):
+    """Test cases for CoreReadReplicaRouter and ReadReplicaMiddleware."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.factory = RequestFactory()
+    
+    def _read_databases(self, request):
+        """Databases chosen for reads while the middleware serves `request`"""
+        chosen = {}
+        
+        def get_response(request):
+            chosen['country'] = router.db_for_read(Country)
+            chosen['team'] = router.db_for_read(Team)
+            chosen['sync'] = router.db_for_read(APISync)
+            return HttpResponse()
+        
+        ReadReplicaMiddleware(get_response)(request)
+        return chosen
+    
+    def test_reads_outside_block_use_primary(self):
+        """Test core reads stay on the primary unless marked."""
+        self.assertEqual(router.db_for_read(Country), 'default')
+    
+    def test_replica_reads_block(self):
+        """Test core reads inside replica_reads() use the replica, others do not."""
+        with replica_reads():
+            self.assertEqual(router.db_for_read(Country), REPLICA_DATABASE)
+            self.assertEqual(router.db_for_read(APISync), 'default')
+        
+        self.assertEqual(router.db_for_read(Country), 'default')
+    
+    def test_safe_methods_read_from_replica(self):
+        """Test GET and HEAD requests read core models from the replica."""
+        for method in ('get', 'head'):
+            with self.subTest(method=method):
+                chosen = self._read_databases(getattr(self.factory, method)('/api/teams/'))
+                self.assertEqual(chosen, {
+                    'country': REPLICA_DATABASE,
+                    'team': REPLICA_DATABASE,
+                    'sync': 'default',
+                })
+    
+    def test_writes_read_from_primary(self):
+        """Test reads made while handling writes stay on the primary."""
+        for method in ('post', 'put', 'patch', 'delete'):
+            with self.subTest(method=method):
+                chosen = self._read_databases(getattr(self.factory, method)('/api/teams/'))
+                self.assertEqual(set(chosen.values()), {'default'})
+    
+    def test_flag_reset_after_response(self):
+        """Test reads after a GET response are back on the primary."""
+        self._read_databases(self.factory.get('/api/teams/'))
+        
+        self.assertEqual(router.db_for_read(Country), 'default')
+    
+    def test_flag_reset_after_exception(self):
+        """Test a view raising does not leave reads on the replica."""
+        def get_response(request):
+            raise RuntimeError('view failed')
+        
+        with self.assertRaises(RuntimeError):
+            ReadReplicaMiddleware(get_response)(self.factory.get('/api/teams/'))
+        
+        self.assertEqual(router.db_for_read(Country), 'default')
+    
+    def test_replica_never_migrated(self):
+        """Test migrations are never applied to the replica alias."""
+        replica_router = CoreReadReplicaRouter()
+        
+        self.assertFalse(replica_router.allow_migrate(REPLICA_DATABASE, 'core'))
+        self.assertIsNone(replica_router.allow_migrate('default', 'core'))
+
+
+class TestWithoutReplica(SimpleTestCase):
+    """Test cases for a deployment without DB_REPLICA_HOST."""
+    
+    @override_settings(DATABASE_ROUTERS=[])
+    def test_get_reads_from_primary(self):
+        """Test the middleware has no effect when the router is not installed."""
+        chosen = []
+        
+        def get_response(request):
+            chosen.append(router.db_for_read(Country))
+            return HttpResponse()
+        
+        ReadReplicaMiddleware(get_response)(RequestFactory().get('/api/teams/'))
+        
+        self.assertEqual(chosen, ['default'])
@@ -0,0 +1,161 @@
+"""
+Unit tests for the league write serializers.
+
+Tests cover:
+- Unique-constraint violations translated to 400 responses on create/update
+- Other IntegrityErrors re-raised unchanged
+- prevalidate_batch conflicts with stored leagues and within the batch
+- Bulk creation through POST /api/leagues/ with a list
+"""
+
+from unittest.mock import patch
+
+from django.db import IntegrityError
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.core.models import Country, League, Sport
+from apps.core.serializers.league import LeagueCreateSerializer
+from apps.core.tests.helpers.integrity import integrity_error
+from apps.core.tests.helpers.tables import UnmanagedTablesMixin
+
+
+class TestLeagueIntegrityErrors(UnmanagedTablesMixin, TestCase):
+    """Test database constraint violations on league writes."""
+    
+    unmanaged_models = (Country, Sport, League)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.client = APIClient()
+        self.england = Country.objects.create(name='England', code='GB', flag='🏴')
+        sport = Sport.objects.create(id='football', name='Football', slug='football')
+        self.league = League.objects.create(name='Championship', sport=sport, country=self.england)
+        self.payload = {
+            'name': 'Premier League',
+            'sport': sport.id,
+            'country': str(self.england.id),
+            'external_id': 'api-football-39',
+        }
+    
+    def test_create_constraint_violations(self):
+        """Test each league constraint maps to a 400 on its field."""
+        constraints = {
+            'uq_league_name_country': ('name', "'Premier League' already exists in England"),
+            'uq_league_ext_id': ('external_id', "'api-football-39' already exists"),
+        }
+        
+        for constraint, (field, message) in constraints.items():
+            with self.subTest(constraint=constraint):
+                with patch.object(League, 'save', side_effect=integrity_error(constraint)):
+                    response = self.client.post('/api/leagues/', self.payload, format='json')
+                
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(list(response.data), [field])
+                self.assertIn(message, str(response.data[field]))
+    
+    def test_update_constraint_violations(self):
+        """Test updates report the conflicting value, falling back to the stored one."""
+        with patch.object(League, 'save', side_effect=integrity_error('uq_league_name_country')):
+            response = self.client.patch(
+                f'/api/leagues/{self.league.id}/', {'external_id': 'api-football-40'}, format='json'
+            )
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(response.data), ['name'])
+        self.assertIn("'Championship' already exists in England", str(response.data['name']))
+        
+        with patch.object(League, 'save', side_effect=integrity_error('uq_league_ext_id')):
+            response = self.client.patch(
+                f'/api/leagues/{self.league.id}/', {'external_id': 'api-football-40'}, format='json'
+            )
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(response.data), ['external_id'])
+    
+    def test_unmapped_constraint_reraised(self):
+        """Test violations of other constraints are not hidden as validation errors."""
+        for error in (integrity_error('leagues_sport_id_fkey'), IntegrityError('no diagnostics')):
+            with self.subTest(error=str(error)):
+                with patch.object(League, 'save', side_effect=error):
+                    with self.assertRaises(IntegrityError) as raised:
+                        self.client.post('/api/leagues/', self.payload, format='json')
+                self.assertIs(raised.exception, error)
+
+
+class TestLeagueBulkCreate(UnmanagedTablesMixin, TestCase):
+    """Test batch uniqueness checks of league creation."""
+    
+    unmanaged_models = (Country, Sport, League)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.client = APIClient()
+        self.england = Country.objects.create(name='England', code='GB', flag='🏴')
+        self.spain = Country.objects.create(name='Spain', code='ES', flag='🇪🇸')
+        self.sport = Sport.objects.create(id='football', name='Football', slug='football')
+        League.objects.create(
+            name='Premier League', sport=self.sport, country=self.england, external_id='api-football-39'
+        )
+    
+    def _payload(self, name, country, external_id=None):
+        return {
+            'name': name,
+            'sport': self.sport.id,
+            'country': str(country.id),
+            'external_id': external_id,
+        }
+    
+    def test_prevalidate_batch(self):
+        """Test stored and in-batch duplicates are reported at their index."""
+        errors = LeagueCreateSerializer.prevalidate_batch([
+            {'name': 'Premier League', 'country': self.england},
+            {'name': 'Championship', 'country': self.england.id, 'external_id': 'api-football-39'},
+            {'name': 'La Liga', 'country': self.spain, 'external_id': 'api-football-140'},
+            {'name': 'La Liga', 'country': str(self.spain.id)},
+            {'name': 'Premier League', 'country': self.spain, 'external_id': 'api-football-140'},
+            {'name': 'Friendlies', 'country': None},
+            {'name': 'Friendlies', 'country': None},
+        ])
+        
+        self.assertEqual(sorted(errors), [0, 1, 3, 4])
+        self.assertEqual(list(errors[0]), ['name'])
+        self.assertIn('already exists', errors[0]['name'])
+        self.assertEqual(list(errors[1]), ['external_id'])
+        self.assertIn('already exists', errors[1]['external_id'])
+        self.assertEqual(errors[3], {'name': "Duplicate name 'La Liga' for this country in request"})
+        self.assertEqual(errors[4], {'external_id': "Duplicate external_id 'api-football-140' in request"})
+    
+    def test_bulk_create(self):
+        """Test a list payload creates every league."""
+        response = self.client.post('/api/leagues/', [
+            self._payload('Championship', self.england, 'api-football-40'),
+            self._payload('La Liga', self.spain),
+        ], format='json')
+        
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(sorted(league['name'] for league in response.data), ['Championship', 'La Liga'])
+        self.assertEqual(League.objects.count(), 3)
+    
+    def test_bulk_create_rejects_duplicates(self):
+        """Test a batch with a duplicate creates nothing and reports the item."""
+        response = self.client.post('/api/leagues/', [
+            self._payload('La Liga', self.spain),
+            self._payload('La Liga', self.spain),
+            self._payload('Championship', self.england, 'api-football-39'),
+        ], format='json')
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(list(response.data[1]), ['name'])
+        self.assertEqual(list(response.data[2]), ['external_id'])
+        self.assertEqual(League.objects.count(), 1)
+    
+    def test_single_create(self):
+        """Test a single payload still returns the created league."""
+        response = self.client.post(
+            '/api/leagues/', self._payload('Championship', self.england), format='json'
+        )
+        
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['name'], 'Championship')
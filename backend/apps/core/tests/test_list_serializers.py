@@ -0,0 +1,95 @@
+"""
+Unit tests for the .values() list fast paths.
+
+Tests cover:
+- serialize_team_list against TeamListSerializer
+- serialize_league_list against LeagueListSerializer
+- serialize_country_list against CountrySerializer
+"""
+
+import uuid
+from decimal import Decimal
+
+from django.test import TestCase
+
+from apps.core.models import Country, League, Sport, Team
+from apps.core.serializers.country import (
+    COUNTRY_LIST_COLUMNS,
+    CountrySerializer,
+    serialize_country_list,
+)
+from apps.core.serializers.league import (
+    LEAGUE_LIST_COLUMNS,
+    LeagueListSerializer,
+    serialize_league_list,
+)
+from apps.core.serializers.team import (
+    TEAM_LIST_COLUMNS,
+    TeamListSerializer,
+    serialize_team_list,
+)
+from apps.core.tests.helpers.tables import UnmanagedTablesMixin
+
+
+class TestListFastPaths(UnmanagedTablesMixin, TestCase):
+    """Test the .values() list rows equal the serializer output they replace."""
+    
+    unmanaged_models = (Country, Sport, League, Team)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.england = Country.objects.create(
+            name='England', code='GB', flag='🏴', region='Europe', fifa_code='ENG'
+        )
+        self.world = Country.objects.create(
+            name='World', code='WW', flag='🌍', is_international=True
+        )
+        sport = Sport.objects.create(id='football', name='Football', slug='football')
+        League.objects.create(
+            name='Premier League', sport=sport, country=self.england,
+            external_id='api-football-39', tier=1, confederation='UEFA',
+        )
+        League.objects.create(name='Friendlies', sport=sport, country=None)
+        Team.objects.create(
+            id=uuid.uuid4(), name='Arsenal', code='ARS', country=self.england,
+            country_name_cached='England', country_code_cached='GB',
+            stadium_name='Emirates Stadium', stadium_capacity=60704,
+            primary_color='#EF0107', market_value=Decimal('1100000000'),
+        )
+        Team.objects.create(id=uuid.uuid4(), name='Unattached FC', is_active=False)
+    
+    def assertSameRows(self, fast_rows, serializer_data):
+        """Assert equal keys, values and value types, row by row"""
+        self.assertEqual(len(fast_rows), len(serializer_data))
+        for fast, expected in zip(fast_rows, serializer_data):
+            self.assertEqual(list(fast), list(expected))
+            for key, value in expected.items():
+                self.assertEqual(fast[key], value, key)
+                self.assertIs(type(fast[key]), type(value), key)
+    
+    def test_team_list(self):
+        """Test serialize_team_list output equals TeamListSerializer."""
+        queryset = Team.objects.order_by('name')
+        
+        self.assertSameRows(
+            serialize_team_list(queryset.values(*TEAM_LIST_COLUMNS)),
+            TeamListSerializer(list(queryset), many=True).data,
+        )
+    
+    def test_league_list(self):
+        """Test serialize_league_list output equals LeagueListSerializer."""
+        queryset = League.objects.select_related('country', 'sport').order_by('name')
+        
+        self.assertSameRows(
+            serialize_league_list(queryset.values(*LEAGUE_LIST_COLUMNS)),
+            LeagueListSerializer(list(queryset), many=True).data,
+        )
+    
+    def test_country_list(self):
+        """Test serialize_country_list output equals CountrySerializer."""
+        queryset = Country.objects.order_by('name')
+        
+        self.assertSameRows(
+            serialize_country_list(queryset.values(*COUNTRY_LIST_COLUMNS)),
+            CountrySerializer(list(queryset), many=True).data,
+        )
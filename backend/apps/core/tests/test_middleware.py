@@ -0,0 +1,109 @@
+"""
+Unit tests for CacheHeadersMiddleware.
+
+Tests cover:
+- public vs private Cache-Control on successful reads
+- no-store on writes (including the teams fetch/sync actions)
+- Vary merging with headers set by the view or other middleware
+- Responses outside the core app left untouched
+"""
+
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+from django.urls import resolve
+
+from apps.core.middleware import CacheHeadersMiddleware
+
+
+class TestCacheHeadersMiddleware(SimpleTestCase):
+    """Test cases for CacheHeadersMiddleware."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.factory = RequestFactory()
+    
+    def _process(self, request, response=None):
+        """Run the middleware around a view returning `response`"""
+        response = response if response is not None else HttpResponse('{}')
+        
+        def get_response(request):
+            # Set by URL resolution during the view call
+            request.resolver_match = resolve(request.path_info)
+            return response
+        
+        return CacheHeadersMiddleware(get_response)(request)
+    
+    def _cache_control(self, response):
+        return {directive.strip() for directive in response['Cache-Control'].split(',')}
+    
+    def test_anonymous_read_is_public(self):
+        """Test a read without credentials may be stored by shared caches."""
+        response = self._process(self.factory.get('/api/countries/stats/'))
+        
+        self.assertEqual(
+            self._cache_control(response),
+            {'public', 'max-age=60', 'stale-while-revalidate=30'}
+        )
+    
+    def test_authorization_header_read_is_private(self):
+        """Test a read with an Authorization header is private."""
+        request = self.factory.get('/api/countries/stats/', HTTP_AUTHORIZATION='Basic dXNlcjpwYXNz')
+        
+        self.assertIn('private', self._cache_control(self._process(request)))
+    
+    def test_session_cookie_read_is_private(self):
+        """Test a read carrying a session cookie is private."""
+        self.factory.cookies[settings.SESSION_COOKIE_NAME] = 'abc123'
+        request = self.factory.get('/api/countries/stats/')
+        
+        cache_control = self._cache_control(self._process(request))
+        self.assertIn('private', cache_control)
+        self.assertNotIn('public', cache_control)
+    
+    def test_authenticated_user_read_is_private(self):
+        """Test a read by an authenticated user is private."""
+        request = self.factory.get('/api/countries/stats/')
+        request.user = SimpleNamespace(is_authenticated=True)
+        
+        self.assertIn('private', self._cache_control(self._process(request)))
+    
+    def test_view_cache_control_is_kept(self):
+        """Test a response that set its own Cache-Control keeps it."""
+        response = HttpResponse('{}')
+        response['Cache-Control'] = 'private, max-age=30'
+        
+        response = self._process(self.factory.get('/api/teams/'), response)
+        
+        self.assertEqual(response['Cache-Control'], 'private, max-age=30')
+    
+    def test_error_read_gets_no_cache_control(self):
+        """Test unsuccessful reads are not made cacheable."""
+        response = self._process(self.factory.get('/api/teams/'), HttpResponse(status=404))
+        
+        self.assertFalse(response.has_header('Cache-Control'))
+    
+    def test_writes_are_no_store(self):
+        """Test creates and the fetch/sync actions are never stored."""
+        for path in ('/api/teams/', '/api/teams/fetch/', '/api/teams/sync/'):
+            with self.subTest(path=path):
+                response = self._process(self.factory.post(path))
+                self.assertIn('no-store', self._cache_control(response))
+    
+    def test_vary_is_merged(self):
+        """Test Vary keeps headers set earlier and gains Accept, Authorization, Cookie."""
+        response = HttpResponse('{}')
+        response['Vary'] = 'Origin, Accept'
+        
+        response = self._process(self.factory.get('/api/teams/'), response)
+        
+        self.assertEqual(response['Vary'], 'Origin, Accept, Authorization, Cookie')
+    
+    def test_other_apps_untouched(self):
+        """Test responses outside the core app get no caching headers."""
+        response = self._process(self.factory.get('/admin/'))
+        
+        self.assertFalse(response.has_header('Cache-Control'))
+        self.assertFalse(response.has_header('Vary'))
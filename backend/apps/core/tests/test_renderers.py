@@ -0,0 +1,88 @@
+"""
+Unit tests for the core API renderers.
+
+Tests cover:
+- ORJSONRenderer output parsing to the same JSON as DRF's JSONRenderer
+- Types handed to DRF's encoder (datetime, Decimal, lazy strings, ...)
+- Indented output requested through the Accept header
+"""
+
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from apps.core.renderers import ORJSONRenderer
+
+
+class TestORJSONRenderer(SimpleTestCase):
+    """Test cases for ORJSONRenderer against DRF's JSONRenderer."""
+    
+    def assertSameJSON(self, data, accepted_media_type='application/json'):
+        """Assert both renderers produce JSON that parses to the same value"""
+        expected = JSONRenderer().render(data, accepted_media_type)
+        rendered = ORJSONRenderer().render(data, accepted_media_type)
+        self.assertEqual(json.loads(rendered), json.loads(expected))
+        return rendered
+    
+    def test_representative_payload(self):
+        """Test a paginated list payload with every type the API emits."""
+        team_id = uuid.UUID('3f1c2d4e-0000-4000-8000-000000000001')
+        row = ReturnDict({
+            'id': team_id,
+            'name': 'Atlético Madrid',
+            'market_value': Decimal('1250000.50'),
+            'founded': 1903,
+            'ppg': 2.15,
+            'is_active': True,
+            'logo': None,
+            'created_at': datetime.datetime(2025, 11, 5, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            'updated_at': datetime.datetime(2025, 11, 5, 12, 30, tzinfo=datetime.timezone.utc),
+            'kickoff': datetime.time(20, 45),
+            'season_start': datetime.date(2025, 8, 15),
+            'naive': datetime.datetime(2025, 11, 5, 12, 30, 15),
+            'colors': ('#FF0000', '#FFFFFF'),
+        }, serializer=None)
+        payload = {
+            'success': True,
+            'count': 1,
+            'next': None,
+            'results': ReturnList([row], serializer=None),
+            'message': gettext_lazy('Teams retrieved successfully'),
+        }
+        
+        self.assertSameJSON(payload)
+    
+    def test_non_str_keys(self):
+        """Test integer keys are rendered as strings like json.dumps does."""
+        self.assertSameJSON({'by_tier': {1: 20, 2: 24}, 'season': {2024: 'current'}})
+    
+    def test_validation_errors(self):
+        """Test ErrorDetail strings render as plain strings."""
+        self.assertSameJSON({
+            'name': [ErrorDetail("A team named 'Arsenal' already exists", code='invalid')],
+            'non_field_errors': [ErrorDetail('Invalid data', code='invalid')],
+        })
+    
+    def test_top_level_list_and_empty_values(self):
+        """Test bulk responses and empty containers."""
+        self.assertSameJSON([{'id': uuid.uuid4(), 'tags': [], 'meta': {}}, {}])
+    
+    def test_none_renders_empty_body(self):
+        """Test a 204 response (data None) renders no bytes."""
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+        self.assertEqual(JSONRenderer().render(None), b'')
+    
+    def test_indent_from_accept_header(self):
+        """Test an indent in the media type yields indented, equal JSON."""
+        rendered = self.assertSameJSON(
+            {'success': True, 'data': {'id': uuid.uuid4()}},
+            accepted_media_type='application/json; indent=4',
+        )
+        self.assertIn(b'\n', rendered)
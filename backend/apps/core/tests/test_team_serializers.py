@@ -0,0 +1,74 @@
+"""
+Unit tests for the team write serializers.
+
+Tests cover:
+- Unique-constraint violations translated to 400 responses on create/update
+- Other IntegrityErrors re-raised unchanged
+"""
+
+import uuid
+from unittest.mock import patch
+
+from django.db import IntegrityError
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.core.models import Country, Team
+from apps.core.tests.helpers.integrity import integrity_error
+from apps.core.tests.helpers.tables import UnmanagedTablesMixin
+
+
+class TestTeamIntegrityErrors(UnmanagedTablesMixin, TestCase):
+    """Test database constraint violations on team writes."""
+    
+    unmanaged_models = (Country, Team)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.client = APIClient()
+        self.england = Country.objects.create(name='England', code='GB', flag='🏴')
+        self.team = Team.objects.create(id=uuid.uuid4(), name='Chelsea', code='CHE')
+        self.payload = {
+            'id': str(uuid.uuid4()),
+            'name': 'Arsenal',
+            'code': 'ARS',
+            'country': str(self.england.id),
+            'external_id': 'api-football-42',
+        }
+    
+    def test_create_constraint_violations(self):
+        """Test each team constraint maps to a 400 on its field."""
+        constraints = {
+            'teams_pkey': 'id',
+            'uq_team_name': 'name',
+            'uq_team_code': 'code',
+            'uq_team_ext_id': 'external_id',
+        }
+        
+        for constraint, field in constraints.items():
+            with self.subTest(constraint=constraint):
+                with patch.object(Team, 'save', side_effect=integrity_error(constraint)):
+                    response = self.client.post('/api/teams/', self.payload, format='json')
+                
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(list(response.data), [field])
+                self.assertIn(self.payload[field], str(response.data[field]))
+    
+    def test_update_constraint_violation(self):
+        """Test a rename onto another team's name is a 400 on name."""
+        with patch.object(Team, 'save', side_effect=integrity_error('uq_team_name')):
+            response = self.client.patch(
+                f'/api/teams/{self.team.id}/', {'name': 'Arsenal'}, format='json'
+            )
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(response.data), ['name'])
+    
+    def test_unmapped_constraint_reraised(self):
+        """Test violations of other constraints are not hidden as validation errors."""
+        for error in (integrity_error('teams_country_id_fkey'), IntegrityError('no diagnostics')):
+            with self.subTest(error=str(error)):
+                with patch.object(Team, 'save', side_effect=error):
+                    with self.assertRaises(IntegrityError) as raised:
+                        self.client.post('/api/teams/', self.payload, format='json')
+                self.assertIs(raised.exception, error)
@@ -0,0 +1,186 @@
+"""
+Unit tests for the team statistics league export.
+
+Tests cover:
+- Export rows equal to the list endpoint rows (PostgreSQL only)
+- Timestamp SQL following REST_FRAMEWORK['DATETIME_FORMAT']
+- goal_diff for non-numeric statistics values
+- Empty exports and league_id validation
+"""
+
+import datetime
+import json
+import unittest
+import uuid
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.core.models import Country, League, Sport, Team, TeamStatistics
+from apps.core.serializers.team_statistics import serialize_team_statistics_list
+from apps.core.tests.helpers.tables import UnmanagedTablesMixin
+from apps.core.views.team_statistics import _datetime_sql
+
+
+class TestExportSQL(SimpleTestCase):
+    """Test the SQL pieces the export is built from."""
+    
+    def test_datetime_sql_follows_drf_format(self):
+        """Test the configured strftime format is translated to to_char()."""
+        self.assertEqual(
+            _datetime_sql('ts.created_at'),
+            "to_char((ts.created_at AT TIME ZONE 'UTC'), "
+            "'YYYY\"-\"MM\"-\"DD\"T\"HH24\":\"MI\":\"SS\".\"US\"Z\"')"
+        )
+    
+    @override_settings(REST_FRAMEWORK={'DATETIME_FORMAT': 'iso-8601'})
+    def test_datetime_sql_iso_8601(self):
+        """Test ISO 8601 only adds microseconds when they are non-zero."""
+        sql = _datetime_sql('ts.created_at')
+        
+        self.assertIn("to_char((ts.created_at AT TIME ZONE 'UTC'), 'US') = '000000'", sql)
+        self.assertTrue(sql.endswith("|| 'Z'"))
+    
+    @override_settings(REST_FRAMEWORK={'DATETIME_FORMAT': '%d %b %Y'})
+    def test_datetime_sql_unsupported_format(self):
+        """Test a format without a to_char() equivalent is refused."""
+        with self.assertRaises(ImproperlyConfigured):
+            _datetime_sql('ts.created_at')
+    
+    def test_list_goal_diff_needs_numbers(self):
+        """Test the list rows, like the export, have no goal_diff for non-numbers."""
+        row = {
+            'id': uuid.uuid4(), 'team_id': uuid.uuid4(), 'team__name': 'Arsenal',
+            'team__code': 'ARS', 'league_id': uuid.uuid4(),
+            'league__name': 'Premier League', 'season': '2024-2025',
+            'clean_sheets': 10,
+            'created_at': datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc),
+            'updated_at': None,
+        }
+        cases = [
+            (60, 25, 35),
+            (60.5, 25, 35.5),
+            ('60', 25, None),
+            (True, 25, None),
+            ({'home': 30}, 25, None),
+            (None, 25, None),
+        ]
+        
+        for goals_for, goals_against, goal_diff in cases:
+            with self.subTest(goals_for=goals_for):
+                data = serialize_team_statistics_list([
+                    dict(row, goals_for=goals_for, goals_against=goals_against)
+                ])
+                self.assertEqual(data[0]['goal_diff'], goal_diff)
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', 'export SQL uses PostgreSQL JSON functions')
+class TestLeagueExport(UnmanagedTablesMixin, TestCase):
+    """Test GET /api/team-statistics/export/ against the list endpoint."""
+    
+    unmanaged_models = (Country, Sport, League, Team, TeamStatistics)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.client = APIClient()
+        england = Country.objects.create(name='England', code='GB', flag='🏴')
+        sport = Sport.objects.create(id='football', name='Football', slug='football')
+        self.league = League.objects.create(name='Premier League', sport=sport, country=england)
+        self.empty_league = League.objects.create(name='Championship', sport=sport, country=england)
+        arsenal = Team.objects.create(id=uuid.uuid4(), name='Arsenal', code='ARS')
+        chelsea = Team.objects.create(id=uuid.uuid4(), name='Chelsea', code=None)
+        utc = datetime.timezone.utc
+        
+        TeamStatistics.objects.create(
+            team=arsenal, league=self.league, season='2024-2025',
+            statistics={'goals': {'for': {'total': 69}, 'against': {'total': 34}}, 'clean_sheets': 13},
+            created_at=datetime.datetime(2025, 5, 25, 18, 30, 15, 123456, tzinfo=utc),
+            updated_at=datetime.datetime(2025, 5, 26, 9, 0, tzinfo=utc),
+        )
+        # Provider data the export must not cast: strings, booleans, objects
+        TeamStatistics.objects.create(
+            team=chelsea, league=self.league, season='2024-2025',
+            statistics={'goals': {'for': {'total': '64'}, 'against': {'total': 43}}, 'clean_sheets': True},
+            created_at=datetime.datetime(2025, 5, 25, 18, 30, tzinfo=utc),
+            updated_at=None,
+        )
+        TeamStatistics.objects.create(
+            team=arsenal, league=self.league, season='2023-2024',
+            statistics={'goals': {'for': {'total': 91.0}, 'against': {'total': {'home': 16}}}},
+            created_at=datetime.datetime(2024, 5, 19, 17, 0, 0, 5, tzinfo=utc),
+        )
+        TeamStatistics.objects.create(team=chelsea, league=self.league, season='2023-2024', statistics=None)
+    
+    def _export(self, **params):
+        response = self.client.get('/api/team-statistics/export/', params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        return json.loads(response.content)
+    
+    def _listed(self, **params):
+        response = self.client.get('/api/team-statistics/', params)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)['results']
+    
+    def assertSameRows(self, exported, listed):
+        """Assert the export rows equal the list rows, whatever their order"""
+        self.assertEqual(len(exported), len(listed))
+        listed_by_id = {row['id']: row for row in listed}
+        for row in exported:
+            self.assertEqual(list(row), list(listed_by_id[row['id']]))
+            self.assertEqual(row, listed_by_id[row['id']])
+    
+    def test_export_matches_list(self):
+        """Test every exported row equals the list endpoint's row."""
+        self.assertSameRows(
+            self._export(league_id=self.league.id),
+            self._listed(league=self.league.id),
+        )
+    
+    def test_export_season_filter(self):
+        """Test the season filter and the season/team name ordering."""
+        exported = self._export(league_id=self.league.id, season='2024-2025')
+        
+        self.assertEqual([row['team_name'] for row in exported], ['Arsenal', 'Chelsea'])
+        self.assertSameRows(exported, self._listed(league=self.league.id, season='2024-2025'))
+    
+    def test_export_timestamps(self):
+        """Test timestamps use DATETIME_FORMAT in UTC, including zero microseconds."""
+        exported = {
+            (row['team_name'], row['season']): row
+            for row in self._export(league_id=self.league.id)
+        }
+        
+        self.assertEqual(exported['Arsenal', '2024-2025']['created_at'], '2025-05-25T18:30:15.123456Z')
+        self.assertEqual(exported['Arsenal', '2024-2025']['updated_at'], '2025-05-26T09:00:00.000000Z')
+        self.assertEqual(exported['Arsenal', '2023-2024']['created_at'], '2024-05-19T17:00:00.000005Z')
+        self.assertIsNone(exported['Chelsea', '2024-2025']['updated_at'])
+    
+    def test_export_non_numeric_statistics(self):
+        """Test non-numeric goal totals pass through unchanged with a null goal_diff."""
+        exported = {
+            (row['team_name'], row['season']): row
+            for row in self._export(league_id=self.league.id)
+        }
+        
+        self.assertEqual(exported['Arsenal', '2024-2025']['goal_diff'], 35)
+        chelsea = exported['Chelsea', '2024-2025']
+        self.assertEqual(chelsea['goals_for_total'], '64')
+        self.assertIsNone(chelsea['goal_diff'])
+        self.assertIs(chelsea['clean_sheets_count'], True)
+        self.assertIsNone(exported['Arsenal', '2023-2024']['goal_diff'])
+        self.assertIsNone(exported['Chelsea', '2023-2024']['goals_for_total'])
+    
+    def test_empty_export(self):
+        """Test a league without statistics exports an empty array."""
+        self.assertEqual(self._export(league_id=self.empty_league.id), [])
+        self.assertEqual(self._export(league_id=self.league.id, season='1999'), [])
+    
+    def test_league_id_validation(self):
+        """Test a missing or malformed league_id is a 400."""
+        for params in ({}, {'league_id': 'not-a-uuid'}):
+            with self.subTest(params=params):
+                response = self.client.get('/api/team-statistics/export/', params)
+                self.assertEqual(response.status_code, 400)
@@ -0,0 +1,87 @@
+"""
+Unit tests for the team statistics write serializers.
+
+Tests cover:
+- Unique-constraint violations translated to 400 responses on create/update
+- Other IntegrityErrors re-raised unchanged
+"""
+
+import uuid
+from unittest.mock import patch
+
+from django.db import IntegrityError
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.core.models import Country, League, Sport, Team, TeamStatistics
+from apps.core.tests.helpers.integrity import integrity_error
+from apps.core.tests.helpers.tables import UnmanagedTablesMixin
+
+
+class TestTeamStatisticsIntegrityErrors(UnmanagedTablesMixin, TestCase):
+    """Test database constraint violations on team statistics writes."""
+    
+    unmanaged_models = (Country, Sport, League, Team, TeamStatistics)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.client = APIClient()
+        england = Country.objects.create(name='England', code='GB', flag='🏴')
+        sport = Sport.objects.create(id='football', name='Football', slug='football')
+        league = League.objects.create(name='Premier League', sport=sport, country=england)
+        team = Team.objects.create(id=uuid.uuid4(), name='Arsenal', code='ARS')
+        self.statistics = TeamStatistics.objects.create(team=team, league=league, season='2023-2024')
+        self.payload = {
+            'team': str(team.id),
+            'league': str(league.id),
+            'season': '2024-2025',
+            'statistics': {'clean_sheets': 13},
+            'external_id': 'api-football-42-39-2024',
+        }
+    
+    def test_create_constraint_violations(self):
+        """Test each statistics constraint maps to a 400 with the right key."""
+        constraints = {
+            'unique_team_league_season_stats': (
+                'non_field_errors', 'Statistics for Arsenal in Premier League for season 2024-2025'
+            ),
+            'uq_team_stats_ext_id': ('external_id', "'api-football-42-39-2024' already exist"),
+        }
+        
+        for constraint, (key, message) in constraints.items():
+            with self.subTest(constraint=constraint):
+                with patch.object(TeamStatistics, 'save', side_effect=integrity_error(constraint)):
+                    response = self.client.post('/api/team-statistics/', self.payload, format='json')
+                
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(list(response.data), [key])
+                self.assertIn(message, str(response.data[key]))
+    
+    def test_update_constraint_violations(self):
+        """Test a season clash is reported on season, an external_id clash on external_id."""
+        constraints = {
+            'unique_team_league_season_stats': ('season', 'season 2024-2025 already exist'),
+            'uq_team_stats_ext_id': ('external_id', "'api-football-42-39-2024' already exist"),
+        }
+        
+        for constraint, (key, message) in constraints.items():
+            with self.subTest(constraint=constraint):
+                with patch.object(TeamStatistics, 'save', side_effect=integrity_error(constraint)):
+                    response = self.client.patch(
+                        f'/api/team-statistics/{self.statistics.id}/',
+                        {'season': '2024-2025', 'external_id': 'api-football-42-39-2024'},
+                        format='json',
+                    )
+                
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(list(response.data), [key])
+                self.assertIn(message, str(response.data[key]))
+    
+    def test_unmapped_constraint_reraised(self):
+        """Test violations of other constraints are not hidden as validation errors."""
+        for error in (integrity_error('team_statistics_team_id_fkey'), IntegrityError('no diagnostics')):
+            with self.subTest(error=str(error)):
+                with patch.object(TeamStatistics, 'save', side_effect=error):
+                    with self.assertRaises(IntegrityError) as raised:
+                        self.client.post('/api/team-statistics/', self.payload, format='json')
+                self.assertIs(raised.exception, error)
@@ -2,12 +2,20 @@
 Core Views Package
 
 This package contains all views for the core app.
+
+ViewSets are imported on first access (PEP 562), so importing one of
+them does not load the modules, serializers and services of the others.
 """
 
-from .country import CountryViewSet
-from .league import LeagueViewSet
-from .team import TeamViewSet
-from .team_statistics import TeamStatisticsViewSet
+import importlib
+
+# Public name -> module defining it
+_LAZY = {
+    'CountryViewSet': 'apps.core.views.country',
+    'LeagueViewSet': 'apps.core.views.league',
+    'TeamViewSet': 'apps.core.views.team',
+    'TeamStatisticsViewSet': 'apps.core.views.team_statistics',
+}
 
 __all__ = [
     'CountryViewSet',
@@ -15,3 +23,18 @@ __all__ = [
     'TeamViewSet',
     'TeamStatisticsViewSet',
 ]
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
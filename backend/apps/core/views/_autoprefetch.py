@@ -0,0 +1,134 @@
+"""
+Serializer-driven eager loading for Core ViewSets
+
+Derives select_related()/prefetch_related() lookups from the fields a
+serializer declares, so a new field that reads obj.country.name cannot
+silently add one query per row.
+
+Author: Oover Development Team
+Date: November 2025
+"""
+
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from django.db.models.query import ModelIterable
+from rest_framework import serializers
+
+
+def _walk_field(model, field, prefix, select, prefetch):
+    """
+    Collect the relation lookups needed to render one serializer field
+    
+    Args:
+        model: Model class the field's source is resolved against
+        field: Bound serializer field
+        prefix: Lookup prefix of `model` ('' at the top level)
+        select: Set receiving select_related() paths
+        prefetch: Set receiving prefetch_related() paths
+    """
+    if field.source == '*':
+        return
+    
+    # Nested serializers and dotted sources read the related object itself;
+    # a PrimaryKeyRelatedField only needs the FK column on the row
+    renders_object = isinstance(field, serializers.BaseSerializer)
+    attrs = field.source.split('.')
+    
+    for index, attr in enumerate(attrs):
+        last = index == len(attrs) - 1
+        if last and not renders_object:
+            return
+        
+        try:
+            model_field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return  # property, method or annotation
+        if not model_field.is_relation or model_field.related_model is None:
+            return
+        
+        path = f'{prefix}{attr}'
+        if model_field.one_to_many or model_field.many_to_many:
+            prefetch.add(path)
+            return
+        
+        select.add(path)
+        model = model_field.related_model
+        prefix = f'{path}__'
+    
+    # Nested single-object serializer: its own dotted sources hang off here
+    child = getattr(field, 'child', None)
+    if child is None and hasattr(field, 'fields'):
+        for nested in field.fields.values():
+            _walk_field(model, nested, prefix, select, prefetch)
+
+
+@lru_cache(maxsize=None)
+def eager_loading_plan(model, serializer_class):
+    """
+    Compute (select_related paths, prefetch_related paths) for a serializer
+    
+    Computed once per (model, serializer class) and cached for the life of
+    the process. Serializers that cannot be built without context get an
+    empty plan.
+    
+    Args:
+        model: Model class of the viewset queryset
+        serializer_class: Serializer class rendering that queryset
+    
+    Returns:
+        tuple: (tuple of select_related paths, tuple of prefetch_related paths)
+    """
+    try:
+        fields = serializer_class().fields
+    except Exception:
+        return (), ()
+    
+    select, prefetch = set(), set()
+    for field in fields.values():
+        _walk_field(model, field, '', select, prefetch)
+    return tuple(sorted(select)), tuple(sorted(prefetch))
+
+
+class AutoPrefetchMixin:
+    """
+    ViewSet mixin adding the eager loading the serializer needs
+    
+    get_queryset() passes its final queryset through optimize_queryset(),
+    after the view's own filters and column restrictions. Lookups the view
+    already configured are kept as they are: querysets restricted with only() or returning values() are
+    left alone, and relations already prefetched (including Prefetch
+    objects with custom querysets) are not prefetched again.
+    """
+    
+    def optimize_queryset(self, queryset):
+        """
+        Apply the serializer's eager loading plan to a queryset
+        
+        Args:
+            queryset: Queryset about to be rendered by get_serializer_class()
+        
+        Returns:
+            QuerySet: Queryset with missing select/prefetch lookups added
+        """
+        if queryset._iterable_class is not ModelIterable:
+            return queryset
+        
+        select, prefetch = eager_loading_plan(queryset.model, self.get_serializer_class())
+        
+        # only() in effect: the view chose the exact columns to load
+        only_fields, defer = queryset.query.deferred_loading
+        if select and (defer or not only_fields) and queryset.query.select_related is not True:
+            queryset = queryset.select_related(*select)
+        
+        if prefetch:
+            seen = {
+                lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+                for lookup in queryset._prefetch_related_lookups
+            }
+            missing = [path for path in prefetch if path not in seen]
+            if missing:
+                queryset = queryset.prefetch_related(*missing)
+        
+        return queryset
@@ -0,0 +1,120 @@
+"""
+Conditional GET support for Core ViewSets
+
+ETag/Last-Modified validators computed from one aggregate query, so a
+client polling an unchanged list gets 304 Not Modified without the rows
+being fetched or serialized.
+
+Author: Oover Development Team
+Date: November 2025
+"""
+
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date, quote_etag
+
+
+# Volatile resources: browsers may reuse a response for 30 seconds, then
+# revalidate with If-None-Match / If-Modified-Since
+CONDITIONAL_CACHE_CONTROL = {'private': True, 'max_age': 30}
+
+
+def queryset_validators(queryset, timestamp_fields, **aggregates):
+    """
+    Compute (fingerprint, last_modified) for a queryset in one query
+    
+    The fingerprint combines the row count, the newest value of every
+    timestamp field and any extra aggregates, so inserts, deletes and
+    updates all change it.
+    
+    Args:
+        queryset: Filtered queryset the response is built from
+        timestamp_fields: Datetime fields whose newest value dates the rows
+        **aggregates: Extra aggregates for changes no timestamp records
+    
+    Returns:
+        tuple: (fingerprint string, newest timestamp or None)
+    """
+    for field in timestamp_fields:
+        aggregates[f'{field}_max'] = Max(field)
+    values = queryset.order_by().aggregate(rows=Count('pk'), **aggregates)
+    
+    timestamps = [
+        values[f'{field}_max'] for field in timestamp_fields
+        if values[f'{field}_max'] is not None
+    ]
+    fingerprint = ':'.join(f'{key}={values[key]}' for key in sorted(values))
+    return fingerprint, max(timestamps, default=None)
+
+
+class ConditionalGetMixin:
+    """
+    ViewSet mixin answering conditional GETs on list endpoints
+    
+    A list action calls not_modified_response() before fetching rows and
+    returns its result when it is not None. The validators it computed are
+    attached to the 200 response in finalize_response(), together with
+    Cache-Control and Vary headers.
+    """
+    
+    conditional_timestamp_fields = ('created_at', 'updated_at')
+    
+    def not_modified_response(self, request, queryset, timestamp_fields=None, **aggregates):
+        """
+        Return 304 Not Modified if the client's copy is current, else None
+        
+        The ETag also covers the full path (filters, search, page) and the
+        negotiated media type, since those change the body as well.
+        
+        Args:
+            request: Current request
+            queryset: Filtered queryset the response is built from
+            timestamp_fields: Overrides conditional_timestamp_fields
+            **aggregates: Passed to queryset_validators()
+        
+        Returns:
+            HttpResponseNotModified or None
+        """
+        if request.method not in ('GET', 'HEAD'):
+            return None
+        
+        fingerprint, last_modified = queryset_validators(
+            queryset,
+            timestamp_fields or self.conditional_timestamp_fields,
+            **aggregates
+        )
+        digest = hashlib.blake2b(
+            f'{request.get_full_path()}|{request.accepted_media_type}|{fingerprint}'.encode(),
+            digest_size=8,
+        ).hexdigest()
+        self._conditional_validators = (
+            quote_etag(digest),
+            int(last_modified.timestamp()) if last_modified else None,
+        )
+        
+        return get_conditional_response(
+            request,
+            etag=self._conditional_validators[0],
+            last_modified=self._conditional_validators[1],
+        )
+    
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Attach the validators and caching headers to successful responses"""
+        response = super().finalize_response(request, response, *args, **kwargs)
+        
+        validators = getattr(self, '_conditional_validators', None)
+        if validators is not None and response.status_code in (200, 304):
+            etag, last_modified = validators
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+            patch_cache_control(response, **CONDITIONAL_CACHE_CONTROL)
+            patch_vary_headers(response, ('Accept',))
+        
+        return response
@@ -14,16 +14,52 @@ from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 
-from apps.core.models import Country
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
+from django.urls import reverse
+
+from apps.core.views._autoprefetch import AutoPrefetchMixin
+from apps.core.views._conditional import ConditionalGetMixin
+from apps.core.cache import cached_stats
+from apps.core.models import Country, League, Team
 from apps.core.serializers.country import (
     CountrySerializer,
     CountryCreateSerializer,
     CountryUpdateSerializer,
     CountryWithRelationsSerializer,
     CountryFilterSerializer,
+    COUNTRY_LIST_COLUMNS,
+    serialize_country_list,
 )
 
 
+def _relation_count(model):
+    """Correlated COUNT(*) of the model's rows referencing the outer country"""
+    return Coalesce(
+        Subquery(
+            model.objects.filter(country_id=OuterRef('pk'))
+            .order_by()
+            .values('country_id')
+            .annotate(count=Count('*'))
+            .values('count')
+        ),
+        0,
+    )
+
+
+def _relation_latest(model):
+    """Correlated MAX(updated_at) of the model's rows referencing the outer country"""
+    return Subquery(
+        model.objects.filter(country_id=OuterRef('pk'))
+        .order_by()
+        .values('country_id')
+        .annotate(latest=Max('updated_at'))
+        .values('latest')
+    )
+
+
 @extend_schema_view(
     list=extend_schema(
         summary="List all countries",
@@ -49,6 +85,11 @@ from apps.core.serializers.country import (
                 type=str,
                 description='Order by: name, code, created_at, updated_at (prefix with - for descending)'
             ),
+            OpenApiParameter(
+                name='include_counts',
+                type=bool,
+                description='Add leagues_count and teams_count to each country'
+            ),
         ]
     ),
     retrieve=extend_schema(
@@ -72,7 +113,7 @@ from apps.core.serializers.country import (
         description="Delete a country record"
     ),
 )
-class CountryViewSet(viewsets.ModelViewSet):
+class CountryViewSet(ConditionalGetMixin, AutoPrefetchMixin, viewsets.ModelViewSet):
     """
     ViewSet for Country model providing full CRUD operations.
     
@@ -112,6 +153,33 @@ class CountryViewSet(viewsets.ModelViewSet):
     ordering_fields = ['name', 'code', 'created_at', 'updated_at']
     ordering = ['name']  # Default ordering
     
+    # Actions rendered with CountryWithRelationsSerializer (nested leagues/teams)
+    relation_actions = ('retrieve', 'with_relations')
+    
+    # Rows rendered by retrieve: its ETag/Last-Modified follow all of them
+    # (leagues_updated_at/teams_updated_at are annotated by retrieve)
+    retrieve_timestamp_fields = (
+        'created_at', 'updated_at', 'leagues_updated_at', 'teams_updated_at',
+    )
+    
+    # Most valuable teams embedded per country; the full set is paged
+    # through teams_url (see with_relations)
+    embedded_teams_limit = 20
+    
+    # Columns read by MinimalLeagueSerializer / MinimalTeamSerializer, plus
+    # the FK used to attach prefetched rows to their country. Teams are
+    # capped: big football countries have hundreds of them.
+    relation_prefetches = (
+        Prefetch('leagues', queryset=League.objects.only('id', 'name', 'logo', 'is_active', 'country_id')),
+        Prefetch(
+            'teams',
+            queryset=Team.objects.only('id', 'name', 'logo', 'is_active', 'country_id').order_by(
+                F('market_value').desc(nulls_last=True), 'name'
+            )[:embedded_teams_limit],
+            to_attr='embedded_teams',
+        ),
+    )
+    
     def get_serializer_class(self):
         """
         Return appropriate serializer class based on action.
@@ -136,15 +204,52 @@ class CountryViewSet(viewsets.ModelViewSet):
         - is_active: boolean (true/false)
         - is_international: boolean (true/false)
         - include_relations: boolean (true/false) - prefetch leagues and teams
+        
+        retrieve and with_relations render nested leagues and teams, so
+        both are always prefetched for them, loading only the columns the
+        minimal nested serializers output. Teams are limited to the
+        embedded_teams_limit most valuable ones. with_relations also gets
+        its leagues/teams counts annotated onto the country row.
         """
         queryset = Country.objects.all()
         
-        # Prefetch related data if requested
+        # Prefetch related data if rendered or requested
         include_relations = self.request.query_params.get('include_relations', 'false')
-        if include_relations.lower() == 'true':
-            queryset = queryset.prefetch_related('leagues', 'teams')
+        if self.action in self.relation_actions or include_relations.lower() == 'true':
+            queryset = queryset.prefetch_related(*self.relation_prefetches)
         
-        return queryset
+        if self.action == 'with_relations':
+            queryset = self._with_relation_counts(queryset)
+        
+        return self.optimize_queryset(queryset)
+    
+    def _with_relation_counts(self, queryset):
+        """
+        Annotate leagues_count and teams_count onto a country queryset
+        
+        Each count is a correlated subquery, so the counts of a whole page
+        come back with the countries in one query (joining both relations
+        and counting distinct rows would multiply leagues by teams).
+        """
+        return queryset.annotate(
+            leagues_count=_relation_count(League),
+            teams_count=_relation_count(Team),
+        )
+    
+    def _country_rows(self, queryset, include_counts=False):
+        """
+        Return the COUNTRY_LIST_COLUMNS .values() rows of a country queryset
+        
+        List renderings never show relations, so prefetches requested with
+        include_relations are dropped. With include_counts the rows also
+        carry leagues_count and teams_count.
+        """
+        queryset = queryset.prefetch_related(None)
+        if include_counts:
+            return self._with_relation_counts(queryset).values(
+                *COUNTRY_LIST_COLUMNS, 'leagues_count', 'teams_count'
+            )
+        return queryset.values(*COUNTRY_LIST_COLUMNS)
     
     @extend_schema(
         summary="List active countries",
@@ -157,16 +262,14 @@ class CountryViewSet(viewsets.ModelViewSet):
         
         GET /api/countries/active/
         """
-        active_countries = self.get_queryset().filter(is_active=True)
+        rows = self._country_rows(self.get_queryset().filter(is_active=True))
         
         # Apply pagination
-        page = self.paginate_queryset(active_countries)
+        page = self.paginate_queryset(rows)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            return self.get_paginated_response(serialize_country_list(page))
         
-        serializer = self.get_serializer(active_countries, many=True)
-        return Response(serializer.data)
+        return Response(serialize_country_list(rows))
     
     @extend_schema(
         summary="Get country statistics",
@@ -186,68 +289,128 @@ class CountryViewSet(viewsets.ModelViewSet):
         - countries_with_leagues: Number of countries that have leagues
         - countries_with_teams: Number of countries that have teams
         """
-        queryset = self.get_queryset()
+        def build():
+            queryset = self.get_queryset()
+            return {
+                'total_countries': queryset.count(),
+                'active_countries': queryset.filter(is_active=True).count(),
+                'international_entities': queryset.filter(is_international=True).count(),
+                'national_countries': queryset.filter(is_international=False).count(),
+                'countries_with_leagues': queryset.filter(leagues__isnull=False).distinct().count(),
+                'countries_with_teams': queryset.filter(teams__isnull=False).distinct().count(),
+            }
         
-        stats = {
-            'total_countries': queryset.count(),
-            'active_countries': queryset.filter(is_active=True).count(),
-            'international_entities': queryset.filter(is_international=True).count(),
-            'national_countries': queryset.filter(is_international=False).count(),
-            'countries_with_leagues': queryset.filter(leagues__isnull=False).distinct().count(),
-            'countries_with_teams': queryset.filter(teams__isnull=False).distinct().count(),
-        }
+        # Cached for up to STATS_CACHE_TIMEOUT, dropped on any country/league/team write
+        stats = cached_stats('countries.stats', {}, build)
         
         return Response(stats, status=status.HTTP_200_OK)
     
     @extend_schema(
         summary="Get country with relations",
-        description="Get country details including leagues and teams"
+        description=(
+            "Get country details including its leagues and its 20 most valuable "
+            "teams, with counts and links to the paginated league/team lists"
+        )
     )
     @action(detail=True, methods=['get'])
     def with_relations(self, request, id=None):
         """
-        Get country with all related leagues and teams.
+        Get country with its leagues and most valuable teams.
         
         GET /api/countries/{id}/with_relations/
+        
+        Embeds at most embedded_teams_limit teams (by market value);
+        leagues_url and teams_url page through the complete sets.
         """
         country = self.get_object()
         
         # Use serializer with relations
-        serializer = CountryWithRelationsSerializer(country)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        data = CountryWithRelationsSerializer(country).data
+        data['leagues_url'] = request.build_absolute_uri(
+            f"{reverse('core:league-list')}?country={country.id}"
+        )
+        data['teams_url'] = request.build_absolute_uri(
+            f"{reverse('core:team-list')}?country={country.id}&ordering=-market_value"
+        )
+        return Response(data, status=status.HTTP_200_OK)
     
     def list(self, request, *args, **kwargs):
         """
         List countries with pagination and filtering.
         
-        Override to add custom response structure.
+        Override to add custom response structure. Rendered from .values()
+        rows via serialize_country_list(); the output shape is
+        CountrySerializer, plus leagues_count/teams_count with
+        ?include_counts=true. Answers 304 when the client's
+        ETag/Last-Modified are still current.
         """
         queryset = self.filter_queryset(self.get_queryset())
+        include_counts = request.query_params.get('include_counts', 'false').lower() == 'true'
+        
+        # The validators only cover country rows; counts change with leagues/teams
+        if not include_counts:
+            not_modified = self.not_modified_response(request, queryset)
+            if not_modified is not None:
+                return not_modified
+        
+        rows = self._country_rows(queryset, include_counts=include_counts)
         
         # Apply pagination
-        page = self.paginate_queryset(queryset)
+        page = self.paginate_queryset(rows)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            return self.get_paginated_response(
+                serialize_country_list(page, include_counts=include_counts)
+            )
         
-        serializer = self.get_serializer(queryset, many=True)
+        data = serialize_country_list(rows, include_counts=include_counts)
         return Response({
             'success': True,
-            'data': serializer.data,
-            'total': queryset.count()
+            'data': data,
+            'total': len(data)
         })
     
     def retrieve(self, request, *args, **kwargs):
         """
         Retrieve a single country.
         
-        Override to add custom response structure.
+        Override to add custom response structure. Answers 304 when the
+        client's copy of the country and its embedded leagues and teams is
+        still current; otherwise the body comes from the response cache.
         """
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
+        try:
+            # One scalar subquery per relation and value, never a
+            # leagues x teams join
+            country = self._with_relation_counts(
+                Country.objects.filter(id=kwargs[self.lookup_url_kwarg or self.lookup_field])
+            ).annotate(
+                leagues_updated_at=_relation_latest(League),
+                teams_updated_at=_relation_latest(Team),
+            )
+            not_modified = self.not_modified_response(
+                request,
+                country,
+                timestamp_fields=self.retrieve_timestamp_fields,
+                league_rows=Max('leagues_count'),
+                team_rows=Max('teams_count'),
+            )
+        except (TypeError, ValueError, ValidationError):
+            not_modified = None  # Malformed id: get_object() answers 404
+        if not_modified is not None:
+            return not_modified
+        
+        def build():
+            return self.get_serializer(self.get_object()).data
+        
+        # Cached for up to STATS_CACHE_TIMEOUT, dropped on any country/league/team write
+        data = cached_stats(
+            'countries.retrieve',
+            {'id': kwargs[self.lookup_url_kwarg or self.lookup_field]},
+            build,
+        )
+        
         return Response({
             'success': True,
-            'data': serializer.data
+            'data': data
         })
     
     def create(self, request, *args, **kwargs):
@@ -288,10 +451,19 @@ class CountryViewSet(viewsets.ModelViewSet):
         """
         Delete a country.
         
-        Override to add custom response structure.
+        Override to add custom response structure. The leagues and teams
+        foreign keys are ON DELETE RESTRICT, so a country that still has
+        leagues or teams is answered with 409 Conflict.
         """
         instance = self.get_object()
-        self.perform_destroy(instance)
+        try:
+            with transaction.atomic():
+                self.perform_destroy(instance)
+        except IntegrityError:
+            return Response({
+                'success': False,
+                'error': 'Country has related leagues or teams and cannot be deleted'
+            }, status=status.HTTP_409_CONFLICT)
         
         return Response({
             'success': True,
@@ -13,9 +13,12 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
+from django.contrib.postgres.search import TrigramSimilarity
 from django.db.models import Q
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 
+from apps.core.views._autoprefetch import AutoPrefetchMixin
+from apps.core.views._conditional import ConditionalGetMixin
 from apps.core.models import League
 from apps.core.serializers import (
     LeagueListSerializer,
@@ -23,6 +26,7 @@ from apps.core.serializers import (
     LeagueCreateSerializer,
     LeagueUpdateSerializer,
 )
+from apps.core.serializers.league import LEAGUE_LIST_COLUMNS, serialize_league_list
 
 
 class LeaguePagination(PageNumberPagination):
@@ -103,7 +107,7 @@ class LeaguePagination(PageNumberPagination):
         tags=['Leagues']
     ),
 )
-class LeagueViewSet(viewsets.ModelViewSet):
+class LeagueViewSet(ConditionalGetMixin, AutoPrefetchMixin, viewsets.ModelViewSet):
     """
     ViewSet for League CRUD operations
     
@@ -144,6 +148,12 @@ class LeagueViewSet(viewsets.ModelViewSet):
     ordering_fields = ['name', 'created_at', 'updated_at']
     ordering = ['name']  # Default ordering
     
+    # List rows also render the country and sport names: a rename of
+    # either must change the list's ETag/Last-Modified
+    conditional_timestamp_fields = (
+        'created_at', 'updated_at', 'country__updated_at', 'sport__updated_at',
+    )
+    
     def get_serializer_class(self):
         """
         Return appropriate serializer class based on action
@@ -173,6 +183,9 @@ class LeagueViewSet(viewsets.ModelViewSet):
         Always includes:
         - select_related('country', 'sport') for foreign key optimization
         
+        List actions read LEAGUE_LIST_COLUMNS through .values() instead
+        (see _league_list_response()).
+        
         Returns:
             Optimized queryset
         """
@@ -181,7 +194,48 @@ class LeagueViewSet(viewsets.ModelViewSet):
         # Additional filtering can be added here
         # For example, hide inactive leagues for non-admin users
         
-        return queryset
+        return self.optimize_queryset(queryset)
+    
+    def _league_list_response(self, queryset, paginate=True):
+        """
+        Render leagues in the LeagueListSerializer shape from .values() rows
+        
+        Avoids instantiating League/Country/Sport objects and running DRF
+        fields per row; see serialize_league_list().
+        
+        Args:
+            queryset: Filtered league queryset
+            paginate: Apply the viewset pagination (default: True)
+            
+        Returns:
+            Response: Paginated or plain list response
+        """
+        rows = queryset.values(*LEAGUE_LIST_COLUMNS)
+        
+        if paginate:
+            page = self.paginate_queryset(rows)
+            if page is not None:
+                return self.get_paginated_response(serialize_league_list(page))
+        
+        return Response(serialize_league_list(rows))
+    
+    def list(self, request, *args, **kwargs):
+        """
+        List leagues (paginated, searchable, filterable)
+        
+        URL: GET /api/v1/leagues/
+        
+        Rendered from .values() rows via serialize_league_list(); the output
+        shape is LeagueListSerializer. Answers 304 when the client's
+        ETag/Last-Modified are still current.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        
+        not_modified = self.not_modified_response(request, queryset)
+        if not_modified is not None:
+            return not_modified
+        
+        return self._league_list_response(queryset)
     
     @extend_schema(
         summary="Get leagues by country",
@@ -210,9 +264,8 @@ class LeagueViewSet(viewsets.ModelViewSet):
         Returns:
             List of leagues for the specified country
         """
-        leagues = self.queryset.filter(country_id=country_id, is_active=True)
-        serializer = LeagueListSerializer(leagues, many=True)
-        return Response(serializer.data)
+        leagues = self.get_queryset().filter(country_id=country_id, is_active=True)
+        return self._league_list_response(leagues, paginate=False)
     
     @extend_schema(
         summary="Get active leagues",
@@ -229,9 +282,8 @@ class LeagueViewSet(viewsets.ModelViewSet):
         Returns:
             List of all active leagues
         """
-        leagues = self.queryset.filter(is_active=True)
-        serializer = LeagueListSerializer(leagues, many=True)
-        return Response(serializer.data)
+        leagues = self.get_queryset().filter(is_active=True)
+        return self._league_list_response(leagues, paginate=False)
     
     @extend_schema(
         summary="Search leagues",
@@ -275,23 +327,18 @@ class LeagueViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Build search query
-        leagues = self.queryset.filter(
+        # Build search query (trigram-indexed), closest names first
+        leagues = self.get_queryset().filter(
             Q(name__icontains=query) | Q(external_id__icontains=query)
-        )
+        ).annotate(
+            similarity=TrigramSimilarity('name', query)
+        ).order_by('-similarity', 'name')
         
         # Apply country filter if provided
         if country_id:
             leagues = leagues.filter(country_id=country_id)
         
-        # Apply pagination
-        page = self.paginate_queryset(leagues)
-        if page is not None:
-            serializer = LeagueListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = LeagueListSerializer(leagues, many=True)
-        return Response(serializer.data)
+        return self._league_list_response(leagues)
     
     def create(self, request, *args, **kwargs):
         """
@@ -309,18 +356,30 @@ class LeagueViewSet(viewsets.ModelViewSet):
                 "is_active": true
             }
         
+        A list of league objects creates leagues in bulk; names per country
+        and external_ids of the whole batch are then checked with a single
+        query (LeagueCreateSerializer.prevalidate_batch).
+        
         Returns:
-            201 Created: Newly created league
+            201 Created: Newly created league (or list of leagues)
             400 Bad Request: Validation errors
         """
-        serializer = self.get_serializer(data=request.data)
+        many = isinstance(request.data, list)
+        serializer = self.get_serializer(data=request.data, many=many)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
         
         # Return detailed response
-        headers = self.get_success_headers(serializer.data)
-        league = League.objects.select_related('country', 'sport').get(id=serializer.data['id'])
-        response_serializer = LeagueDetailSerializer(league)
+        leagues = League.objects.select_related('country', 'sport')
+        if many:
+            headers = {}
+            response_serializer = LeagueDetailSerializer(
+                leagues.filter(id__in=[league.id for league in serializer.instance]),
+                many=True
+            )
+        else:
+            headers = self.get_success_headers(serializer.data)
+            response_serializer = LeagueDetailSerializer(leagues.get(id=serializer.instance.id))
         
         return Response(
             response_serializer.data,
@@ -12,14 +12,18 @@ Date: October 2025
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import Q, Sum
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
 from datetime import datetime, timedelta
 import logging
 
+from apps.core.views._autoprefetch import AutoPrefetchMixin
+from apps.core.views._conditional import ConditionalGetMixin
+from apps.core.cache import cached_stats
 from apps.core.models import Team
 from apps.core.serializers import (
     TeamListSerializer,
@@ -29,6 +33,7 @@ from apps.core.serializers import (
     APISyncListSerializer,
     APISyncDetailSerializer,
 )
+from apps.core.serializers.team import TEAM_LIST_COLUMNS, serialize_team_list
 from api_integrations.models import APISync
 from api_integrations.services.teams_service import TeamsService
 
@@ -49,18 +54,28 @@ class TeamPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class OperationsPagination(PageNumberPagination):
+class OperationsPagination(CursorPagination):
     """
-    Custom pagination for operations list views
+    Cursor (keyset) pagination for operations list views
+    
+    Operations grow without bound and are read newest first; a cursor
+    seeks on the (started_at, id) index instead of scanning and discarding
+    OFFSET rows, so deep pages cost the same as the first one.
     
     Settings:
     - page_size: 20 operations per page (default)
     - page_size_query_param: 'page_size' (client can override)
     - max_page_size: 50 (maximum allowed)
+    - ordering: newest first, id as tie-breaker
     """
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 50
+    ordering = ('-started_at', '-id')
+    
+    def get_ordering(self, request, queryset, view):
+        # TeamViewSet's OrderingFilter orders teams, not operations
+        return self.ordering
 
 
 @extend_schema_view(
@@ -110,6 +125,14 @@ class OperationsPagination(PageNumberPagination):
     retrieve=extend_schema(
         summary="Get team details",
         description="Retrieve detailed information for a specific team",
+        parameters=[
+            OpenApiParameter(
+                name='fields',
+                description='Comma-separated fields to return (e.g. name,code,country_details); id is always included',
+                required=False,
+                type=str
+            ),
+        ],
         tags=['Teams']
     ),
     create=extend_schema(
@@ -133,7 +156,7 @@ class OperationsPagination(PageNumberPagination):
         tags=['Teams']
     ),
 )
-class TeamViewSet(viewsets.ModelViewSet):
+class TeamViewSet(ConditionalGetMixin, AutoPrefetchMixin, viewsets.ModelViewSet):
     """
     ViewSet for Team CRUD operations
     
@@ -180,6 +203,14 @@ class TeamViewSet(viewsets.ModelViewSet):
     ordering_fields = ['name', 'code', 'market_value', 'founded', 'created_at', 'updated_at']
     ordering = ['name']  # Default ordering
     
+    # country_name_cached/country_code_cached are rewritten by a trigger on
+    # countries without touching teams.updated_at, so the list's
+    # ETag/Last-Modified also follow the countries' updated_at
+    conditional_timestamp_fields = ('created_at', 'updated_at', 'country__updated_at')
+    
+    # Actions rendered with TeamListSerializer
+    list_actions = ('list', 'by_country', 'active', 'top_by_market_value', 'search')
+    
     def get_serializer_class(self):
         """
         Return appropriate serializer class based on action
@@ -211,6 +242,7 @@ class TeamViewSet(viewsets.ModelViewSet):
         
         Always includes:
         - select_related('country') for foreign key optimization
+        - The serializer's setup_eager_loading() (only the rendered columns)
         
         Custom filters:
         - market_value_min: Filter teams with market value >= value
@@ -221,6 +253,14 @@ class TeamViewSet(viewsets.ModelViewSet):
         """
         queryset = super().get_queryset()
         
+        # Let the serializer declare the related objects/columns it needs
+        if self.action in self.list_actions:
+            serializer_class = TeamListSerializer
+        else:
+            serializer_class = self.get_serializer_class()
+        if hasattr(serializer_class, 'setup_eager_loading'):
+            queryset = serializer_class.setup_eager_loading(queryset)
+        
         # Market value range filtering
         market_value_min = self.request.query_params.get('market_value_min', None)
         market_value_max = self.request.query_params.get('market_value_max', None)
@@ -239,7 +279,48 @@ class TeamViewSet(viewsets.ModelViewSet):
             except ValueError:
                 pass  # Invalid value, ignore filter
         
-        return queryset
+        return self.optimize_queryset(queryset)
+    
+    def _team_list_response(self, queryset, paginate=True):
+        """
+        Render teams in the TeamListSerializer shape from .values() rows
+        
+        Avoids instantiating Team objects and running DRF fields per row;
+        see serialize_team_list().
+        
+        Args:
+            queryset: Filtered team queryset
+            paginate: Apply the viewset pagination (default: True)
+            
+        Returns:
+            Response: Paginated or plain list response
+        """
+        rows = queryset.values(*TEAM_LIST_COLUMNS)
+        
+        if paginate:
+            page = self.paginate_queryset(rows)
+            if page is not None:
+                return self.get_paginated_response(serialize_team_list(page))
+        
+        return Response(serialize_team_list(rows))
+    
+    def list(self, request, *args, **kwargs):
+        """
+        List teams (paginated, searchable, filterable)
+        
+        URL: GET /api/teams/
+        
+        Rendered from .values() rows via serialize_team_list(); the output
+        shape is TeamListSerializer. Answers 304 when the client's
+        ETag/Last-Modified are still current.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        
+        not_modified = self.not_modified_response(request, queryset)
+        if not_modified is not None:
+            return not_modified
+        
+        return self._team_list_response(queryset)
     
     @extend_schema(
         summary="Get teams by country",
@@ -268,9 +349,8 @@ class TeamViewSet(viewsets.ModelViewSet):
         Returns:
             List of teams for the specified country
         """
-        teams = self.queryset.filter(country_id=country_id, is_active=True)
-        serializer = TeamListSerializer(teams, many=True)
-        return Response(serializer.data)
+        teams = self.get_queryset().filter(country_id=country_id, is_active=True)
+        return self._team_list_response(teams, paginate=False)
     
     @extend_schema(
         summary="Get active teams",
@@ -287,16 +367,8 @@ class TeamViewSet(viewsets.ModelViewSet):
         Returns:
             List of all active teams
         """
-        teams = self.queryset.filter(is_active=True)
-        
-        # Apply pagination
-        page = self.paginate_queryset(teams)
-        if page is not None:
-            serializer = TeamListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = TeamListSerializer(teams, many=True)
-        return Response(serializer.data)
+        teams = self.get_queryset().filter(is_active=True)
+        return self._team_list_response(teams)
     
     @extend_schema(
         summary="Get top teams by market value",
@@ -339,18 +411,26 @@ class TeamViewSet(viewsets.ModelViewSet):
         except ValueError:
             limit = 10
         
-        # Build query
-        teams = self.queryset.filter(is_active=True, market_value__isnull=False)
-        
-        # Apply country filter if provided
-        if country_id:
-            teams = teams.filter(country_id=country_id)
-        
-        # Order by market value (descending) and limit
-        teams = teams.order_by('-market_value')[:limit]
+        def build():
+            # Build query
+            teams = self.get_queryset().filter(is_active=True, market_value__isnull=False)
+            
+            # Apply country filter if provided
+            if country_id:
+                teams = teams.filter(country_id=country_id)
+            
+            # Order by market value (descending) and limit
+            rows = teams.order_by('-market_value').values(*TEAM_LIST_COLUMNS)[:limit]
+            return serialize_team_list(rows)
+        
+        # Cached for up to STATS_CACHE_TIMEOUT, dropped on any country/league/team write
+        data = cached_stats(
+            'teams.top_by_market_value',
+            {'limit': limit, 'country': country_id or ''},
+            build,
+        )
         
-        serializer = TeamListSerializer(teams, many=True)
-        return Response(serializer.data)
+        return Response(data)
     
     @extend_schema(
         summary="Search teams",
@@ -394,25 +474,20 @@ class TeamViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Build search query
-        teams = self.queryset.filter(
+        # Build search query (trigram-indexed), closest names first
+        teams = self.get_queryset().filter(
             Q(name__icontains=query) | 
             Q(code__icontains=query) | 
             Q(external_id__icontains=query)
-        )
+        ).annotate(
+            similarity=TrigramSimilarity('name', query)
+        ).order_by('-similarity', 'name')
         
         # Apply country filter if provided
         if country_id:
             teams = teams.filter(country_id=country_id)
         
-        # Apply pagination
-        page = self.paginate_queryset(teams)
-        if page is not None:
-            serializer = TeamListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = TeamListSerializer(teams, many=True)
-        return Response(serializer.data)
+        return self._team_list_response(teams)
     
     @extend_schema(
         summary="Fetch teams from external API",
@@ -614,14 +689,13 @@ class TeamViewSet(viewsets.ModelViewSet):
                 'failed': 0
             }
             
-            # If leagues specified, fetch for each league
+            # If leagues specified, fetch all leagues concurrently
             if 'leagues' in filters:
-                for league_code in filters['leagues']:
-                    logger.info(f"Fetching teams for league: {league_code}")
-                    league_stats = teams_service.fetch_teams_from_provider(
-                        provider=provider,
-                        competition_id=league_code
-                    )
+                logger.info(f"Fetching teams for leagues: {filters['leagues']}")
+                for league_stats in teams_service.fetch_teams_for_competitions(
+                    provider=provider,
+                    competition_ids=filters['leagues']
+                ):
                     # Aggregate statistics
                     total_stats['fetched'] += league_stats.get('fetched', 0)
                     total_stats['created'] += league_stats.get('created', 0)
@@ -942,10 +1016,10 @@ class TeamViewSet(viewsets.ModelViewSet):
                 type=int
             ),
             OpenApiParameter(
-                name='page',
-                description='Page number for pagination',
+                name='cursor',
+                description='Opaque pagination cursor from the next/previous links',
                 required=False,
-                type=int
+                type=str
             ),
             OpenApiParameter(
                 name='page_size',
@@ -958,7 +1032,6 @@ class TeamViewSet(viewsets.ModelViewSet):
             200: {
                 'type': 'object',
                 'properties': {
-                    'count': {'type': 'integer'},
                     'next': {'type': 'string', 'nullable': True},
                     'previous': {'type': 'string', 'nullable': True},
                     'results': {
@@ -982,8 +1055,7 @@ class TeamViewSet(viewsets.ModelViewSet):
                     }
                 },
                 'example': {
-                    'count': 45,
-                    'next': 'http://api.example.com/api/teams/operations/?page=2',
+                    'next': 'http://api.example.com/api/teams/operations/?cursor=cD0yMDI1LTEwLTMw',
                     'previous': None,
                     'results': [
                         {
@@ -1025,7 +1097,7 @@ class TeamViewSet(viewsets.ModelViewSet):
         - status: Filter by operation status (pending, in_progress, completed, failed)
         - provider: Filter by API provider (football_data_org, api_football)
         - days: Show operations from last N days (default: 7, max: 90)
-        - page: Page number for pagination
+        - cursor: Opaque cursor from the next/previous links
         - page_size: Items per page (max: 50)
         
         Returns:
@@ -1065,10 +1137,10 @@ class TeamViewSet(viewsets.ModelViewSet):
             except ValueError:
                 days = 7
             
-            # Build query
+            # Build query; the error and metadata payloads are not listed
             queryset = APISync.objects.filter(
                 resource_type=APISync.ResourceType.TEAMS
-            )
+            ).defer('errors', 'error_message', 'metadata')
             
             # Apply status filter
             if status_filter:
@@ -1082,8 +1154,18 @@ class TeamViewSet(viewsets.ModelViewSet):
             since_date = datetime.now() - timedelta(days=days)
             queryset = queryset.filter(started_at__gte=since_date)
             
-            # Order by most recent first
-            queryset = queryset.order_by('-started_at')
+            # Order by most recent first (OperationsPagination.ordering)
+            queryset = queryset.order_by('-started_at', '-id')
+            
+            # Record counters advance without touching a timestamp
+            not_modified = self.not_modified_response(
+                request,
+                queryset,
+                timestamp_fields=('started_at', 'completed_at'),
+                records=Sum('records_processed'),
+            )
+            if not_modified is not None:
+                return not_modified
             
             # Apply pagination
             page = self.paginate_queryset(queryset)
@@ -1123,18 +1205,29 @@ class TeamViewSet(viewsets.ModelViewSet):
                 "is_active": true
             }
         
+        A list of team objects creates teams in bulk; uniqueness for the
+        whole batch is then checked with a single query.
+        
         Returns:
-            201 Created: Newly created team
+            201 Created: Newly created team (or list of teams)
             400 Bad Request: Validation errors
         """
-        serializer = self.get_serializer(data=request.data)
+        many = isinstance(request.data, list)
+        serializer = self.get_serializer(data=request.data, many=many)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
         
         # Return detailed response
-        headers = self.get_success_headers(serializer.data)
-        team = Team.objects.select_related('country').get(id=serializer.data['id'])
-        response_serializer = TeamDetailSerializer(team)
+        if many:
+            headers = {}
+            teams = Team.objects.select_related('country').filter(
+                id__in=[team['id'] for team in serializer.data]
+            )
+            response_serializer = TeamDetailSerializer(teams, many=True)
+        else:
+            headers = self.get_success_headers(serializer.data)
+            team = Team.objects.select_related('country').get(id=serializer.data['id'])
+            response_serializer = TeamDetailSerializer(team)
         
         return Response(
             response_serializer.data,
@@ -8,14 +8,24 @@ Author: Oover Development Team
 Date: November 2025
 """
 
-from rest_framework import viewsets, filters, status
+import uuid
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.http import HttpResponse
+from rest_framework import ISO_8601, viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 
+from apps.core.views._autoprefetch import AutoPrefetchMixin
 from apps.core.models import TeamStatistics
 from apps.core.serializers.team_statistics import (
+    TEAM_STATISTICS_LIST_COLUMNS,
+    annotate_statistics,
+    serialize_team_statistics_list,
     TeamStatisticsListSerializer,
     TeamStatisticsDetailSerializer,
     TeamStatisticsCreateSerializer,
@@ -23,6 +33,97 @@ from apps.core.serializers.team_statistics import (
 )
 
 
+# Largest accepted create/update request body. Statistics payloads are a
+# few KB; anything this big is rejected before it is parsed.
+MAX_WRITE_BODY_BYTES = 1024 * 1024
+
+
+# strftime directives of REST_FRAMEWORK['DATETIME_FORMAT'] and the
+# PostgreSQL to_char() patterns producing the same text
+_TO_CHAR_PATTERNS = {
+    '%Y': 'YYYY', '%m': 'MM', '%d': 'DD',
+    '%H': 'HH24', '%M': 'MI', '%S': 'SS', '%f': 'US',
+}
+
+
+def _datetime_sql(column):
+    """
+    SQL rendering a timestamptz column like the list endpoint's DateTimeField
+    
+    Follows REST_FRAMEWORK['DATETIME_FORMAT'] in UTC (TIME_ZONE): a strftime
+    format is translated to to_char(), and ISO 8601 includes microseconds
+    only when they are non-zero, as datetime.isoformat() does.
+    """
+    value = f"({column} AT TIME ZONE 'UTC')"
+    drf_format = api_settings.DATETIME_FORMAT
+    if drf_format == ISO_8601:
+        return (
+            f"to_char({value}, 'YYYY-MM-DD\"T\"HH24:MI:SS')"
+            f" || CASE WHEN to_char({value}, 'US') = '000000' THEN ''"
+            f" ELSE to_char({value}, '.US') END || 'Z'"
+        )
+    
+    pattern = []
+    index = 0
+    while index < len(drf_format):
+        directive = drf_format[index:index + 2]
+        if directive in _TO_CHAR_PATTERNS:
+            pattern.append(_TO_CHAR_PATTERNS[directive])
+            index += 2
+        elif drf_format[index] in '%"\'':
+            raise ImproperlyConfigured(
+                f"DATETIME_FORMAT {drf_format!r} cannot be rendered by the league export"
+            )
+        else:
+            pattern.append(f'"{drf_format[index]}"')
+            index += 1
+    return f"to_char({value}, '{''.join(pattern)}')"
+
+
+def _statistics_number_sql(*path):
+    """SQL casting a statistics JSONB number to numeric; NULL for any other value"""
+    parent = "ts.statistics" + ''.join(f"->'{key}'" for key in path[:-1])
+    return (
+        f"CASE WHEN jsonb_typeof({parent}->'{path[-1]}') = 'number'"
+        f" THEN ({parent}->>'{path[-1]}')::numeric END"
+    )
+
+
+# League export built entirely by PostgreSQL: one json_agg() text value in
+# the TeamStatisticsListSerializer row shape, returned without DRF rendering.
+# Timestamps are formatted like the list endpoint's (see _datetime_sql).
+_LEAGUE_EXPORT_SQL = f"""
+    SELECT COALESCE(
+        json_agg(
+            jsonb_build_object(
+                'id', ts.id,
+                'team', ts.team_id,
+                'team_name', t.name,
+                'team_code', t.code,
+                'league', ts.league_id,
+                'league_name', l.name,
+                'season', ts.season,
+                'goals_for_total', ts.statistics->'goals'->'for'->'total',
+                'goals_against_total', ts.statistics->'goals'->'against'->'total',
+                'goal_diff',
+                    {_statistics_number_sql('goals', 'for', 'total')}
+                    - {_statistics_number_sql('goals', 'against', 'total')},
+                'clean_sheets_count', ts.statistics->'clean_sheets',
+                'created_at', {_datetime_sql('ts.created_at')},
+                'updated_at', {_datetime_sql('ts.updated_at')}
+            )
+            ORDER BY ts.season DESC, t.name
+        ),
+        '[]'
+    )::text
+    FROM team_statistics ts
+    JOIN teams t ON t.id = ts.team_id
+    JOIN leagues l ON l.id = ts.league_id
+    WHERE ts.league_id = %s
+      AND (%s::text IS NULL OR ts.season = %s)
+"""
+
+
 @extend_schema_view(
     list=extend_schema(
         summary="List all team statistics",
@@ -51,7 +152,7 @@ from apps.core.serializers.team_statistics import (
             OpenApiParameter(
                 name='ordering',
                 type=str,
-                description='Order by: season, matches_played, created_at, updated_at (prefix with - for descending)'
+                description='Order by: season, created_at, updated_at (prefix with - for descending)'
             ),
         ]
     ),
@@ -76,7 +177,7 @@ from apps.core.serializers.team_statistics import (
         description="Delete team statistics record"
     ),
 )
-class TeamStatisticsViewSet(viewsets.ModelViewSet):
+class TeamStatisticsViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """
     ViewSet for TeamStatistics model providing full CRUD operations.
     
@@ -90,6 +191,7 @@ class TeamStatisticsViewSet(viewsets.ModelViewSet):
     - GET    /api/team-statistics/by_team/      - Get statistics by team
     - GET    /api/team-statistics/by_league/    - Get statistics by league
     - GET    /api/team-statistics/by_season/    - Get statistics by season
+    - GET    /api/team-statistics/export/       - Export a league's statistics (JSON built by PostgreSQL)
     - GET    /api/team-statistics/stats/        - Get aggregate statistics
     """
     
@@ -109,14 +211,13 @@ class TeamStatisticsViewSet(viewsets.ModelViewSet):
         'team': ['exact'],
         'league': ['exact'],
         'season': ['exact', 'icontains'],
-        'matches_played': ['exact', 'gte', 'lte'],
     }
     
     # SearchFilter settings - search in team name and league name
     search_fields = ['team__name', 'league__name', 'season']
     
     # OrderingFilter settings
-    ordering_fields = ['season', 'matches_played', 'created_at', 'updated_at']
+    ordering_fields = ['season', 'created_at', 'updated_at']
     ordering = ['-season', '-updated_at']  # Default ordering: newest season first
     
     def get_serializer_class(self):
@@ -144,8 +245,16 @@ class TeamStatisticsViewSet(viewsets.ModelViewSet):
         - team: UUID (filter by specific team)
         - league: UUID (filter by specific league)
         - season: string (filter by season)
+        
+        select_related('team', 'league') is required: the list serializer
+        reads team/league names and the detail serializer nests both
+        objects, so without the join every row would cost two extra queries.
+        The derived goal/possession figures are extracted from the JSONB by
+        the database (annotate_statistics()).
         """
-        queryset = TeamStatistics.objects.select_related('team', 'league').all()
+        queryset = annotate_statistics(
+            TeamStatistics.objects.select_related('team', 'league')
+        )
         
         # Additional filtering via query params
         team_id = self.request.query_params.get('team', None)
@@ -160,7 +269,33 @@ class TeamStatisticsViewSet(viewsets.ModelViewSet):
         if season:
             queryset = queryset.filter(season=season)
         
-        return queryset
+        return self.optimize_queryset(queryset)
+    
+    def _statistics_list_response(self, queryset):
+        """
+        Render statistics in the TeamStatisticsListSerializer shape from .values() rows
+        
+        Avoids instantiating TeamStatistics objects and running DRF fields
+        per row; see serialize_team_statistics_list().
+        
+        Args:
+            queryset: Filtered team statistics queryset
+            
+        Returns:
+            Response: Paginated response, or the success/data/total envelope
+        """
+        rows = queryset.values(*TEAM_STATISTICS_LIST_COLUMNS)
+        
+        # Apply pagination
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serialize_team_statistics_list(page))
+        
+        return Response({
+            'success': True,
+            'data': serialize_team_statistics_list(rows),
+            'total': queryset.count()
+        })
     
     @extend_schema(
         summary="Get statistics by team",
@@ -244,18 +379,88 @@ class TeamStatisticsViewSet(viewsets.ModelViewSet):
         
         statistics = statistics.order_by('-season', 'team__name')
         
-        # Apply pagination
-        page = self.paginate_queryset(statistics)
-        if page is not None:
-            serializer = TeamStatisticsListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+        return self._statistics_list_response(statistics)
+    
+    @extend_schema(
+        summary="Export league statistics",
+        description=(
+            "Return every team statistics row for a league (optionally one "
+            "season) as a plain JSON array in the list shape. The JSON is "
+            "built by PostgreSQL; the response is not paginated."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='league_id',
+                type=str,
+                required=True,
+                description='League UUID'
+            ),
+            OpenApiParameter(
+                name='season',
+                type=str,
+                required=False,
+                description='Season filter (optional)'
+            ),
+        ]
+    )
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Export all team statistics of a league as a JSON array.
         
-        serializer = TeamStatisticsListSerializer(statistics, many=True)
-        return Response({
-            'success': True,
-            'data': serializer.data,
-            'total': statistics.count()
-        })
+        GET /api/team-statistics/export/?league_id={uuid}&season=2024-2025
+        
+        Fast path for large exports: rows are selected, shaped and encoded
+        by PostgreSQL (jsonb_build_object + json_agg), so no model
+        instances, serializers or JSON encoding run in Python.
+        """
+        league_id = request.query_params.get('league_id')
+        if not league_id:
+            return Response(
+                {'error': 'league_id parameter is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            league_id = uuid.UUID(league_id)
+        except ValueError:
+            return Response(
+                {'error': 'league_id must be a valid UUID'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        season = request.query_params.get('season') or None
+        
+        with connection.cursor() as cursor:
+            cursor.execute(_LEAGUE_EXPORT_SQL, [league_id, season, season])
+            payload = cursor.fetchone()[0]
+        
+        return HttpResponse(payload, content_type='application/json')
+    
+    def _oversized_body_response(self, request):
+        """
+        Reject write requests whose declared body exceeds MAX_WRITE_BODY_BYTES
+        
+        Runs before request.data is touched, so oversized payloads are
+        never parsed or validated.
+        
+        Returns:
+            Response: 413 error response, or None if the body size is acceptable
+        """
+        try:
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            length = 0
+        
+        if length > MAX_WRITE_BODY_BYTES:
+            return Response(
+                {
+                    'error': 'Request body too large',
+                    'details': f'Maximum size is {MAX_WRITE_BODY_BYTES} bytes'
+                },
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            )
+        return None
     
     @extend_schema(
         summary="Get statistics by season",
@@ -287,18 +492,7 @@ class TeamStatisticsViewSet(viewsets.ModelViewSet):
             'league__name', 'team__name'
         )
         
-        # Apply pagination
-        page = self.paginate_queryset(statistics)
-        if page is not None:
-            serializer = TeamStatisticsListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = TeamStatisticsListSerializer(statistics, many=True)
-        return Response({
-            'success': True,
-            'data': serializer.data,
-            'total': statistics.count()
-        })
+        return self._statistics_list_response(statistics)
     
     @extend_schema(
         summary="Get aggregate statistics",
@@ -340,22 +534,11 @@ class TeamStatisticsViewSet(viewsets.ModelViewSet):
         """
         List team statistics with pagination and filtering.
         
-        Override to add custom response structure.
+        Override to add custom response structure. Rendered from .values()
+        rows; the output shape is TeamStatisticsListSerializer.
         """
         queryset = self.filter_queryset(self.get_queryset())
-        
-        # Apply pagination
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({
-            'success': True,
-            'data': serializer.data,
-            'total': queryset.count()
-        })
+        return self._statistics_list_response(queryset)
     
     def retrieve(self, request, *args, **kwargs):
         """
@@ -376,6 +559,10 @@ class TeamStatisticsViewSet(viewsets.ModelViewSet):
         
         Override to add custom response structure.
         """
+        oversized = self._oversized_body_response(request)
+        if oversized is not None:
+            return oversized
+        
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
@@ -392,6 +579,10 @@ class TeamStatisticsViewSet(viewsets.ModelViewSet):
         
         Override to add custom response structure.
         """
+        oversized = self._oversized_body_response(request)
+        if oversized is not None:
+            return oversized
+        
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
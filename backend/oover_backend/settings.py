@@ -66,6 +66,8 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',  # CORS must be before CommonMiddleware
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'apps.core.middleware.CacheHeadersMiddleware',  # Cache-Control/Vary on core API responses
+    'apps.core.middleware.ReadReplicaMiddleware',  # GET/HEAD reads from the replica (if configured)
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
@@ -112,6 +114,17 @@ DATABASES = {
     }
 }
 
+# Optional read replica: core model reads of GET/HEAD requests go here
+# (see apps/core/db_router.py); writes always use 'default'
+if os.getenv('DB_REPLICA_HOST'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': os.getenv('DB_REPLICA_HOST'),
+        'PORT': os.getenv('DB_REPLICA_PORT', DATABASES['default']['PORT']),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_ROUTERS = ['apps.core.db_router.CoreReadReplicaRouter']
+
 
 # ==============================================================================
 # PASSWORD VALIDATION
@@ -177,8 +190,8 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 REST_FRAMEWORK = {
     # Renderers (how data is returned)
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',  # For dev only
+        'apps.core.renderers.ORJSONRenderer',  # JSONRenderer output, encoded by orjson
+        # BrowsableAPIRenderer is appended in development (see below)
     ],
     
     # Parsers (how data is accepted)
@@ -232,6 +245,13 @@ REST_FRAMEWORK = {
     },
 }
 
+# Browsable API only in development: it renders HTML templates and builds
+# forms for every serializer field on each request it handles
+if DEBUG:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].append(
+        'rest_framework.renderers.BrowsableAPIRenderer'
+    )
+
 
 # ==============================================================================
 # CORS CONFIGURATION (Cross-Origin Resource Sharing)
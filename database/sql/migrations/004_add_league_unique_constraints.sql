@@ -0,0 +1,49 @@
+-- =====================================================
+-- Migration: Add League Unique Constraints
+-- Description: Enforce league name/country and external_id uniqueness in the database
+-- Purpose: Replace the SELECT-before-INSERT duplicate checks in the league
+--          serializers with atomic, race-free constraints
+-- Created: 2025-11-03
+-- =====================================================
+
+-- =====================================================
+-- CONSTRAINTS
+-- =====================================================
+
+-- Unique Constraint: A league name can only be used once per country
+-- Matches the duplicate-name rule previously checked in LeagueCreateSerializer.validate()
+ALTER TABLE leagues
+ADD CONSTRAINT uq_league_name_country
+UNIQUE (name, country_id);
+
+COMMENT ON CONSTRAINT uq_league_name_country ON leagues IS
+'Ensures a league name is unique within a country. Violations are translated to a 400 on the name field by the API.';
+
+-- Unique Index: external_id must be unique when present
+-- Partial index so leagues without an external reference are unaffected
+CREATE UNIQUE INDEX IF NOT EXISTS uq_league_ext_id
+ON leagues(external_id)
+WHERE external_id IS NOT NULL;
+
+COMMENT ON INDEX uq_league_ext_id IS
+'Ensures external API identifiers are unique across leagues. Violations are translated to a 400 on the external_id field by the API.';
+
+-- =====================================================
+-- VERIFICATION
+-- =====================================================
+
+-- Should return 0 rows before applying this migration on existing data
+SELECT name, country_id, COUNT(*) AS duplicates
+FROM leagues
+GROUP BY name, country_id
+HAVING COUNT(*) > 1;
+
+SELECT external_id, COUNT(*) AS duplicates
+FROM leagues
+WHERE external_id IS NOT NULL
+GROUP BY external_id
+HAVING COUNT(*) > 1;
+
+-- =====================================================
+-- END OF MIGRATION
+-- =====================================================
@@ -0,0 +1,103 @@
+-- =====================================================
+-- Migration: Add Team Country Cache Columns
+-- Description: Denormalize country name/code onto the teams table
+-- Purpose: Let the team list endpoint render country name/code from
+--          teams alone, without joining countries for every row
+-- Created: 2025-11-04
+-- =====================================================
+
+-- =====================================================
+-- COLUMNS
+-- =====================================================
+
+ALTER TABLE teams
+ADD COLUMN IF NOT EXISTS country_name_cached VARCHAR(100),
+ADD COLUMN IF NOT EXISTS country_code_cached VARCHAR(10);
+
+COMMENT ON COLUMN teams.country_name_cached IS
+'Copy of countries.name for teams.country_id. Maintained by triggers, do not write directly.';
+
+COMMENT ON COLUMN teams.country_code_cached IS
+'Copy of countries.code for teams.country_id. Maintained by triggers, do not write directly.';
+
+-- Backfill existing rows
+UPDATE teams t
+SET country_name_cached = c.name,
+    country_code_cached = c.code
+FROM countries c
+WHERE c.id = t.country_id;
+
+-- =====================================================
+-- TRIGGER: Fill cache columns when a team's country is set/changed
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION set_team_country_cache()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.country_id IS NULL THEN
+        NEW.country_name_cached = NULL;
+        NEW.country_code_cached = NULL;
+    ELSE
+        SELECT name, code
+        INTO NEW.country_name_cached, NEW.country_code_cached
+        FROM countries
+        WHERE id = NEW.country_id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION set_team_country_cache() IS
+'Trigger function copying countries.name/code onto teams when country_id is inserted or changed';
+
+DROP TRIGGER IF EXISTS trigger_team_country_cache ON teams;
+CREATE TRIGGER trigger_team_country_cache
+    BEFORE INSERT OR UPDATE OF country_id ON teams
+    FOR EACH ROW
+    EXECUTE FUNCTION set_team_country_cache();
+
+COMMENT ON TRIGGER trigger_team_country_cache ON teams IS
+'Keeps teams.country_name_cached/country_code_cached in sync with the assigned country';
+
+-- =====================================================
+-- TRIGGER: Propagate country renames to teams
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION propagate_country_to_teams()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE teams
+    SET country_name_cached = NEW.name,
+        country_code_cached = NEW.code
+    WHERE country_id = NEW.id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION propagate_country_to_teams() IS
+'Trigger function pushing countries.name/code changes to the teams cache columns';
+
+DROP TRIGGER IF EXISTS trigger_country_propagate_to_teams ON countries;
+CREATE TRIGGER trigger_country_propagate_to_teams
+    AFTER UPDATE OF name, code ON countries
+    FOR EACH ROW
+    WHEN (OLD.name IS DISTINCT FROM NEW.name OR OLD.code IS DISTINCT FROM NEW.code)
+    EXECUTE FUNCTION propagate_country_to_teams();
+
+COMMENT ON TRIGGER trigger_country_propagate_to_teams ON countries IS
+'Keeps teams.country_name_cached/country_code_cached in sync when a country is renamed';
+
+-- =====================================================
+-- VERIFICATION
+-- =====================================================
+
+-- Should return 0 rows after the backfill
+SELECT t.id, t.country_id
+FROM teams t
+JOIN countries c ON c.id = t.country_id
+WHERE t.country_name_cached IS DISTINCT FROM c.name
+   OR t.country_code_cached IS DISTINCT FROM c.code;
+
+-- =====================================================
+-- END OF MIGRATION
+-- =====================================================
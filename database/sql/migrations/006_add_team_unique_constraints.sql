@@ -0,0 +1,71 @@
+-- =====================================================
+-- Migration: Add Team Unique Constraints
+-- Description: Enforce team name, code and external_id uniqueness in the database
+-- Purpose: Replace the SELECT-before-INSERT duplicate checks in the team
+--          serializers with atomic, race-free constraints
+-- Created: 2025-11-05
+-- =====================================================
+
+-- =====================================================
+-- PRE-CHECK
+-- =====================================================
+
+-- Each query should return 0 rows before applying this migration
+SELECT name, COUNT(*) AS duplicates
+FROM teams
+GROUP BY name
+HAVING COUNT(*) > 1;
+
+SELECT code, COUNT(*) AS duplicates
+FROM teams
+WHERE code IS NOT NULL
+GROUP BY code
+HAVING COUNT(*) > 1;
+
+SELECT external_id, COUNT(*) AS duplicates
+FROM teams
+WHERE external_id IS NOT NULL
+GROUP BY external_id
+HAVING COUNT(*) > 1;
+
+-- =====================================================
+-- CONSTRAINTS
+-- =====================================================
+
+-- Unique Constraint: Team names are unique
+-- Matches the duplicate-name rule previously checked by the team serializers
+ALTER TABLE teams
+ADD CONSTRAINT uq_team_name
+UNIQUE (name);
+
+COMMENT ON CONSTRAINT uq_team_name ON teams IS
+'Ensures team names are unique. Violations are translated to a 400 on the name field by the API.';
+
+-- Unique Index: code must be unique when present
+CREATE UNIQUE INDEX IF NOT EXISTS uq_team_code
+ON teams(code)
+WHERE code IS NOT NULL;
+
+COMMENT ON INDEX uq_team_code IS
+'Ensures team codes are unique. Violations are translated to a 400 on the code field by the API.';
+
+-- Unique Index: external_id must be unique when present
+CREATE UNIQUE INDEX IF NOT EXISTS uq_team_ext_id
+ON teams(external_id)
+WHERE external_id IS NOT NULL;
+
+COMMENT ON INDEX uq_team_ext_id IS
+'Ensures external API identifiers are unique across teams. Violations are translated to a 400 on the external_id field by the API.';
+
+-- =====================================================
+-- VERIFICATION
+-- =====================================================
+
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'teams'
+  AND indexname IN ('uq_team_name', 'uq_team_code', 'uq_team_ext_id');
+
+-- =====================================================
+-- END OF MIGRATION
+-- =====================================================
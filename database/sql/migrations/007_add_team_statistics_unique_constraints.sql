@@ -0,0 +1,72 @@
+-- =====================================================
+-- Migration: Add Team Statistics Unique Constraints
+-- Description: Enforce team statistics external_id uniqueness in the database
+--              and verify the (team, league, season) unique constraint
+-- Purpose: Replace the SELECT-before-INSERT duplicate checks in the team
+--          statistics serializers with atomic, race-free constraints
+-- Created: 2025-11-06
+-- =====================================================
+
+-- =====================================================
+-- PRE-CHECK
+-- =====================================================
+
+-- Each query should return 0 rows before applying this migration
+SELECT team_id, league_id, season, COUNT(*) AS duplicates
+FROM team_statistics
+GROUP BY team_id, league_id, season
+HAVING COUNT(*) > 1;
+
+SELECT external_id, COUNT(*) AS duplicates
+FROM team_statistics
+WHERE external_id IS NOT NULL
+GROUP BY external_id
+HAVING COUNT(*) > 1;
+
+-- =====================================================
+-- CONSTRAINTS
+-- =====================================================
+
+-- Unique Constraint: one statistics record per team per league per season
+-- Created with the table; added here only if it is missing
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_constraint
+        WHERE conname = 'unique_team_league_season_stats'
+    ) THEN
+        ALTER TABLE team_statistics
+        ADD CONSTRAINT unique_team_league_season_stats
+        UNIQUE (team_id, league_id, season);
+    END IF;
+END $$;
+
+COMMENT ON CONSTRAINT unique_team_league_season_stats ON team_statistics IS
+'Ensures one statistics record per team, league and season. Violations are translated to a 400 by the API.';
+
+-- Unique Index: external_id must be unique when present
+-- Partial index so records without an external reference are unaffected
+CREATE UNIQUE INDEX IF NOT EXISTS uq_team_stats_ext_id
+ON team_statistics(external_id)
+WHERE external_id IS NOT NULL;
+
+COMMENT ON INDEX uq_team_stats_ext_id IS
+'Ensures external API identifiers are unique across team statistics. Violations are translated to a 400 on the external_id field by the API.';
+
+-- =====================================================
+-- VERIFICATION
+-- =====================================================
+
+SELECT conname, pg_get_constraintdef(oid) AS definition
+FROM pg_constraint
+WHERE conname = 'unique_team_league_season_stats';
+
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'team_statistics'
+  AND indexname = 'uq_team_stats_ext_id';
+
+-- =====================================================
+-- END OF MIGRATION
+-- =====================================================
@@ -0,0 +1,61 @@
+-- =====================================================
+-- Migration: Add Search Trigram Indexes
+-- Description: pg_trgm GIN indexes for the league and team search columns
+-- Purpose: Serve the case-insensitive substring searches of the API
+--          (?search= on the lists, /leagues/search/, /teams/search/)
+--          from an index instead of a sequential scan
+-- Created: 2025-11-10
+-- =====================================================
+
+-- Django translates name__icontains='x' into UPPER("name"::text) LIKE UPPER('%x%'),
+-- so the indexes are built on UPPER(column) to match that expression exactly.
+-- Queries shorter than 3 characters still work but cannot use a trigram index.
+
+-- =====================================================
+-- EXTENSION
+-- =====================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- =====================================================
+-- INDEXES
+-- =====================================================
+
+-- Leagues: name and external_id are searched
+CREATE INDEX IF NOT EXISTS idx_leagues_name_trgm
+ON leagues USING gin (UPPER(name::text) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_leagues_ext_id_trgm
+ON leagues USING gin (UPPER(external_id::text) gin_trgm_ops);
+
+-- Teams: name, code and external_id are searched
+CREATE INDEX IF NOT EXISTS idx_teams_name_trgm
+ON teams USING gin (UPPER(name::text) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_teams_code_trgm
+ON teams USING gin (UPPER(code::text) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_teams_ext_id_trgm
+ON teams USING gin (UPPER(external_id::text) gin_trgm_ops);
+
+COMMENT ON INDEX idx_leagues_name_trgm IS
+'Trigram index for case-insensitive substring search on league names (name__icontains).';
+
+COMMENT ON INDEX idx_teams_name_trgm IS
+'Trigram index for case-insensitive substring search on team names (name__icontains).';
+
+-- =====================================================
+-- VERIFICATION
+-- =====================================================
+
+-- Should show a Bitmap Index Scan on the trigram indexes, not a Seq Scan
+EXPLAIN
+SELECT id, name
+FROM teams
+WHERE UPPER(name::text) LIKE UPPER('%united%')
+   OR UPPER(code::text) LIKE UPPER('%united%')
+   OR UPPER(external_id::text) LIKE UPPER('%united%');
+
+-- =====================================================
+-- END OF MIGRATION
+-- =====================================================
@@ -0,0 +1,53 @@
+-- =====================================================
+-- Migration: Add Team Market Value Indexes
+-- Description: Ordered indexes for the top-teams-by-market-value query
+-- Purpose: Serve /api/teams/top-by-market-value/ (with and without
+--          ?country=) with an index scan that stops after LIMIT rows
+--          instead of scanning and sorting every matching team
+-- Created: 2025-11-12
+-- =====================================================
+
+-- The endpoint runs:
+--   WHERE is_active AND market_value IS NOT NULL [AND country_id = $1]
+--   ORDER BY market_value DESC LIMIT $2
+-- Both indexes are partial on exactly that predicate, so they only hold
+-- the rows the endpoint can return. The listed columns are not INCLUDEd:
+-- the response needs a dozen of them (logo is unbounded text), and with
+-- at most 50 rows read the heap fetches are negligible.
+
+-- =====================================================
+-- INDEXES
+-- =====================================================
+
+-- Top teams of one country
+CREATE INDEX IF NOT EXISTS idx_teams_country_market_value
+ON teams (country_id, market_value DESC)
+WHERE is_active AND market_value IS NOT NULL;
+
+-- Top teams overall
+CREATE INDEX IF NOT EXISTS idx_teams_market_value
+ON teams (market_value DESC)
+WHERE is_active AND market_value IS NOT NULL;
+
+COMMENT ON INDEX idx_teams_country_market_value IS
+'Active valued teams of a country by market value (top-by-market-value?country=).';
+
+COMMENT ON INDEX idx_teams_market_value IS
+'Active valued teams by market value (top-by-market-value).';
+
+-- =====================================================
+-- VERIFICATION
+-- =====================================================
+
+-- Should show Limit -> Index Scan using idx_teams_country_market_value, no Sort
+EXPLAIN
+SELECT id, name, market_value
+FROM teams
+WHERE is_active AND market_value IS NOT NULL
+  AND country_id = (SELECT id FROM countries WHERE code = 'GB')
+ORDER BY market_value DESC
+LIMIT 10;
+
+-- =====================================================
+-- END OF MIGRATION
+-- =====================================================
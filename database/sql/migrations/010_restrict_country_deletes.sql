@@ -0,0 +1,64 @@
+-- =====================================================
+-- Migration: Restrict Country Deletes
+-- Description: Refuse to delete a country that leagues or teams still reference
+-- Purpose: fk_leagues_country_id and fk_teams_country_id were ON DELETE
+--          SET NULL, so deleting a country silently detached its leagues
+--          and teams. With RESTRICT the DELETE fails instead and the API
+--          answers DELETE /api/countries/{id}/ with 409 Conflict.
+-- Created: 2025-11-13
+-- =====================================================
+
+-- The Django models declare on_delete=DO_NOTHING for both foreign keys:
+-- the single DELETE is sent to the database, which enforces these rules.
+
+-- =====================================================
+-- FOREIGN KEYS
+-- =====================================================
+
+BEGIN;
+
+ALTER TABLE public.leagues
+DROP CONSTRAINT IF EXISTS fk_leagues_country_id;
+
+ALTER TABLE public.leagues
+ADD CONSTRAINT fk_leagues_country_id
+FOREIGN KEY (country_id) REFERENCES public.countries(id)
+ON DELETE RESTRICT
+ON UPDATE CASCADE;
+
+ALTER TABLE public.teams
+DROP CONSTRAINT IF EXISTS fk_teams_country_id;
+
+ALTER TABLE public.teams
+ADD CONSTRAINT fk_teams_country_id
+FOREIGN KEY (country_id) REFERENCES public.countries(id)
+ON DELETE RESTRICT
+ON UPDATE CASCADE;
+
+COMMIT;
+
+-- =====================================================
+-- VERIFICATION
+-- =====================================================
+
+-- Both rows should show confdeltype = 'r' (RESTRICT)
+SELECT conname, confdeltype, confupdtype
+FROM pg_constraint
+WHERE conname IN ('fk_leagues_country_id', 'fk_teams_country_id');
+
+-- =====================================================
+-- ROLLBACK
+-- =====================================================
+
+-- ALTER TABLE public.leagues DROP CONSTRAINT fk_leagues_country_id;
+-- ALTER TABLE public.leagues ADD CONSTRAINT fk_leagues_country_id
+--     FOREIGN KEY (country_id) REFERENCES public.countries(id)
+--     ON DELETE SET NULL ON UPDATE CASCADE;
+-- ALTER TABLE public.teams DROP CONSTRAINT fk_teams_country_id;
+-- ALTER TABLE public.teams ADD CONSTRAINT fk_teams_country_id
+--     FOREIGN KEY (country_id) REFERENCES public.countries(id)
+--     ON DELETE SET NULL ON UPDATE CASCADE;
+
+-- =====================================================
+-- END OF MIGRATION
+-- =====================================================